@@ -8,6 +8,9 @@ Provides commands for:
 - config: Manage configuration
 """
 
+import socket
+from typing import Any
+
 import typer
 from rich.console import Console
 
@@ -18,6 +21,32 @@ app = typer.Typer(
 )
 console = Console()
 
+# Kernel TCP keepalive for accepted connections (seconds / probe count)
+TCP_KEEPALIVE_IDLE = 20
+TCP_KEEPALIVE_INTERVAL = 10
+TCP_KEEPALIVE_COUNT = 3
+
+
+def _enable_tcp_keepalive(sock: socket.socket) -> None:
+    """
+    Enable TCP keepalive on a listening socket.
+
+    Linux copies these options to every accepted connection. Tuning knobs
+    are only set where the platform exposes them.
+
+    Args:
+        sock: Bound listening socket
+    """
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for name, value in (
+        ("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", TCP_KEEPALIVE_COUNT),
+    ):
+        option = getattr(socket, name, None)
+        if option is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, option, value)
+
 
 @app.command()
 def serve(
@@ -27,11 +56,14 @@ def serve(
     log_level: str = typer.Option("INFO", "--log-level", "-l", help="Log level"),
 ) -> None:
     """Start the a2c proxy server."""
+    import importlib.util
     import logging
     import os
 
     import uvicorn
 
+    from a2c.server.config import ServerSettings
+
     # Set environment variables for settings
     os.environ["A2C_HOST"] = host
     os.environ["A2C_PORT"] = str(port)
@@ -43,18 +75,38 @@ def serve(
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    # uvloop ships with uvicorn[standard] on POSIX; Windows falls back to asyncio
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
     console.print(f"[bold green]Starting a2c server on {host}:{port}[/bold green]")
     console.print(f"[dim]Log level: {log_level}[/dim]")
     console.print(f"[dim]Reload: {reload}[/dim]")
+    console.print(f"[dim]Event loop: {loop}[/dim]")
     console.print()
 
-    uvicorn.run(
-        "a2c.server.app:app",
-        host=host,
-        port=port,
-        reload=reload,
-        log_level=log_level.lower(),
-    )
+    # Liveness of idle WebSockets is handled by protocol pings, not app messages
+    server_settings = ServerSettings()
+
+    options: dict[str, Any] = {
+        "host": host,
+        "port": port,
+        "log_level": log_level.lower(),
+        "loop": loop,
+        "ws_ping_interval": server_settings.ws_ping_interval,
+        "ws_ping_timeout": server_settings.ws_ping_timeout,
+    }
+
+    if reload:
+        # The reloader binds its own socket in the supervisor process
+        uvicorn.run("a2c.server.app:app", reload=True, **options)
+        return
+
+    # Bind the listening socket ourselves so accepted connections inherit
+    # kernel keepalive and dead peers are detected without app heartbeats
+    config = uvicorn.Config("a2c.server.app:app", **options)
+    sock = config.bind_socket()
+    _enable_tcp_keepalive(sock)
+    uvicorn.Server(config).run(sockets=[sock])
 
 
 @app.command()
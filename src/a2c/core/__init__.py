@@ -19,6 +19,7 @@ from a2c.core.converter import (
     reorganize_tool_messages,
 )
 from a2c.core.helpers import (
+    COMPACT_JSON_ENCODER,
     DEBUG_TRUE,
     anthropic_debug_enabled,
     remove_nulls_for_tool_input,
@@ -42,6 +43,7 @@ __all__ = [
     # Streaming
     "antigravity_sse_to_anthropic_sse",
     # Helpers
+    "COMPACT_JSON_ENCODER",
     "DEBUG_TRUE",
     "anthropic_debug_enabled",
     "remove_nulls_for_tool_input",
@@ -6,12 +6,17 @@ These utilities are used across multiple modules:
 - streaming.py
 """
 
+import json
 import os
 from typing import Any
 
 # Debug flag values that are considered "true"
 DEBUG_TRUE = {"1", "true", "yes", "on"}
 
+# Shared compact UTF-8 encoder for hot paths; json.dumps builds a new
+# JSONEncoder on every call that passes non-default options
+COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
 
 def remove_nulls_for_tool_input(value: Any) -> Any:
     """
@@ -8,8 +8,57 @@ doesn't provide actual counts.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
+# Heuristic divisor from characters to tokens
+_CHARS_PER_TOKEN = 4
+
+# Fixed token cost charged per image
+_IMAGE_TOKENS = 300
+
+# JSON scalar types that never contribute characters; skipped before the
+# comparatively slow ABC checks
+_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+
+
+def _text_only_chars(payload: Any) -> int | None:
+    """
+    Count characters of a payload whose messages all have plain string content.
+
+    This is the common shape for simple chat requests and needs no generic
+    walk. Returns None as soon as anything else is seen (content blocks,
+    tools, images, non-dict messages) so the caller can fall back.
+
+    Args:
+        payload: Anthropic Messages API request payload
+
+    Returns:
+        Total characters, or None if the payload has another shape
+    """
+    if type(payload) is not dict or payload.get("type") == "image" or "inlineData" in payload:
+        return None
+
+    chars = 0
+    for key, value in payload.items():
+        value_type = type(value)
+        if value_type is str:
+            chars += len(value)
+        elif value_type is list and key == "messages":
+            for message in value:
+                if type(message) is not dict:
+                    return None
+                if message.get("type") == "image" or "inlineData" in message:
+                    return None
+                for field_value in message.values():
+                    if type(field_value) is str:
+                        chars += len(field_value)
+                    elif type(field_value) not in _SCALAR_TYPES:
+                        return None
+        elif value_type not in _SCALAR_TYPES:
+            return None
+    return chars
+
 
 def estimate_input_tokens(payload: dict[str, Any]) -> int:
     """
@@ -21,24 +70,43 @@ def estimate_input_tokens(payload: dict[str, Any]) -> int:
     Returns:
         Estimated input token count (minimum 1)
     """
+    text_chars = _text_only_chars(payload)
+    if text_chars is not None:
+        return max(1, text_chars // _CHARS_PER_TOKEN)
+
+    # Running sum in a local; collecting leaves for a final sum(map(len, ...))
+    # costs an extra append per string and measured slower
     total_chars = 0
     image_count = 0
 
-    def count_str(obj: Any) -> None:
-        nonlocal total_chars, image_count
-        if isinstance(obj, str):
+    # Walk with an explicit stack; deeply nested payloads cannot hit the
+    # recursion limit and no call frame is created per node
+    stack: list[Any] = [payload]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        obj = pop()
+        # Exact type checks first: JSON payloads only contain builtin types,
+        # so the slower isinstance/ABC fallback is rarely reached
+        obj_type = type(obj)
+        if obj_type is str:
             total_chars += len(obj)
-        elif isinstance(obj, dict):
+        elif obj_type is dict:
             # Detect images
             if obj.get("type") == "image" or "inlineData" in obj:
                 image_count += 1
-            for v in obj.values():
-                count_str(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                count_str(item)
-
-    count_str(payload)
+            extend(obj.values())
+        elif obj_type is list or obj_type is tuple:
+            extend(obj)
+        elif obj_type in _SCALAR_TYPES:
+            continue
+        elif isinstance(obj, str):
+            total_chars += len(obj)
+        elif isinstance(obj, Mapping):
+            # Re-queue other mappings as plain dicts for the image check
+            stack.append(dict(obj))
+        elif isinstance(obj, (list, tuple)):
+            extend(obj)
 
-    # Rough estimate: chars/4 + 300 tokens per image
-    return max(1, total_chars // 4 + image_count * 300)
+    # Characters are summed across the payload and divided once
+    return max(1, total_chars // _CHARS_PER_TOKEN + image_count * _IMAGE_TOKENS)
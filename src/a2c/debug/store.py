@@ -6,6 +6,7 @@ Provides CRUD operations for debug data in PostgreSQL.
 
 import logging
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -254,31 +255,33 @@ class DebugStore:
                 "has_more": offset + len(requests) < total,
             }
 
-    async def get_sse_events(self, request_id: str) -> list[dict[str, Any]]:
+    async def iter_sse_events(
+        self, request_id: str
+    ) -> AsyncIterator[tuple[bool, dict[str, Any] | None]]:
         """
-        Get SSE events for a streaming request.
+        Stream SSE events for a request without loading them all into memory.
+
+        Rows come from a server-side cursor over a single query joining the
+        request to its events. Nothing is yielded if the request does not
+        exist; a request without events yields a single (is_streaming, None).
 
         Args:
             request_id: Request identifier
 
-        Returns:
-            List of SSE events in order
+        Yields:
+            Tuples of (is_streaming, event dict or None), events in order
         """
         async with get_session() as session:
-            # Get database ID
-            stmt = select(Request.id).where(Request.request_id == request_id)
-            result = await session.execute(stmt)
-            db_id = result.scalar_one_or_none()
-
-            if not db_id:
-                return []
-
-            # Get events
-            stmt = select(SSEEvent).where(SSEEvent.request_id == db_id).order_by(SSEEvent.sequence)
-            result = await session.execute(stmt)
-            events = result.scalars().all()
-
-            return [e.to_dict() for e in events]
+            stmt = (
+                select(Request.is_streaming, SSEEvent)
+                .select_from(Request)
+                .outerjoin(SSEEvent, SSEEvent.request_id == Request.id)
+                .where(Request.request_id == request_id)
+                .order_by(SSEEvent.sequence)
+            )
+            result = await session.stream(stmt)
+            async for is_streaming, event in result:
+                yield is_streaming, event.to_dict() if event is not None else None
 
     async def delete_old_requests(self, days: int = 7) -> int:
         """
@@ -360,7 +363,7 @@ class DebugStore:
                 "total_requests": total,
                 "total_errors": errors,
                 "error_rate": errors / total if total > 0 else 0,
-                "avg_latency_ms": round(avg_latency, 2) if avg_latency else None,
+                "avg_latency_ms": round(float(avg_latency), 2) if avg_latency else None,
                 "total_input_tokens": input_tokens,
                 "total_output_tokens": output_tokens,
                 "by_provider": by_provider,
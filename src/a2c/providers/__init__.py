@@ -6,11 +6,17 @@ This module contains provider implementations for various AI backends:
 - Antigravity: Google Antigravity (Claude via Google Cloud)
 - OpenAI: OpenAI-compatible endpoints
 - Gemini: Direct Google Gemini API (coming soon)
+
+Note: provider classes are imported lazily, so modules that only need the
+base types (router, failover, tests) do not load httpx and every backend.
 """
 
-from a2c.providers.anthropic import AnthropicProvider
-from a2c.providers.antigravity import AntigravityProvider
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from a2c.providers.base import (
+    API_FORMAT_VALUES,
+    STATUS_VALUES,
     ApiFormat,
     BaseProvider,
     ProviderHealth,
@@ -19,14 +25,39 @@ from a2c.providers.base import (
     ProviderResponse,
     ProviderStatus,
 )
-from a2c.providers.gemini import GeminiProvider
-from a2c.providers.openai import OpenAIProvider
 from a2c.providers.registry import (
     ProviderRegistry,
+    RegistryCounts,
     get_registry,
     reset_registry,
 )
 
+if TYPE_CHECKING:
+    from a2c.providers.anthropic import AnthropicProvider
+    from a2c.providers.antigravity import AntigravityProvider
+    from a2c.providers.gemini import GeminiProvider
+    from a2c.providers.openai import OpenAIProvider
+
+# Provider class name -> defining module, resolved on first access
+_LAZY_PROVIDERS = {
+    "AnthropicProvider": "a2c.providers.anthropic",
+    "AntigravityProvider": "a2c.providers.antigravity",
+    "GeminiProvider": "a2c.providers.gemini",
+    "OpenAIProvider": "a2c.providers.openai",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import for provider classes."""
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # Base classes
     "BaseProvider",
@@ -36,8 +67,11 @@ __all__ = [
     "ProviderResponse",
     "ProviderStatus",
     "ApiFormat",
+    "STATUS_VALUES",
+    "API_FORMAT_VALUES",
     # Registry
     "ProviderRegistry",
+    "RegistryCounts",
     "get_registry",
     "reset_registry",
     # Providers
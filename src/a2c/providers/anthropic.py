@@ -57,6 +57,14 @@ class AnthropicProvider(BaseProvider):
         self._api_key = api_key or settings.providers.anthropic_api_key
         self._base_url = (base_url or settings.providers.anthropic_base_url).rstrip("/")
 
+        # Header templates depend only on the API key, which is fixed here
+        self._headers = {
+            "x-api-key": self._api_key or "",
+            "anthropic-version": ANTHROPIC_VERSION,
+            "content-type": "application/json",
+        }
+        self._stream_headers = {**self._headers, "accept": "text/event-stream"}
+
         # HTTP client with connection pooling
         self._client: httpx.AsyncClient | None = None
 
@@ -92,14 +100,7 @@ class AnthropicProvider(BaseProvider):
 
     def _build_headers(self, stream: bool = False) -> dict[str, str]:
         """Build request headers."""
-        headers = {
-            "x-api-key": self._api_key or "",
-            "anthropic-version": ANTHROPIC_VERSION,
-            "content-type": "application/json",
-        }
-        if stream:
-            headers["accept"] = "text/event-stream"
-        return headers
+        return (self._stream_headers if stream else self._headers).copy()
 
     async def send_request(
         self,
@@ -160,6 +161,7 @@ class AnthropicProvider(BaseProvider):
                     status_code=response.status_code,
                     headers=dict(response.headers),
                     body=body,
+                    raw_body=response.content,
                     latency_ms=latency_ms,
                     input_tokens=body.get("usage", {}).get("input_tokens", 0),
                     output_tokens=body.get("usage", {}).get("output_tokens", 0),
@@ -7,8 +7,8 @@ Anthropic and Gemini formats using the core converter module.
 
 import json
 import logging
+import os
 import time
-import uuid
 from typing import Any, AsyncIterator
 
 import httpx
@@ -267,12 +267,9 @@ class AntigravityProvider(BaseProvider):
             model = components["model"]
             url = self._build_url(model, stream=True)
 
-            # Estimate input tokens for response
-            input_tokens = estimate_input_tokens(
-                messages=request.get("messages", []),
-                system=request.get("system"),
-                tools=request.get("tools"),
-            )
+            # Estimate input tokens for response; the estimator walks the whole
+            # request payload once
+            input_tokens = estimate_input_tokens(request)
 
             # Determine thinking mode
             thinking = request.get("thinking", {})
@@ -303,7 +300,7 @@ class AntigravityProvider(BaseProvider):
                 antigravity_body["tools"] = components["tools"]
 
             # Generate message ID
-            message_id = f"msg_{uuid.uuid4().hex[:24]}"
+            message_id = "msg_" + os.urandom(12).hex()
 
             async with client.stream(
                 "POST",
@@ -4,11 +4,14 @@ Base provider interface and types.
 All providers must implement the BaseProvider abstract class.
 """
 
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any, AsyncIterator
+from types import MappingProxyType
+from typing import Any
 
 
 class ProviderStatus(str, Enum):
@@ -28,7 +31,13 @@ class ApiFormat(str, Enum):
     GEMINI = "gemini"
 
 
-@dataclass
+# Enum member -> wire string for serialization; a dict lookup is several times
+# cheaper than going through the Enum.value descriptor
+STATUS_VALUES = MappingProxyType({member: member.value for member in ProviderStatus})
+API_FORMAT_VALUES = MappingProxyType({member: member.value for member in ApiFormat})
+
+
+@dataclass(slots=True)
 class ProviderHealth:
     """Provider health check result."""
 
@@ -51,13 +60,15 @@ class ProviderRequest:
     timeout: float = 120.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderResponse:
     """Response from provider."""
 
     status_code: int
     headers: dict[str, str]
     body: dict[str, Any] | None = None
+    # Upstream JSON bytes, when the body is already in Anthropic format
+    raw_body: bytes | None = None
     stream: AsyncIterator[bytes] | None = None
     error: str | None = None
     latency_ms: float = 0.0
@@ -65,7 +76,7 @@ class ProviderResponse:
     output_tokens: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderInfo:
     """Provider metadata."""
 
@@ -101,8 +112,43 @@ class BaseProvider(ABC):
         """
         self.name = name
         self.config = config or {}
+        # Set by the registry that most recently registered this provider
+        self._health_listener: weakref.WeakMethod | None = None
+        # to_dict fragments: metadata built once, health rebuilt per health object
+        self._static_dict: dict[str, Any] | None = None
+        self._capabilities_dict: dict[str, Any] | None = None
+        self._health_dict: tuple[ProviderHealth, dict[str, Any]] | None = None
         self._health = ProviderHealth(status=ProviderStatus.UNKNOWN)
 
+    @property
+    def _health(self) -> ProviderHealth:
+        """Last health result, as stored by health checks."""
+        return self._health_value
+
+    @_health.setter
+    def _health(self, health: ProviderHealth) -> None:
+        """Store a health result and notify the owning registry, if any."""
+        self._health_value = health
+        listener = self._health_listener() if self._health_listener else None
+        if listener is not None:
+            listener(self)
+
+    def set_health_listener(self, listener: Callable[["BaseProvider"], None]) -> None:
+        """
+        Notify a listener whenever a new health result is stored.
+
+        Only a weak reference is kept, so a listener's owner is not kept alive
+        by the providers it tracks. Replaces any previous listener.
+
+        Args:
+            listener: Bound method called with this provider
+        """
+        self._health_listener = weakref.WeakMethod(listener)
+
+    def clear_health_listener(self) -> None:
+        """Stop notifying the current health listener, if any."""
+        self._health_listener = None
+
     @property
     @abstractmethod
     def info(self) -> ProviderInfo:
@@ -140,6 +186,11 @@ class BaseProvider(ABC):
         """
         Stream a response from the provider.
 
+        Implementations must be native async generators (``async def`` with
+        ``yield``) producing ``bytes``. The registry rejects anything else, since
+        Starlette would otherwise iterate the stream in a threadpool and encode
+        each chunk.
+
         Args:
             request: Anthropic-format request body
             timeout: Request timeout in seconds
@@ -174,23 +225,75 @@ class BaseProvider(ABC):
         """Check if provider is properly configured."""
         return True  # Override in subclasses
 
+    def metadata_dict(self) -> dict[str, Any]:
+        """
+        Get provider metadata and configuration as a dictionary.
+
+        Built once, as metadata is fixed after construction. Treat as read-only.
+        """
+        static = self._static_dict
+        if static is None:
+            info = self.info
+            static = self._static_dict = {
+                "name": self.name,
+                "display_name": info.display_name,
+                "api_format": API_FORMAT_VALUES[info.api_format],
+                "supports_streaming": info.supports_streaming,
+                "supports_thinking": info.supports_thinking,
+                "supports_tools": info.supports_tools,
+                "supports_vision": info.supports_vision,
+                "max_context_tokens": info.max_context_tokens,
+                "is_configured": self.is_configured,
+            }
+        return static
+
+    def capabilities_dict(self) -> dict[str, Any]:
+        """
+        Get provider capabilities as a dictionary.
+
+        Built once, as metadata is fixed after construction. Treat as read-only.
+        """
+        capabilities = self._capabilities_dict
+        if capabilities is None:
+            info = self.info
+            capabilities = self._capabilities_dict = {
+                "streaming": info.supports_streaming,
+                "thinking": info.supports_thinking,
+                "tools": info.supports_tools,
+                "vision": info.supports_vision,
+                "max_context": info.max_context_tokens,
+            }
+        return capabilities
+
+    def health_dict(self) -> dict[str, Any]:
+        """
+        Get the last health result as a dictionary.
+
+        Reused until a new health result is stored. Treat as read-only.
+        """
+        health = self._health
+        cached = self._health_dict
+        if cached is None or cached[0] is not health:
+            cached = self._health_dict = (
+                health,
+                {
+                    "status": STATUS_VALUES[health.status],
+                    "latency_ms": health.latency_ms,
+                    "last_check": health.last_check.isoformat(),
+                    "error": health.error,
+                },
+            )
+        return cached[1]
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert provider info to dictionary."""
+        """
+        Convert provider info to dictionary.
+
+        Built from the metadata and health fragments; treat the nested dicts
+        as read-only.
+        """
         return {
-            "name": self.name,
-            "display_name": self.info.display_name,
-            "api_format": self.info.api_format.value,
-            "supports_streaming": self.info.supports_streaming,
-            "supports_thinking": self.info.supports_thinking,
-            "supports_tools": self.info.supports_tools,
-            "supports_vision": self.info.supports_vision,
-            "max_context_tokens": self.info.max_context_tokens,
-            "is_configured": self.is_configured,
+            **self.metadata_dict(),
             "is_healthy": self.is_healthy,
-            "health": {
-                "status": self._health.status.value,
-                "latency_ms": self._health.latency_ms,
-                "last_check": self._health.last_check.isoformat(),
-                "error": self._health.error,
-            },
+            "health": self.health_dict(),
         }
@@ -5,14 +5,17 @@ Converts Anthropic requests to Gemini format and vice versa.
 Supports the Gemini API with its 1M+ context window.
 """
 
+import importlib.util
 import json
 import logging
+import os
 import time
-import uuid
+from types import MappingProxyType
 from typing import Any, AsyncIterator
 
 import httpx
 
+from a2c.core.helpers import COMPACT_JSON_ENCODER
 from a2c.providers.base import (
     ApiFormat,
     BaseProvider,
@@ -25,19 +28,38 @@ from a2c.server.config import get_settings
 
 logger = logging.getLogger(__name__)
 
-# Default model mapping from Claude to Gemini
-DEFAULT_MODEL_MAPPING = {
-    # Claude 4.5 models -> Gemini 2.5 Pro (best quality)
-    "claude-opus-4-5": "gemini-2.5-pro",
-    "claude-opus-4-5-20251101": "gemini-2.5-pro",
-    "claude-sonnet-4-5": "gemini-2.5-flash",
-    "claude-sonnet-4-5-20250929": "gemini-2.5-flash",
-    # Claude 3.5 models
-    "claude-3-5-sonnet-20241022": "gemini-2.5-flash",
-    # Claude 3 Haiku -> Gemini Flash Lite (fast/cheap)
-    "claude-3-haiku-20240307": "gemini-2.5-flash-lite",
-    "claude-haiku-4-5": "gemini-2.5-flash-lite",
-}
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it the client
+# stays on pooled HTTP/1.1 connections
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Default model mapping from Claude to Gemini; read-only and shared, providers
+# merge their overrides into a private copy
+DEFAULT_MODEL_MAPPING = MappingProxyType(
+    {
+        # Claude 4.5 models -> Gemini 2.5 Pro (best quality)
+        "claude-opus-4-5": "gemini-2.5-pro",
+        "claude-opus-4-5-20251101": "gemini-2.5-pro",
+        "claude-sonnet-4-5": "gemini-2.5-flash",
+        "claude-sonnet-4-5-20250929": "gemini-2.5-flash",
+        # Claude 3.5 models
+        "claude-3-5-sonnet-20241022": "gemini-2.5-flash",
+        # Claude 3 Haiku -> Gemini Flash Lite (fast/cheap)
+        "claude-3-haiku-20240307": "gemini-2.5-flash-lite",
+        "claude-haiku-4-5": "gemini-2.5-flash-lite",
+    }
+)
+
+# Gemini finishReason -> Anthropic stop_reason for both the buffered and the
+# streaming path; anything unlisted ends the turn
+_STOP_REASON_MAP = MappingProxyType(
+    {
+        "STOP": "end_turn",
+        "MAX_TOKENS": "max_tokens",
+        "SAFETY": "end_turn",
+        "RECITATION": "end_turn",
+        "OTHER": "end_turn",
+    }
+)
 
 
 class GeminiProvider(BaseProvider):
@@ -101,10 +123,19 @@ class GeminiProvider(BaseProvider):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None or self._client.is_closed:
+            # Every request goes to the same host, so keep the whole pool
+            # alive between bursts and multiplex over HTTP/2 when available.
+            # Reused connections skip DNS and TLS setup entirely; only new
+            # connections resolve the host, through the system resolver.
             self._client = httpx.AsyncClient(
                 base_url=self._base_url,
+                http2=_HTTP2_AVAILABLE,
                 timeout=httpx.Timeout(120.0, connect=10.0),
-                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=30.0,
+                ),
             )
         return self._client
 
@@ -119,9 +150,11 @@ class GeminiProvider(BaseProvider):
 
     def _map_model(self, model: str) -> str:
         """Map Claude model name to Gemini model."""
-        # Check custom mapping first
-        if model in self._model_mapping:
-            return self._model_mapping[model]
+        # Custom mapping is merged with the defaults once in __init__, so a
+        # single probe covers both
+        mapped = self._model_mapping.get(model)
+        if mapped is not None:
+            return mapped
 
         # Pass through if already a Gemini model
         if model.startswith("gemini-"):
@@ -149,10 +182,11 @@ class GeminiProvider(BaseProvider):
                 gemini_request["system_instruction"] = {"parts": [{"text": system}]}
             elif isinstance(system, list):
                 # Extract text from content blocks
-                text_parts = []
-                for block in system:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
+                text_parts = [
+                    block.get("text", "")
+                    for block in system
+                    if isinstance(block, dict) and block.get("type") == "text"
+                ]
                 if text_parts:
                     gemini_request["system_instruction"] = {
                         "parts": [{"text": "\n".join(text_parts)}]
@@ -211,51 +245,52 @@ class GeminiProvider(BaseProvider):
                 if not isinstance(block, dict):
                     continue
 
-                block_type = block.get("type")
-
-                if block_type == "text":
-                    parts.append({"text": block.get("text", "")})
+                # Literal match arms compile to plain comparisons, avoiding a
+                # helper call per block; unknown types are skipped
+                match block.get("type"):
+                    case "text":
+                        parts.append({"text": block.get("text", "")})
+
+                    case "image":
+                        source = block.get("source", {})
+                        if source.get("type") == "base64":
+                            parts.append(
+                                {
+                                    "inline_data": {
+                                        "mime_type": source.get("media_type", "image/png"),
+                                        "data": source.get("data", ""),
+                                    }
+                                }
+                            )
 
-                elif block_type == "image":
-                    source = block.get("source", {})
-                    if source.get("type") == "base64":
+                    case "tool_use":
+                        # Convert to functionCall
                         parts.append(
                             {
-                                "inline_data": {
-                                    "mime_type": source.get("media_type", "image/png"),
-                                    "data": source.get("data", ""),
+                                "functionCall": {
+                                    "name": block.get("name", ""),
+                                    "args": block.get("input", {}),
                                 }
                             }
                         )
 
-                elif block_type == "tool_use":
-                    # Convert to functionCall
-                    parts.append(
-                        {
-                            "functionCall": {
-                                "name": block.get("name", ""),
-                                "args": block.get("input", {}),
-                            }
-                        }
-                    )
-
-                elif block_type == "tool_result":
-                    # Convert to functionResponse - this changes the role to "function"
-                    return {
-                        "role": "function",
-                        "parts": [
-                            {
-                                "functionResponse": {
-                                    "name": block.get("tool_use_id", ""),
-                                    "response": {
-                                        "content": self._extract_content_text(
-                                            block.get("content", "")
-                                        )
-                                    },
+                    case "tool_result":
+                        # Convert to functionResponse - this changes the role to "function"
+                        return {
+                            "role": "function",
+                            "parts": [
+                                {
+                                    "functionResponse": {
+                                        "name": block.get("tool_use_id", ""),
+                                        "response": {
+                                            "content": self._extract_content_text(
+                                                block.get("content", "")
+                                            )
+                                        },
+                                    }
                                 }
-                            }
-                        ],
-                    }
+                            ],
+                        }
 
             if parts:
                 return {"role": gemini_role, "parts": parts}
@@ -267,11 +302,13 @@ class GeminiProvider(BaseProvider):
         if isinstance(content, str):
             return content
         if isinstance(content, list):
-            parts = []
-            for block in content:
-                if isinstance(block, dict) and block.get("type") == "text":
-                    parts.append(block.get("text", ""))
-            return "\n".join(parts)
+            return "\n".join(
+                [
+                    block.get("text", "")
+                    for block in content
+                    if isinstance(block, dict) and block.get("type") == "text"
+                ]
+            )
         return str(content)
 
     def _convert_tools(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -303,7 +340,7 @@ class GeminiProvider(BaseProvider):
         candidates = gemini_response.get("candidates", [])
         if not candidates:
             return {
-                "id": f"msg_{uuid.uuid4().hex[:24]}",
+                "id": "msg_" + os.urandom(12).hex(),
                 "type": "message",
                 "role": "assistant",
                 "model": original_model,
@@ -314,37 +351,26 @@ class GeminiProvider(BaseProvider):
             }
 
         candidate = candidates[0]
-        content_data = candidate.get("content", {})
-        parts = content_data.get("parts", [])
-        finish_reason = candidate.get("finishReason", "STOP")
-
-        # Convert finish_reason
-        stop_reason_map = {
-            "STOP": "end_turn",
-            "MAX_TOKENS": "max_tokens",
-            "SAFETY": "end_turn",
-            "RECITATION": "end_turn",
-            "OTHER": "end_turn",
-        }
+        parts = candidate.get("content", {}).get("parts", ())
 
         # Check if there are function calls
-        has_function_call = any("functionCall" in p for p in parts)
-        if has_function_call:
+        if any("functionCall" in p for p in parts):
             stop_reason = "tool_use"
         else:
-            stop_reason = stop_reason_map.get(finish_reason, "end_turn")
+            stop_reason = _STOP_REASON_MAP.get(candidate.get("finishReason", "STOP"), "end_turn")
 
         # Build content
         content = []
+        append = content.append
         for part in parts:
             if "text" in part:
-                content.append({"type": "text", "text": part["text"]})
+                append({"type": "text", "text": part["text"]})
             elif "functionCall" in part:
                 fc = part["functionCall"]
-                content.append(
+                append(
                     {
                         "type": "tool_use",
-                        "id": f"toolu_{uuid.uuid4().hex[:24]}",
+                        "id": "toolu_" + os.urandom(12).hex(),
                         "name": fc.get("name", ""),
                         "input": fc.get("args", {}),
                     }
@@ -354,7 +380,7 @@ class GeminiProvider(BaseProvider):
         usage_metadata = gemini_response.get("usageMetadata", {})
 
         return {
-            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "id": "msg_" + os.urandom(12).hex(),
             "type": "message",
             "role": "assistant",
             "model": original_model,
@@ -397,7 +423,7 @@ class GeminiProvider(BaseProvider):
             response = await client.post(
                 url,
                 headers=self._build_headers(stream=stream),
-                json=gemini_request,
+                content=COMPACT_JSON_ENCODER.encode(gemini_request).encode(),
                 timeout=timeout,
             )
 
@@ -481,7 +507,7 @@ class GeminiProvider(BaseProvider):
                 "POST",
                 url,
                 headers=self._build_headers(stream=True),
-                json=gemini_request,
+                content=COMPACT_JSON_ENCODER.encode(gemini_request).encode(),
                 timeout=timeout,
             ) as response:
                 if response.status_code != 200:
@@ -509,7 +535,7 @@ class GeminiProvider(BaseProvider):
         self, lines: AsyncIterator[str], original_model: str
     ) -> AsyncIterator[bytes]:
         """Convert Gemini SSE stream to Anthropic format."""
-        message_id = f"msg_{uuid.uuid4().hex[:24]}"
+        message_id = "msg_" + os.urandom(12).hex()
         content_index = 0
         sent_start = False
 
@@ -581,7 +607,7 @@ class GeminiProvider(BaseProvider):
                     yield f"event: content_block_stop\ndata: {json.dumps({'type': 'content_block_stop', 'index': 0})}\n\n".encode()
 
                 # Send message_delta with stop_reason
-                stop_reason = "end_turn" if finish_reason == "STOP" else "max_tokens"
+                stop_reason = _STOP_REASON_MAP.get(finish_reason, "end_turn")
                 delta_event = {
                     "type": "message_delta",
                     "delta": {"stop_reason": stop_reason, "stop_sequence": None},
@@ -7,7 +7,9 @@ Supports any OpenAI-compatible endpoint.
 
 import json
 import logging
+import os
 import time
+from types import MappingProxyType
 from typing import Any, AsyncIterator
 
 import httpx
@@ -24,19 +26,36 @@ from a2c.server.config import get_settings
 
 logger = logging.getLogger(__name__)
 
-# Default model mapping from Claude to OpenAI
-DEFAULT_MODEL_MAPPING = {
-    # Claude 4.5 models -> GPT-4.1 (latest flagship)
-    "claude-opus-4-5": "gpt-4.1",
-    "claude-opus-4-5-20251101": "gpt-4.1",
-    "claude-sonnet-4-5": "gpt-4.1",
-    "claude-sonnet-4-5-20250929": "gpt-4.1",
-    # Claude 3.5 models
-    "claude-3-5-sonnet-20241022": "gpt-4o",
-    # Claude 3 Haiku -> GPT-4.1 mini (fast/cheap)
-    "claude-3-haiku-20240307": "gpt-4.1-mini",
-    "claude-haiku-4-5": "gpt-4.1-mini",
-}
+# Default model mapping from Claude to OpenAI; read-only and shared, providers
+# merge their overrides into a private copy
+DEFAULT_MODEL_MAPPING = MappingProxyType(
+    {
+        # Claude 4.5 models -> GPT-4.1 (latest flagship)
+        "claude-opus-4-5": "gpt-4.1",
+        "claude-opus-4-5-20251101": "gpt-4.1",
+        "claude-sonnet-4-5": "gpt-4.1",
+        "claude-sonnet-4-5-20250929": "gpt-4.1",
+        # Claude 3.5 models
+        "claude-3-5-sonnet-20241022": "gpt-4o",
+        # Claude 3 Haiku -> GPT-4.1 mini (fast/cheap)
+        "claude-3-haiku-20240307": "gpt-4.1-mini",
+        "claude-haiku-4-5": "gpt-4.1-mini",
+    }
+)
+
+# OpenAI finish_reason -> Anthropic stop_reason, built once instead of per response;
+# anything unlisted ends the turn
+_STOP_REASON_MAP = MappingProxyType(
+    {
+        "stop": "end_turn",
+        "length": "max_tokens",
+        "tool_calls": "tool_use",
+        "content_filter": "end_turn",
+    }
+)
+
+# Model name prefixes forwarded unchanged; str.startswith checks them in one call
+_PASSTHROUGH_PREFIXES = ("gpt-", "o1", "o3", "o4")
 
 
 class OpenAIProvider(BaseProvider):
@@ -69,6 +88,13 @@ class OpenAIProvider(BaseProvider):
         self._api_key = api_key or settings.providers.openai_api_key
         self._base_url = (base_url or settings.providers.openai_base_url).rstrip("/")
 
+        # Header templates depend only on the API key, which is fixed here
+        self._headers = {
+            "Authorization": f"Bearer {self._api_key or ''}",
+            "Content-Type": "application/json",
+        }
+        self._stream_headers = {**self._headers, "Accept": "text/event-stream"}
+
         # Custom model mapping
         self._model_mapping = {
             **DEFAULT_MODEL_MAPPING,
@@ -109,27 +135,18 @@ class OpenAIProvider(BaseProvider):
 
     def _build_headers(self, stream: bool = False) -> dict[str, str]:
         """Build request headers."""
-        headers = {
-            "Authorization": f"Bearer {self._api_key or ''}",
-            "Content-Type": "application/json",
-        }
-        if stream:
-            headers["Accept"] = "text/event-stream"
-        return headers
+        return (self._stream_headers if stream else self._headers).copy()
 
     def _map_model(self, model: str) -> str:
         """Map Claude model name to OpenAI model."""
-        # Check custom mapping first
-        if model in self._model_mapping:
-            return self._model_mapping[model]
+        # Custom mapping is merged with the defaults once in __init__, so a
+        # single probe covers both
+        mapped = self._model_mapping.get(model)
+        if mapped is not None:
+            return mapped
 
         # Pass through if already an OpenAI model
-        if (
-            model.startswith("gpt-")
-            or model.startswith("o1")
-            or model.startswith("o3")
-            or model.startswith("o4")
-        ):
+        if model.startswith(_PASSTHROUGH_PREFIXES):
             return model
 
         # Default to gpt-4.1
@@ -171,18 +188,22 @@ class OpenAIProvider(BaseProvider):
                 messages.append({"role": "system", "content": system})
             elif isinstance(system, list):
                 # Extract text from content blocks
-                text_parts = []
-                for block in system:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
+                text_parts = [
+                    block.get("text", "")
+                    for block in system
+                    if isinstance(block, dict) and block.get("type") == "text"
+                ]
                 if text_parts:
                     messages.append({"role": "system", "content": "\n".join(text_parts)})
 
-        # Convert each message
-        for msg in anthropic_request.get("messages", []):
-            converted = self._convert_message(msg)
-            if converted:
-                messages.append(converted)
+        # Convert each message; the list grows geometrically, so extending it
+        # from a generator costs no more than sizing it up front would
+        convert_message = self._convert_message
+        messages.extend(
+            converted
+            for msg in anthropic_request.get("messages", [])
+            if (converted := convert_message(msg))
+        )
 
         openai_request["messages"] = messages
 
@@ -203,63 +224,66 @@ class OpenAIProvider(BaseProvider):
 
         # Handle content blocks
         if isinstance(content, list):
-            # Check for tool_result (becomes tool role)
-            tool_results = [
-                b for b in content if isinstance(b, dict) and b.get("type") == "tool_result"
-            ]
-            if tool_results:
-                result = tool_results[0]
-                return {
-                    "role": "tool",
-                    "tool_call_id": result.get("tool_use_id", ""),
-                    "content": self._extract_content_text(result.get("content", "")),
-                }
+            # Classify blocks in a single pass instead of rescanning the list once
+            # per block kind. The first tool_result wins (becomes tool role), then
+            # tool_use (becomes tool_calls), then images (vision content)
+            tool_uses = []
+            has_images = False
+            for b in content:
+                if not isinstance(b, dict):
+                    continue
+                block_type = b.get("type")
+                if block_type == "tool_result":
+                    return {
+                        "role": "tool",
+                        "tool_call_id": b.get("tool_use_id", ""),
+                        "content": self._extract_content_text(b.get("content", "")),
+                    }
+                if block_type == "tool_use":
+                    tool_uses.append(b)
+                elif block_type == "image":
+                    has_images = True
 
-            # Check for tool_use (becomes tool_calls)
-            tool_uses = [b for b in content if isinstance(b, dict) and b.get("type") == "tool_use"]
             if tool_uses:
-                tool_calls = []
-                for tu in tool_uses:
-                    tool_calls.append(
-                        {
-                            "id": tu.get("id", ""),
-                            "type": "function",
-                            "function": {
-                                "name": tu.get("name", ""),
-                                "arguments": json.dumps(tu.get("input", {})),
-                            },
-                        }
-                    )
+                tool_calls = [
+                    {
+                        "id": tu.get("id", ""),
+                        "type": "function",
+                        "function": {
+                            "name": tu.get("name", ""),
+                            "arguments": json.dumps(tu.get("input", {})),
+                        },
+                    }
+                    for tu in tool_uses
+                ]
                 return {
                     "role": "assistant",
                     "content": None,
                     "tool_calls": tool_calls,
                 }
 
-            # Check for images
-            has_images = any(isinstance(b, dict) and b.get("type") == "image" for b in content)
-
             if has_images:
-                # Convert to OpenAI vision format
+                # Convert to OpenAI vision format. Literal match arms compile to
+                # plain comparisons, so this reads the block type once without a
+                # handler call per block; other block types are dropped
                 openai_content = []
+                append = openai_content.append
                 for block in content:
-                    if isinstance(block, dict):
-                        if block.get("type") == "text":
-                            openai_content.append(
-                                {
-                                    "type": "text",
-                                    "text": block.get("text", ""),
-                                }
-                            )
-                        elif block.get("type") == "image":
+                    if not isinstance(block, dict):
+                        continue
+                    match block.get("type"):
+                        case "text":
+                            append({"type": "text", "text": block.get("text", "")})
+
+                        case "image":
                             source = block.get("source", {})
                             if source.get("type") == "base64":
-                                openai_content.append(
+                                media_type = source.get("media_type", "image/png")
+                                data = source.get("data", "")
+                                append(
                                     {
                                         "type": "image_url",
-                                        "image_url": {
-                                            "url": f"data:{source.get('media_type', 'image/png')};base64,{source.get('data', '')}",
-                                        },
+                                        "image_url": {"url": f"data:{media_type};base64,{data}"},
                                     }
                                 )
                 return {"role": role, "content": openai_content}
@@ -282,28 +306,26 @@ class OpenAIProvider(BaseProvider):
         if isinstance(content, str):
             return content
         if isinstance(content, list):
-            parts = []
-            for block in content:
-                if isinstance(block, dict) and block.get("type") == "text":
-                    parts.append(block.get("text", ""))
-            return "\n".join(parts)
+            return "\n".join(
+                block.get("text", "")
+                for block in content
+                if isinstance(block, dict) and block.get("type") == "text"
+            )
         return str(content)
 
     def _convert_tools(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Convert Anthropic tools to OpenAI function format."""
-        openai_tools = []
-        for tool in tools:
-            openai_tools.append(
-                {
-                    "type": "function",
-                    "function": {
-                        "name": tool.get("name", ""),
-                        "description": tool.get("description", ""),
-                        "parameters": tool.get("input_schema", {}),
-                    },
-                }
-            )
-        return openai_tools
+        return [
+            {
+                "type": "function",
+                "function": {
+                    "name": tool.get("name", ""),
+                    "description": tool.get("description", ""),
+                    "parameters": tool.get("input_schema", {}),
+                },
+            }
+            for tool in tools
+        ]
 
     def _convert_response(
         self, openai_response: dict[str, Any], original_model: str
@@ -323,13 +345,7 @@ class OpenAIProvider(BaseProvider):
         finish_reason = choice.get("finish_reason", "stop")
 
         # Convert finish_reason
-        stop_reason_map = {
-            "stop": "end_turn",
-            "length": "max_tokens",
-            "tool_calls": "tool_use",
-            "content_filter": "end_turn",
-        }
-        stop_reason = stop_reason_map.get(finish_reason, "end_turn")
+        stop_reason = _STOP_REASON_MAP.get(finish_reason, "end_turn")
 
         # Build content
         content = []
@@ -339,10 +355,15 @@ class OpenAIProvider(BaseProvider):
         if tool_calls:
             for tc in tool_calls:
                 func = tc.get("function", {})
-                try:
-                    input_data = json.loads(func.get("arguments", "{}"))
-                except json.JSONDecodeError:
-                    input_data = {"raw": func.get("arguments", "")}
+                arguments = func.get("arguments", "{}")
+                # Tools without parameters are called with "{}"; skip the decoder
+                if arguments == "{}":
+                    input_data = {}
+                else:
+                    try:
+                        input_data = json.loads(arguments)
+                    except json.JSONDecodeError:
+                        input_data = {"raw": arguments}
 
                 content.append(
                     {
@@ -501,9 +522,7 @@ class OpenAIProvider(BaseProvider):
         self, lines: AsyncIterator[str], original_model: str
     ) -> AsyncIterator[bytes]:
         """Convert OpenAI SSE stream to Anthropic format."""
-        import uuid
-
-        message_id = f"msg_{uuid.uuid4().hex[:24]}"
+        message_id = "msg_" + os.urandom(12).hex()
         content_index = 0
         sent_start = False
 
@@ -8,7 +8,10 @@ The registry handles:
 """
 
 import asyncio
+import inspect
 import logging
+import time
+from dataclasses import dataclass, field
 from typing import Any
 
 from a2c.providers.base import BaseProvider, ProviderHealth, ProviderStatus
@@ -16,6 +19,20 @@ from a2c.providers.base import BaseProvider, ProviderHealth, ProviderStatus
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class RegistryCounts:
+    """Provider counts by state, computed in a single pass over the registry."""
+
+    total: int = 0
+    configured: int = 0
+    healthy: int = 0
+    degraded: int = 0
+    unhealthy: int = 0
+    healthy_names: list[str] = field(default_factory=list)
+    degraded_names: list[str] = field(default_factory=list)
+    unhealthy_names: list[str] = field(default_factory=list)
+
+
 class ProviderRegistry:
     """
     Registry for managing AI providers.
@@ -31,6 +48,12 @@ class ProviderRegistry:
         self._providers: dict[str, BaseProvider] = {}
         self._health_check_task: asyncio.Task | None = None
         self._health_check_interval: float = 60.0  # seconds
+        self._counts_cache: tuple[float, RegistryCounts] | None = None
+        # Configuration is fixed at construction, so this only changes on (un)register
+        self._configured_cache: tuple[BaseProvider, ...] = ()
+        # Healthy providers by name, kept current by each provider's health setter
+        self._healthy: dict[str, BaseProvider] = {}
+        self._counts_ttl: float = 0.25  # seconds
 
     def register(self, provider: BaseProvider) -> None:
         """
@@ -41,11 +64,22 @@ class ProviderRegistry:
 
         Raises:
             ValueError: If provider with same name already exists
+            TypeError: If stream_response is not an async generator
         """
         if provider.name in self._providers:
             raise ValueError(f"Provider '{provider.name}' already registered")
 
+        # Sync iterators would be pushed through Starlette's threadpool per chunk
+        if not inspect.isasyncgenfunction(provider.stream_response):
+            raise TypeError(
+                f"Provider '{provider.name}': stream_response must be an async generator"
+            )
+
         self._providers[provider.name] = provider
+        self._counts_cache = None
+        self._rebuild_configured()
+        provider.set_health_listener(self._on_health_change)
+        self._on_health_change(provider)
         logger.info(f"Registered provider: {provider.name}")
 
     def unregister(self, name: str) -> None:
@@ -56,9 +90,32 @@ class ProviderRegistry:
             name: Provider name to unregister
         """
         if name in self._providers:
-            del self._providers[name]
+            provider = self._providers.pop(name)
+            self._healthy.pop(name, None)
+            provider.clear_health_listener()
+            self._counts_cache = None
+            self._rebuild_configured()
             logger.info(f"Unregistered provider: {name}")
 
+    def _rebuild_configured(self) -> None:
+        """Recompute the cached tuple of configured providers."""
+        self._configured_cache = tuple(p for p in self._providers.values() if p.is_configured)
+
+    def _on_health_change(self, provider: BaseProvider) -> None:
+        """
+        Update the healthy index after a provider stores a new health result.
+
+        Args:
+            provider: Provider whose health changed
+        """
+        if self._providers.get(provider.name) is not provider:
+            return
+        self._counts_cache = None
+        if provider.is_healthy:
+            self._healthy[provider.name] = provider
+        else:
+            self._healthy.pop(provider.name, None)
+
     def get(self, name: str) -> BaseProvider | None:
         """
         Get a provider by name.
@@ -103,18 +160,52 @@ class ProviderRegistry:
         List all healthy providers.
 
         Returns:
-            List of healthy provider instances
+            List of healthy provider instances, read from the maintained index
         """
-        return [p for p in self._providers.values() if p.is_healthy]
+        return list(self._healthy.values())
 
-    def list_configured_providers(self) -> list[BaseProvider]:
+    def list_configured_providers(self) -> tuple[BaseProvider, ...]:
         """
         List all configured providers.
 
         Returns:
-            List of configured provider instances
+            Configured provider instances in registration order (cached)
+        """
+        return self._configured_cache
+
+    def snapshot_counts(self) -> RegistryCounts:
+        """
+        Count providers by configuration and health state in one pass.
+
+        Results are reused for a short TTL since probes poll far more often
+        than provider state changes; registering or unregistering resets it.
+
+        Returns:
+            Provider counts and names grouped by health status
         """
-        return [p for p in self._providers.values() if p.is_configured]
+        now = time.monotonic()
+        if self._counts_cache and now - self._counts_cache[0] < self._counts_ttl:
+            return self._counts_cache[1]
+
+        counts = RegistryCounts(total=len(self._providers))
+        for provider in self._providers.values():
+            if provider.is_configured:
+                counts.configured += 1
+
+            status = provider.health.status
+            if status == ProviderStatus.HEALTHY:
+                counts.healthy_names.append(provider.name)
+            elif status == ProviderStatus.DEGRADED:
+                counts.degraded_names.append(provider.name)
+            else:
+                counts.unhealthy_names.append(provider.name)
+
+        counts.healthy = len(counts.healthy_names)
+        counts.degraded = len(counts.degraded_names)
+        counts.unhealthy = len(counts.unhealthy_names)
+
+        self._counts_cache = (now, counts)
+        return counts
 
     async def check_health(self, name: str) -> ProviderHealth:
         """
@@ -197,7 +288,7 @@ class ProviderRegistry:
         return {
             "providers": {name: p.to_dict() for name, p in self._providers.items()},
             "total": len(self._providers),
-            "healthy": len(self.list_healthy_providers()),
+            "healthy": len(self._healthy),
             "configured": len(self.list_configured_providers()),
         }
 
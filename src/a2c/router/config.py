@@ -7,7 +7,10 @@ Supports:
 - Conversion to Router instances
 """
 
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +18,13 @@ import yaml
 
 from a2c.router.rules import Router, RoutingRule
 
+# Prefer the libyaml-backed loader; fall back to pure Python if PyYAML was
+# built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class ConfigValidationError(Exception):
     """Raised when configuration validation fails."""
@@ -23,16 +33,18 @@ class ConfigValidationError(Exception):
 
 
 # Valid match conditions
-VALID_MATCH_CONDITIONS = {
-    "agent_type",
-    "model_pattern",
-    "thinking",
-    "min_context_tokens",
-    "max_context_tokens",
-}
-
-
-@dataclass
+VALID_MATCH_CONDITIONS = frozenset(
+    {
+        "agent_type",
+        "model_pattern",
+        "thinking",
+        "min_context_tokens",
+        "max_context_tokens",
+    }
+)
+
+
+@dataclass(slots=True)
 class RuleConfig:
     """Configuration for a single routing rule."""
 
@@ -67,7 +79,7 @@ class RuleConfig:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingConfig:
     """Complete routing configuration."""
 
@@ -75,14 +87,17 @@ class RoutingConfig:
     long_context_threshold: int = 100000
     rules: list[RuleConfig] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Sort rules by priority (highest first) once, so the router can take
+        # them in order without re-sorting
+        self.rules = sorted(self.rules, key=attrgetter("priority"), reverse=True)
+
     def to_router(self) -> Router:
         """Convert to Router instance."""
-        router = Router(default_provider=self.default_provider)
-
-        for rule_config in self.rules:
-            router.add_rule(rule_config.to_routing_rule())
-
-        return router
+        return Router(
+            rules=[rule_config.to_routing_rule() for rule_config in self.rules],
+            default_provider=self.default_provider,
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -104,20 +119,18 @@ class RoutingConfig:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "RoutingConfig":
         """Create from dictionary."""
-        rules = []
-        for rule_data in data.get("rules", []):
-            rules.append(
-                RuleConfig(
-                    name=rule_data.get("name", ""),
-                    provider=rule_data.get("provider", ""),
-                    priority=rule_data.get("priority", 0),
-                    fallback_provider=rule_data.get("fallback_provider"),
-                    match=rule_data.get("match", {}),
-                )
+        # Shallow rebuild: only match dicts are copied, so configs never share
+        # state with cached YAML; everything else is immutable
+        rules = [
+            RuleConfig(
+                name=rule_data.get("name", ""),
+                provider=rule_data.get("provider", ""),
+                priority=rule_data.get("priority", 0),
+                fallback_provider=rule_data.get("fallback_provider"),
+                match=dict(rule_data.get("match") or {}),
             )
-
-        # Sort rules by priority (highest first)
-        rules.sort(key=lambda r: r.priority, reverse=True)
+            for rule_data in data.get("rules", [])
+        ]
 
         return cls(
             default_provider=data.get("default_provider", "anthropic"),
@@ -162,18 +175,60 @@ def validate_routing_config(config_dict: dict[str, Any]) -> RoutingConfig:
                 f"Rule '{name}': priority must be an integer, got {type(rule['priority']).__name__}"
             )
 
-        # Validate match conditions
-        match = rule.get("match", {})
-        for condition in match:
-            if condition not in VALID_MATCH_CONDITIONS:
+        match = rule.get("match") or {}
+        if not isinstance(match, dict):
+            raise ConfigValidationError(
+                f"Rule '{name}': match must be a mapping, got {type(match).__name__}"
+            )
+
+        # Validate match conditions with one set difference per rule
+        unknown = match.keys() - VALID_MATCH_CONDITIONS
+        if unknown:
+            raise ConfigValidationError(
+                f"Rule '{name}': unknown match condition "
+                f"{', '.join(repr(c) for c in sorted(unknown))}. "
+                f"Valid conditions: {', '.join(sorted(VALID_MATCH_CONDITIONS))}"
+            )
+
+        # Compile model patterns now so a bad regex fails at load time rather
+        # than on every routed request
+        model_pattern = match.get("model_pattern")
+        if model_pattern:
+            try:
+                re.compile(model_pattern, re.IGNORECASE)
+            except (re.error, TypeError) as e:
                 raise ConfigValidationError(
-                    f"Rule '{name}': unknown match condition '{condition}'. "
-                    f"Valid conditions: {VALID_MATCH_CONDITIONS}"
-                )
+                    f"Rule '{name}': invalid model_pattern {model_pattern!r}: {e}"
+                ) from None
 
     return RoutingConfig.from_dict(config_dict)
 
 
+@lru_cache(maxsize=32)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML config file.
+
+    Keyed on the file's modification time and size so that edits are picked
+    up while repeated loads of an unchanged file skip parsing.
+
+    Args:
+        path: Path to YAML file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Parsed YAML document, or None if the file is empty
+    """
+    with open(path) as f:
+        content = f.read()
+
+    if not content.strip():
+        return None
+
+    return yaml.load(content, Loader=_YamlLoader)
+
+
 def load_routing_config(config_path: Path) -> RoutingConfig:
     """
     Load routing configuration from YAML file.
@@ -192,13 +247,8 @@ def load_routing_config(config_path: Path) -> RoutingConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path) as f:
-        content = f.read()
-
-    if not content.strip():
-        return RoutingConfig()
-
-    data = yaml.safe_load(content)
+    stat = config_path.stat()
+    data = _parse_config_file(str(config_path), stat.st_mtime_ns, stat.st_size)
 
     if data is None:
         return RoutingConfig()
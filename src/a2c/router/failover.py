@@ -8,6 +8,8 @@ Handles:
 """
 
 import logging
+import random
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -16,7 +18,7 @@ from a2c.providers.base import ProviderHealth, ProviderResponse, ProviderStatus
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FailoverResult:
     """Result of a failover operation."""
 
@@ -63,7 +65,19 @@ class FailoverService:
     # 502: Bad Gateway - proxy/upstream issue, often transient
     # 503: Service Unavailable - temporary overload
     # 504: Gateway Timeout - upstream timeout, may succeed on retry
-    RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+    RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+    __slots__ = (
+        "max_retries",
+        "retry_delay_ms",
+        "max_retry_delay_ms",
+        "latency_threshold_ms",
+        "cooldown_ms",
+        "jitter",
+        "_cooldowns",
+        "_rng",
+        "_retry_delays",
+    )
 
     def __init__(
         self,
@@ -71,6 +85,8 @@ class FailoverService:
         retry_delay_ms: int = 100,
         max_retry_delay_ms: int = 5000,
         latency_threshold_ms: float = 5000,
+        cooldown_ms: float = 1000,
+        jitter: str = "none",
     ):
         """
         Initialize failover service.
@@ -80,11 +96,38 @@ class FailoverService:
             retry_delay_ms: Base delay between retries in milliseconds
             max_retry_delay_ms: Maximum delay between retries
             latency_threshold_ms: Latency threshold for failover decision
+            cooldown_ms: How long a failed provider is skipped in new chains
+            jitter: Backoff jitter, "none" (exponential) or "decorrelated"
+
+        Raises:
+            ValueError: If jitter is not a supported mode
         """
+        if jitter not in ("none", "decorrelated"):
+            raise ValueError(f"Unknown jitter mode: {jitter}")
+
         self.max_retries = max_retries
         self.retry_delay_ms = retry_delay_ms
         self.max_retry_delay_ms = max_retry_delay_ms
         self.latency_threshold_ms = latency_threshold_ms
+        self.cooldown_ms = cooldown_ms
+        self.jitter = jitter
+
+        # Private generator so jittered delays do not share the global one
+        self._rng = random.Random()
+
+        # Provider name -> monotonic time its cooldown ends
+        self._cooldowns: dict[str, float] = {}
+
+        # Backoff delays up to and including the first capped value; later
+        # attempts reuse the last entry
+        delays = []
+        delay = retry_delay_ms
+        while True:
+            delays.append(min(delay, max_retry_delay_ms))
+            if delay <= 0 or delay >= max_retry_delay_ms:
+                break
+            delay *= 2
+        self._retry_delays = tuple(delays)
 
     def should_retry(self, status_code: int) -> bool:
         """
@@ -96,6 +139,8 @@ class FailoverService:
         Returns:
             True if request should be retried
         """
+        # A frozenset probe beats both a tuple scan and bisect over the sorted
+        # codes, even for this handful of values
         return status_code in self.RETRYABLE_STATUS_CODES
 
     def should_failover(self, health: ProviderHealth) -> bool:
@@ -108,13 +153,16 @@ class FailoverService:
         Returns:
             True if should failover to another provider
         """
-        if health.status == ProviderStatus.UNHEALTHY:
+        # Enum members are singletons, so identity checks avoid str.__eq__
+        # on the str-valued status
+        status = health.status
+        if status is ProviderStatus.UNHEALTHY:
             return True
 
-        if health.status == ProviderStatus.DEGRADED:
+        if status is ProviderStatus.DEGRADED:
             # Failover if latency is too high
-            if health.latency_ms and health.latency_ms > self.latency_threshold_ms:
-                return True
+            latency_ms = health.latency_ms
+            return bool(latency_ms and latency_ms > self.latency_threshold_ms)
 
         return False
 
@@ -135,33 +183,66 @@ class FailoverService:
         Returns:
             Ordered list of providers to try
         """
-        chain = []
-
-        # Add primary if available
-        if primary in available:
-            chain.append(primary)
+        # Primary first, then the explicit fallback, if available; then the
+        # remaining providers in their original order. dict.fromkeys keeps
+        # first occurrences, so duplicates drop out in one linear pass.
+        available_set = set(available)
+        preferred = [p for p in (primary, fallback) if p and p in available_set]
+        chain = list(dict.fromkeys([*preferred, *available]))
+
+        cooldowns = self._cooldowns
+        if not cooldowns:
+            return chain
+
+        # Skip providers that failed recently; if every provider is cooling
+        # down, keep only the one that becomes available soonest
+        now = time.monotonic()
+        ready = [p for p in chain if cooldowns.get(p, 0.0) <= now]
+        if ready or not chain:
+            return ready
+        return [min(chain, key=cooldowns.__getitem__)]
+
+    def mark_failed(self, provider: str) -> None:
+        """
+        Skip a provider in new failover chains for the cooldown period.
 
-        # Add explicit fallback if available
-        if fallback and fallback in available and fallback not in chain:
-            chain.append(fallback)
+        Args:
+            provider: Name of the provider that just failed
+        """
+        self._cooldowns[provider] = time.monotonic() + self.cooldown_ms / 1000
 
-        # Add remaining available providers
-        for provider in available:
-            if provider not in chain:
-                chain.append(provider)
+    def mark_succeeded(self, provider: str) -> None:
+        """
+        Clear any cooldown for a provider after a successful request.
 
-        return chain
+        Args:
+            provider: Name of the provider that succeeded
+        """
+        self._cooldowns.pop(provider, None)
 
-    def get_retry_delay(self, attempt: int) -> int:
+    def get_retry_delay(self, attempt: int, prev_delay: int | None = None) -> int:
         """
         Calculate retry delay with exponential backoff.
 
+        With decorrelated jitter the delay is drawn uniformly between the base
+        delay and three times the previous delay, so concurrent clients do not
+        retry in lockstep.
+
         Args:
             attempt: Current attempt number (1-based)
+            prev_delay: Previous delay in milliseconds (decorrelated jitter only)
 
         Returns:
             Delay in milliseconds
         """
-        # Exponential backoff: base * 2^(attempt-1)
-        delay = self.retry_delay_ms * (2 ** (attempt - 1))
-        return min(delay, self.max_retry_delay_ms)
+        if self.jitter == "decorrelated":
+            base = self.retry_delay_ms
+            upper = max(base, (prev_delay or base) * 3)
+            return int(min(self.max_retry_delay_ms, self._rng.uniform(base, upper)))
+
+        # Exponential backoff: base * 2^(attempt-1), looked up in the table
+        # built at init
+        if attempt < 1:
+            return min(self.retry_delay_ms * (2 ** (attempt - 1)), self.max_retry_delay_ms)
+        delays = self._retry_delays
+        return delays[attempt - 1] if attempt <= len(delays) else delays[-1]
@@ -4,14 +4,26 @@ Routing rules engine.
 Matches requests to providers based on configurable rules.
 """
 
+import bisect
 import logging
 import re
+import threading
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from a2c.server.config import get_settings
 
+# Prefer RE2's linear-time matcher for model patterns when google-re2 is
+# installed; fall back to the standard library otherwise
+try:
+    import re2 as _re2  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    _re2 = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,9 +38,64 @@ class AgentType(str, Enum):
     CODE = "code"
 
 
-@dataclass
+# Canonical string object for each built-in agent type, so agent type checks
+# usually compare identical objects instead of equal copies from headers
+_AGENT_TYPE_NAMES = MappingProxyType({m.value: m.value for m in AgentType})
+
+
+def _agent_name(agent_type: str | None) -> str:
+    """Map an agent type to its canonical name; custom types pass through."""
+    if not agent_type:
+        return AgentType.DEFAULT.value
+    return _AGENT_TYPE_NAMES.get(agent_type, agent_type)
+
+
+def _compile_model_pattern(pattern: str) -> re.Pattern[str]:
+    """
+    Compile a model pattern for case-insensitive matching from the start.
+
+    Uses RE2 when available, so no pattern can backtrack catastrophically;
+    patterns RE2 does not support (backreferences, lookarounds) and setups
+    without it use the standard library.
+
+    Args:
+        pattern: Regular expression from the rule
+
+    Returns:
+        Compiled pattern with re.Pattern's match() semantics
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(f"(?i:{pattern})")
+        except _re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Upper bound on memoized routing decisions per router
+_ROUTE_MEMO_SIZE = 4096
+
+# Request features a rule can require, as bits of RoutingRule._mask
+_THINKING_ON = 1
+_THINKING_OFF = 2
+
+
+def _is_thinking(request: dict[str, Any]) -> bool:
+    """Check whether a request enables extended thinking."""
+    thinking = request.get("thinking", {})
+    if isinstance(thinking, dict):
+        return thinking.get("type") == "enabled"
+    return thinking is True
+
+
+@dataclass(slots=True, frozen=True)
 class RoutingRule:
-    """A single routing rule."""
+    """
+    A single routing rule.
+
+    Rules are immutable: routers index, memoize and share them, so build a
+    new rule (e.g. with dataclasses.replace) rather than changing one.
+    """
 
     name: str
     provider: str
@@ -44,6 +111,25 @@ class RoutingRule:
     # Fallback provider if primary fails
     fallback_provider: str | None = None
 
+    # model_pattern compiled once, so matching skips re's pattern cache lookup
+    _model_re: re.Pattern[str] | None = field(default=None, init=False, repr=False, compare=False)
+    # Request feature bits this rule requires, for a quick reject while routing
+    _mask: int = field(default=0, init=False, repr=False, compare=False)
+    # to_dict output, built on first use
+    _dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Canonicalize the agent type, compile the model pattern and precompute the mask."""
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        if self.agent_type:
+            object.__setattr__(self, "agent_type", _agent_name(self.agent_type))
+        if self.model_pattern:
+            object.__setattr__(self, "_model_re", _compile_model_pattern(self.model_pattern))
+        if self.thinking_enabled is not None:
+            object.__setattr__(
+                self, "_mask", _THINKING_ON if self.thinking_enabled else _THINKING_OFF
+            )
+
     def matches(
         self,
         request: dict[str, Any],
@@ -58,6 +144,29 @@ class RoutingRule:
             agent_type: Agent type from header
             context_tokens: Estimated context tokens
 
+        Returns:
+            True if all conditions match
+        """
+        return self._matches(
+            request.get("model", ""), _is_thinking(request), agent_type, context_tokens
+        )
+
+    def _matches(
+        self,
+        model: str,
+        thinking: bool,
+        agent_type: str | None,
+        context_tokens: int,
+    ) -> bool:
+        """
+        Check if this rule matches already-extracted request fields.
+
+        Args:
+            model: Requested model name
+            thinking: Whether the request enables extended thinking
+            agent_type: Agent type from header
+            context_tokens: Estimated context tokens
+
         Returns:
             True if all conditions match
         """
@@ -66,23 +175,13 @@ class RoutingRule:
             return False
 
         # Check model pattern
-        if self.model_pattern:
-            model = request.get("model", "")
-            if not re.match(self.model_pattern, model, re.IGNORECASE):
+        if self._model_re is not None:
+            if not self._model_re.match(model):
                 return False
 
         # Check thinking enabled
-        if self.thinking_enabled is not None:
-            thinking = request.get("thinking", {})
-            is_thinking = False
-
-            if isinstance(thinking, dict):
-                is_thinking = thinking.get("type") == "enabled"
-            elif thinking is True:
-                is_thinking = True
-
-            if self.thinking_enabled != is_thinking:
-                return False
+        if self.thinking_enabled is not None and self.thinking_enabled != thinking:
+            return False
 
         # Check context tokens
         if self.min_context_tokens is not None and context_tokens < self.min_context_tokens:
@@ -94,20 +193,39 @@ class RoutingRule:
         return True
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert rule to dictionary."""
-        return {
-            "name": self.name,
-            "provider": self.provider,
-            "priority": self.priority,
-            "conditions": {
-                "agent_type": self.agent_type,
-                "model_pattern": self.model_pattern,
-                "thinking_enabled": self.thinking_enabled,
-                "min_context_tokens": self.min_context_tokens,
-                "max_context_tokens": self.max_context_tokens,
-            },
-            "fallback_provider": self.fallback_provider,
-        }
+        """
+        Convert rule to dictionary.
+
+        Rules are frozen, so they are serialized once; each call returns a
+        copy, so callers may modify the result.
+        """
+        cached = self._dict
+        if cached is None:
+            cached = {
+                "name": self.name,
+                "provider": self.provider,
+                "priority": self.priority,
+                "conditions": {
+                    "agent_type": self.agent_type,
+                    "model_pattern": self.model_pattern,
+                    "thinking_enabled": self.thinking_enabled,
+                    "min_context_tokens": self.min_context_tokens,
+                    "max_context_tokens": self.max_context_tokens,
+                },
+                "fallback_provider": self.fallback_provider,
+            }
+            object.__setattr__(self, "_dict", cached)
+        return {**cached, "conditions": {**cached["conditions"]}}
+
+
+# A rule's remaining match fields flattened for the routing loop:
+# (rule, mask, model pattern bit or 0)
+_RuleRow = tuple[RoutingRule, int, int]
+
+
+def _descending_priority(rule: RoutingRule) -> int:
+    """Sort key that orders rules from highest to lowest priority."""
+    return -rule.priority
 
 
 @dataclass
@@ -125,20 +243,243 @@ class Router:
     rules: list[RoutingRule] = field(default_factory=list)
     default_provider: str = "anthropic"
 
+    # Rows for the rules that can match each agent type, in priority order,
+    # split by context range (see _build_index); built on first use and
+    # rebuilt whenever self.rules no longer equals the indexed snapshot, so
+    # direct edits to the list are picked up as well as add_rule/remove_rule
+    _by_agent: dict[str, list[list[_RuleRow]]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _any_agent: list[list[_RuleRow]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _indexed_rules: list[RoutingRule] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Sorted context-token thresholds at which some rule starts or stops matching
+    _context_bounds: list[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    # Distinct compiled model patterns, each with its own bit
+    _patterns: list[tuple[int, re.Pattern[str]]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Bits of the patterns each model name matches, so every pattern runs at
+    # most once per model however many rules share it or requests repeat it
+    _model_bits: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Rules restricted to one agent type, in priority order
+    _agent_rules: list[RoutingRule] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Matched rule per request fingerprint, cleared with the buckets above
+    _route_memo: dict[tuple[str, bool, str, int], RoutingRule | None] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def add_rule(self, rule: RoutingRule) -> None:
         """Add a routing rule."""
         self.rules.append(rule)
-        # Sort by priority (higher first)
-        self.rules.sort(key=lambda r: r.priority, reverse=True)
+        # Sort by priority (higher first); the sort is stable, so rules of equal
+        # priority keep their order, and it runs in linear time when the list
+        # was already sorted. Rules passed to the constructor or edited
+        # directly need not be sorted, so inserting by bisection is not safe.
+        self.rules.sort(key=_descending_priority)
+        self._invalidate()
 
     def remove_rule(self, name: str) -> bool:
         """Remove a rule by name."""
         for i, rule in enumerate(self.rules):
             if rule.name == name:
                 del self.rules[i]
+                self._invalidate()
                 return True
         return False
 
+    def _invalidate(self) -> None:
+        """Drop the agent buckets and memoized matches after a rule change."""
+        self._by_agent = None
+        self._model_bits.clear()
+        self._route_memo.clear()
+
+    def _build_index(self) -> dict[str, list[list[_RuleRow]]]:
+        """
+        Bucket the rules by agent type and context range.
+
+        Rules without an agent type apply to every agent, so each bucket holds
+        those plus the rules for that agent type; agent types no rule names
+        only see the former. Each bucket is split into one list per range
+        between consecutive context thresholds, holding only the rules whose
+        token limits admit that range, so routing finds its candidates with
+        one bisect and never re-checks agent type or context size. Rows hold
+        the remaining match fields so the loop unpacks a tuple instead of
+        loading attributes.
+
+        Returns:
+            Candidate rows per agent type and context range, highest priority first
+        """
+        rules = self.rules
+        self._indexed_rules = list(rules)
+        bounds = {r.min_context_tokens for r in rules if r.min_context_tokens is not None}
+        bounds.update(r.max_context_tokens + 1 for r in rules if r.max_context_tokens is not None)
+        self._context_bounds = context_bounds = sorted(bounds)
+        ranges = range(len(context_bounds) + 1)
+
+        # Range i holds context sizes in [bounds[i - 1], bounds[i]), so a rule
+        # admits ranges from just past its minimum up to its maximum + 1
+        pattern_bits: dict[str, int] = {}
+        self._patterns = []
+        windows = []
+        for r in rules:
+            bit = 0
+            if r._model_re is not None:
+                bit = pattern_bits.get(r.model_pattern, 0)
+                if not bit:
+                    bit = pattern_bits[r.model_pattern] = 1 << len(pattern_bits)
+                    self._patterns.append((bit, r._model_re))
+            lo = 0
+            if r.min_context_tokens is not None:
+                lo = context_bounds.index(r.min_context_tokens) + 1
+            hi = len(context_bounds)
+            if r.max_context_tokens is not None:
+                hi = context_bounds.index(r.max_context_tokens + 1)
+            windows.append(((r, r._mask, bit), lo, hi))
+
+        def split(agent: str | None) -> list[list[_RuleRow]]:
+            rows = [w for w in windows if w[0][0].agent_type in (None, "", agent)]
+            return [[row for row, lo, hi in rows if lo <= i <= hi] for i in ranges]
+
+        self._any_agent = split(None)
+        self._agent_rules = [r for r in rules if r.agent_type]
+        self._model_bits.clear()
+        self._route_memo.clear()
+        by_agent = self._by_agent = {
+            name: split(name) for name in {r.agent_type for r in rules if r.agent_type}
+        }
+        return by_agent
+
+    def _candidates(self, agent_type: str | None) -> list[list[_RuleRow]]:
+        """
+        Get the rows for rules that can match an agent type, per context range.
+
+        Args:
+            agent_type: Agent type from header
+
+        Returns:
+            Candidate rows for each context range, highest priority first
+        """
+        return self._index().get(agent_type or "default", self._any_agent)
+
+    def _index(self) -> dict[str, list[list[_RuleRow]]]:
+        """
+        Get the agent buckets, rebuilding them if the rules have changed.
+
+        Comparing against the snapshot is a pointer check per rule for an
+        unchanged list; rules are frozen, so equal rules route identically.
+
+        Returns:
+            Candidate rows per agent type and context range
+        """
+        by_agent = self._by_agent
+        if by_agent is None or self.rules != self._indexed_rules:
+            by_agent = self._build_index()
+        return by_agent
+
+    def rules_with_agent_type(self) -> list[RoutingRule]:
+        """
+        Get the rules restricted to an agent type.
+
+        Returns:
+            Rules with an agent type condition, highest priority first
+        """
+        self._index()
+        return list(self._agent_rules)
+
+    def _pattern_bits(self, model: str) -> int:
+        """
+        Get the bits of the model patterns a model name matches.
+
+        Args:
+            model: Requested model name
+
+        Returns:
+            Bitwise OR of the matching patterns' bits
+        """
+        cache = self._model_bits
+        bits = cache.get(model) if type(model) is str else None
+        if bits is None:
+            bits = 0
+            for bit, pattern in self._patterns:
+                if pattern.match(model):
+                    bits |= bit
+            if type(model) is str:
+                if len(cache) >= _ROUTE_MEMO_SIZE:
+                    cache.clear()
+                cache[model] = bits
+        return bits
+
+    def _match(
+        self,
+        request: dict[str, Any],
+        agent_type: str | None,
+        context_tokens: int,
+    ) -> RoutingRule | None:
+        """
+        Find the highest-priority rule matching a request.
+
+        A rule only looks at the model name, whether thinking is enabled, the
+        agent type and which side of each context threshold the request falls
+        on, so results are memoized on exactly that fingerprint. The memo is
+        cleared whenever the index is rebuilt, which happens on any change to
+        self.rules; rules themselves are frozen, so entries cannot go stale.
+
+        Args:
+            request: Anthropic-format request
+            agent_type: Agent type from header
+            context_tokens: Estimated context tokens
+
+        Returns:
+            Matching rule or None if no match
+        """
+        agent_type = _agent_name(agent_type)
+        ranges = self._candidates(agent_type)
+        context_range = bisect.bisect_right(self._context_bounds, context_tokens)
+        memo = self._route_memo
+        model = request.get("model", "")
+        thinking = _is_thinking(request)
+        key = None
+        if type(model) is str:
+            key = (
+                model,
+                thinking,
+                agent_type,
+                context_range,
+            )
+            try:
+                return memo[key]
+            except KeyError:
+                pass
+
+        # Same checks as RoutingRule._matches; the bucket already fixes the
+        # agent type and context range, and the mask fully encodes the
+        # thinking requirement
+        req_mask = _THINKING_ON if thinking else _THINKING_OFF
+        model_bits = None
+        rule = None
+        for candidate, mask, pattern_bit in ranges[context_range]:
+            if mask & req_mask != mask:
+                continue
+            if pattern_bit:
+                if model_bits is None:
+                    model_bits = self._pattern_bits(model)
+                if not model_bits & pattern_bit:
+                    continue
+            rule = candidate
+            break
+
+        if key is not None:
+            if len(memo) >= _ROUTE_MEMO_SIZE:
+                memo.clear()
+            memo[key] = rule
+        return rule
+
     def get_matching_rule(
         self,
         request: dict[str, Any],
@@ -156,10 +497,8 @@ class Router:
         Returns:
             Rule name or None if no match
         """
-        for rule in self.rules:
-            if rule.matches(request, agent_type, context_tokens):
-                return rule.name
-        return None
+        rule = self._match(request, agent_type, context_tokens)
+        return rule.name if rule is not None else None
 
     def select_provider(
         self,
@@ -178,14 +517,50 @@ class Router:
         Returns:
             Provider name
         """
-        for rule in self.rules:
-            if rule.matches(request, agent_type, context_tokens):
-                logger.debug(f"Matched rule '{rule.name}' -> provider '{rule.provider}'")
-                return rule.provider
+        rule = self._match(request, agent_type, context_tokens)
+        if rule is not None:
+            logger.debug(f"Matched rule '{rule.name}' -> provider '{rule.provider}'")
+            return rule.provider
 
         logger.debug(f"No rule matched, using default provider '{self.default_provider}'")
         return self.default_provider
 
+    def select_provider_batch(
+        self,
+        requests: Sequence[dict[str, Any]],
+        agent_types: Sequence[str | None] | None = None,
+        context_tokens: Sequence[int] | None = None,
+    ) -> list[str]:
+        """
+        Select providers for several requests at once.
+
+        Equivalent to calling select_provider for each request, without the
+        per-request logging; requests sharing a fingerprint are matched once.
+
+        Args:
+            requests: Anthropic-format requests
+            agent_types: Agent type for each request (default: none)
+            context_tokens: Estimated context tokens for each request (default: 0)
+
+        Returns:
+            Provider name for each request, in order
+        """
+        count = len(requests)
+        if agent_types is None:
+            agent_types = [None] * count
+        if context_tokens is None:
+            context_tokens = [0] * count
+
+        match = self._match
+        default = self.default_provider
+        providers = []
+        for request, agent_type, tokens in zip(requests, agent_types, context_tokens, strict=True):
+            rule = match(request, agent_type, tokens)
+            providers.append(rule.provider if rule is not None else default)
+
+        logger.debug(f"Routed batch of {count} requests")
+        return providers
+
     def to_dict(self) -> dict[str, Any]:
         """Convert router config to dictionary."""
         return {
@@ -195,92 +570,117 @@ class Router:
         }
 
 
-def create_default_router() -> Router:
+@lru_cache(maxsize=8)
+def _default_rules(
+    think_provider: str,
+    long_context_provider: str,
+    long_context_threshold: int,
+    websearch_provider: str,
+    background_provider: str,
+) -> tuple[RoutingRule, ...]:
     """
-    Create router with default rules based on settings.
+    Build the default routing rules, highest priority first.
+
+    Cached per routing configuration so repeated router creation reuses the
+    rules and their compiled patterns; sharing is safe as rules are frozen.
+
+    Args:
+        think_provider: Provider for thinking requests and think agents
+        long_context_provider: Provider for long context requests
+        long_context_threshold: Context tokens at which a request is long
+        websearch_provider: Provider for the web search agent
+        background_provider: Provider for background agents
 
     Returns:
-        Configured router instance
+        Default rules in priority order
     """
-    settings = get_settings()
-    router = Router(default_provider=settings.routing.default_provider)
-
-    # Rule 1: Extended thinking requests
-    router.add_rule(
+    return (
+        # Rule 1: Extended thinking requests
         RoutingRule(
             name="thinking-requests",
-            provider=settings.routing.think_provider,
+            provider=think_provider,
             priority=100,
             thinking_enabled=True,
-        )
-    )
-
-    # Rule 2: Long context requests
-    router.add_rule(
+        ),
+        # Rule 2: Long context requests
         RoutingRule(
             name="long-context",
-            provider=settings.routing.long_context_provider,
+            provider=long_context_provider,
             priority=90,
-            min_context_tokens=settings.routing.long_context_threshold,
-        )
-    )
-
-    # Rule 3: Web search agent
-    router.add_rule(
+            min_context_tokens=long_context_threshold,
+        ),
+        # Rule 3: Web search agent
         RoutingRule(
             name="websearch",
-            provider=settings.routing.websearch_provider,
+            provider=websearch_provider,
             priority=80,
             agent_type="websearch",
-        )
-    )
-
-    # Rule 4: Background agents
-    router.add_rule(
+        ),
+        # Rule 4: Background agents
         RoutingRule(
             name="background",
-            provider=settings.routing.background_provider,
+            provider=background_provider,
             priority=70,
             agent_type="background",
-        )
-    )
-
-    # Rule 5: Think agent type
-    router.add_rule(
+        ),
+        # Rule 5: Think agent type
         RoutingRule(
             name="think-agent",
-            provider=settings.routing.think_provider,
+            provider=think_provider,
             priority=60,
             agent_type="think",
-        )
-    )
-
-    # Rule 6: Opus models to Antigravity (for thinking support)
-    router.add_rule(
+        ),
+        # Rule 6: Opus models to Antigravity (for thinking support)
         RoutingRule(
             name="opus-models",
             provider="antigravity",
             priority=50,
             model_pattern=r".*opus.*",
-        )
+        ),
     )
 
-    return router
+
+def create_default_router() -> Router:
+    """
+    Create router with default rules based on settings.
+
+    Returns:
+        Configured router instance
+    """
+    routing = get_settings().routing
+    rules = _default_rules(
+        routing.think_provider,
+        routing.long_context_provider,
+        routing.long_context_threshold,
+        routing.websearch_provider,
+        routing.background_provider,
+    )
+    return Router(rules=list(rules), default_provider=routing.default_provider)
 
 
 # Global router instance
 _router: Router | None = None
+# Serializes creating and resetting the global router; reads take no lock
+_router_lock = threading.Lock()
 
 
 def get_router() -> Router:
     """Get the global router instance."""
     global _router
-    if _router is None:
-        _router = create_default_router()
-    return _router
+    router = _router
+    if router is not None:
+        return router
+    with _router_lock:
+        if _router is None:
+            _router = create_default_router()
+        return _router
 
 
 def reset_router() -> None:
     """Reset the global router (for testing)."""
     global _router
-    _router = None
+    with _router_lock:
+        router, _router = _router, None
+    if router is not None:
+        # Release the previous router's memoized routes and index
+        router._invalidate()
@@ -30,6 +30,16 @@ class ServerSettings(BaseSettings):
     log_level: str = Field(default="INFO", description="Log level")
     reload: bool = Field(default=False, description="Enable hot reload (dev mode)")
 
+    # WebSocket keep-alive (protocol-level ping frames sent by the ASGI server)
+    ws_ping_interval: float = Field(default=20.0, description="Seconds between WebSocket pings")
+    ws_ping_timeout: float = Field(default=20.0, description="Seconds to wait for a pong")
+    ws_send_timeout: float = Field(
+        default=1.0, description="Seconds a WebSocket send may block before the client is dropped"
+    )
+    ws_max_connections: int = Field(
+        default=1000, description="Concurrent WebSocket connections before new ones are rejected"
+    )
+
     # Debug settings
     debug_enabled: bool = Field(default=True, description="Enable debug endpoints")
     debug_retention_days: int = Field(default=7, description="Days to retain debug data")
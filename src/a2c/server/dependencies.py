@@ -0,0 +1,45 @@
+"""
+Shared FastAPI dependencies for route handlers.
+
+Route handlers declare the application singletons they need as annotated
+parameters instead of calling the global accessors themselves, which also
+lets tests swap them via ``app.dependency_overrides``.
+
+The providers are ``async def`` so FastAPI calls them inline on the event
+loop; plain ``def`` dependencies are dispatched to the threadpool.
+"""
+
+from typing import Annotated
+
+from fastapi import Depends
+
+from a2c.debug import DebugStore, get_debug_store
+from a2c.providers import ProviderRegistry, get_registry
+from a2c.router import Router, get_router
+from a2c.server.config import Settings, get_settings
+
+
+async def provide_settings() -> Settings:
+    """Get the application settings."""
+    return get_settings()
+
+
+async def provide_registry() -> ProviderRegistry:
+    """Get the global provider registry."""
+    return get_registry()
+
+
+async def provide_router() -> Router:
+    """Get the global router."""
+    return get_router()
+
+
+async def provide_debug_store() -> DebugStore:
+    """Get the global debug store."""
+    return get_debug_store()
+
+
+SettingsDep = Annotated[Settings, Depends(provide_settings)]
+RegistryDep = Annotated[ProviderRegistry, Depends(provide_registry)]
+RouterDep = Annotated[Router, Depends(provide_router)]
+DebugStoreDep = Annotated[DebugStore, Depends(provide_debug_store)]
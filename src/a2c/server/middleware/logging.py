@@ -6,8 +6,8 @@ Captures request/response data and stores it in the debug database.
 
 import json
 import logging
+import os
 import time
-import uuid
 from typing import Any
 
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
@@ -62,7 +62,7 @@ class DebugLoggingMiddleware:
             return
 
         # Generate request ID and store in scope state
-        request_id = f"req_{uuid.uuid4().hex[:24]}"
+        request_id = "req_" + os.urandom(12).hex()
         if "state" not in scope:
             scope["state"] = {}
         scope["state"]["request_id"] = request_id
@@ -8,10 +8,9 @@ from typing import Any
 
 from fastapi import APIRouter, Response, status
 
-from a2c.debug import get_debug_store
-from a2c.providers import get_registry
-from a2c.router import get_router
-from a2c.server.config import get_settings, get_settings_dict
+from a2c.providers import STATUS_VALUES
+from a2c.server.config import get_settings_dict
+from a2c.server.dependencies import DebugStoreDep, RegistryDep, RouterDep, SettingsDep
 
 router = APIRouter()
 
@@ -27,20 +26,18 @@ async def get_config() -> dict[str, Any]:
 
 
 @router.get("/providers")
-async def list_providers() -> dict[str, Any]:
+async def list_providers(registry: RegistryDep) -> dict[str, Any]:
     """
     List all registered providers with their status.
     """
-    registry = get_registry()
     return registry.to_dict()
 
 
 @router.get("/providers/{name}")
-async def get_provider(name: str, response: Response) -> dict[str, Any]:
+async def get_provider(name: str, response: Response, registry: RegistryDep) -> dict[str, Any]:
     """
     Get details for a specific provider.
     """
-    registry = get_registry()
     provider = registry.get(name)
 
     if not provider:
@@ -51,13 +48,12 @@ async def get_provider(name: str, response: Response) -> dict[str, Any]:
 
 
 @router.post("/providers/{name}/test")
-async def test_provider(name: str, response: Response) -> dict[str, Any]:
+async def test_provider(name: str, response: Response, registry: RegistryDep) -> dict[str, Any]:
     """
     Test provider connectivity.
 
     Triggers a health check and returns the result.
     """
-    registry = get_registry()
     provider = registry.get(name)
 
     if not provider:
@@ -66,11 +62,12 @@ async def test_provider(name: str, response: Response) -> dict[str, Any]:
 
     health = await provider.health_check()
 
+    status_value = STATUS_VALUES[health.status]
     return {
         "provider": name,
-        "success": health.status.value == "healthy",
+        "success": status_value == "healthy",
         "health": {
-            "status": health.status.value,
+            "status": status_value,
             "latency_ms": health.latency_ms,
             "error": health.error,
         },
@@ -78,16 +75,16 @@ async def test_provider(name: str, response: Response) -> dict[str, Any]:
 
 
 @router.get("/routing/rules")
-async def get_routing_rules() -> dict[str, Any]:
+async def get_routing_rules(routing: RouterDep) -> dict[str, Any]:
     """
     Get current routing rules.
     """
-    routing = get_router()
     return routing.to_dict()
 
 
 @router.get("/routing/test")
 async def test_routing(
+    routing: RouterDep,
     model: str = "claude-opus-4-5",
     thinking: bool = False,
     agent_type: str | None = None,
@@ -102,8 +99,6 @@ async def test_routing(
         agent_type: Agent type header value
         context_tokens: Estimated context tokens
     """
-    routing = get_router()
-
     # Build test request
     test_request = {
         "model": model,
@@ -142,7 +137,11 @@ async def test_routing(
 
 
 @router.get("/stats")
-async def get_stats(hours: int = 24) -> dict[str, Any]:
+async def get_stats(
+    settings: SettingsDep,
+    store: DebugStoreDep,
+    hours: int = 24,
+) -> dict[str, Any]:
     """
     Get server statistics.
 
@@ -151,8 +150,6 @@ async def get_stats(hours: int = 24) -> dict[str, Any]:
     Args:
         hours: Number of hours to look back (default 24)
     """
-    settings = get_settings()
-
     # Return empty stats if database not enabled
     if not settings.database.enabled:
         return {
@@ -163,7 +160,6 @@ async def get_stats(hours: int = 24) -> dict[str, Any]:
             "by_provider": {},
         }
 
-    store = get_debug_store()
     stats = await store.get_stats(hours=hours)
 
     # Calculate success/error counts
@@ -4,26 +4,127 @@ Anthropic Messages API endpoint.
 Handles /v1/messages requests and routes them to the appropriate provider.
 """
 
+import asyncio
 import logging
-import uuid
+import os
+from collections.abc import AsyncIterator
 from typing import Any
 
 from fastapi import APIRouter, Header, Request, Response
 from fastapi.responses import StreamingResponse
 
-from a2c.providers import get_registry
-from a2c.router import get_router
-from a2c.server.config import get_settings
+from a2c.core.helpers import COMPACT_JSON_ENCODER
+from a2c.server.dependencies import RegistryDep, RouterDep
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds of upstream silence before a keep-alive ping is sent on SSE streams
+SSE_PING_INTERVAL = 15.0
+
+# Anthropic-native ping event; clients already ignore it between content events
+SSE_PING_EVENT = b'event: ping\ndata: {"type": "ping"}\n\n'
+
+
+def _error_response(
+    error_type: str,
+    message: str,
+    status_code: int,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Build an Anthropic-style JSON error response.
+
+    Args:
+        error_type: Error type identifier
+        message: Human-readable error message (escaped by the JSON encoder)
+        status_code: HTTP status code
+        headers: Optional extra response headers
+
+    Returns:
+        JSON error response
+    """
+    return Response(
+        content=COMPACT_JSON_ENCODER.encode({"error": {"type": error_type, "message": message}}),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+async def _with_keepalive(
+    stream: AsyncIterator[bytes],
+    interval: float = SSE_PING_INTERVAL,
+) -> AsyncIterator[bytes]:
+    """
+    Forward SSE bytes, emitting ping events while the upstream is idle.
+
+    Long thinking phases can leave the connection silent long enough for
+    intermediate proxies to drop it. Pings are only injected when the last
+    forwarded chunk ended on an event boundary, so passthrough streams that
+    split events across chunks are never corrupted.
+
+    Args:
+        stream: Provider SSE byte stream
+        interval: Idle seconds before a ping is sent
+
+    Yields:
+        SSE event bytes
+    """
+    loop = asyncio.get_running_loop()
+    # Holds at most one upstream chunk, so reads stay paced by the client
+    queue: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(maxsize=1)
+    last_activity = loop.time()
+    at_boundary = True
+
+    async def pump() -> None:
+        try:
+            async for chunk in stream:
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    def on_timer() -> None:
+        # One timer per idle interval for the whole stream, rather than a
+        # timeout armed around every chunk
+        nonlocal timer, last_activity
+        remaining = last_activity + interval - loop.time()
+        if remaining <= 0:
+            if at_boundary and queue.empty():
+                queue.put_nowait(SSE_PING_EVENT)
+            last_activity = loop.time()
+            remaining = interval
+        timer = loop.call_later(remaining, on_timer)
+
+    pump_task = asyncio.ensure_future(pump())
+    timer = loop.call_later(interval, on_timer)
+
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+            if item is not SSE_PING_EVENT:
+                if not item:
+                    continue
+                last_activity = loop.time()
+                at_boundary = item.endswith(b"\n\n")
+            yield item
+    finally:
+        timer.cancel()
+        pump_task.cancel()
+
 
 @router.post("/messages")
 async def create_message(
     request: Request,
-    response: Response,
+    registry: RegistryDep,
+    routing: RouterDep,
     x_api_key: str | None = Header(None),
     anthropic_version: str | None = Header(None, alias="anthropic-version"),
     x_agent_type: str | None = Header(None, alias="x-agent-type"),
@@ -42,22 +143,14 @@ async def create_message(
     Request Body:
         Standard Anthropic Messages API request format
     """
-    settings = get_settings()
-    registry = get_registry()
-    routing = get_router()
-
     # Parse request body
     try:
         body = await request.json()
     except Exception as e:
-        return Response(
-            content=f'{{"error": {{"type": "invalid_request_error", "message": "Invalid JSON: {e}"}}}}',
-            status_code=400,
-            media_type="application/json",
-        )
+        return _error_response("invalid_request_error", f"Invalid JSON: {e}", 400)
 
     # Generate request ID for tracking
-    request_id = f"req_{uuid.uuid4().hex[:24]}"
+    request_id = "req_" + os.urandom(12).hex()
 
     # Determine if streaming
     is_streaming = body.get("stream", False)
@@ -70,11 +163,7 @@ async def create_message(
         )
     except Exception as e:
         logger.error(f"Routing error: {e}")
-        return Response(
-            content=f'{{"error": {{"type": "routing_error", "message": "{e}"}}}}',
-            status_code=500,
-            media_type="application/json",
-        )
+        return _error_response("routing_error", str(e), 500)
 
     # Get provider
     provider = registry.get(provider_name)
@@ -82,11 +171,7 @@ async def create_message(
         # Fallback to first available provider
         providers = registry.list_configured_providers()
         if not providers:
-            return Response(
-                content='{"error": {"type": "configuration_error", "message": "No providers configured"}}',
-                status_code=503,
-                media_type="application/json",
-            )
+            return _error_response("configuration_error", "No providers configured", 503)
         provider = providers[0]
         logger.warning(f"Provider '{provider_name}' not found, using fallback: {provider.name}")
 
@@ -98,11 +183,12 @@ async def create_message(
     # Handle streaming response
     if is_streaming:
         return StreamingResponse(
-            provider.stream_response(body),
+            _with_keepalive(provider.stream_response(body)),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
                 "X-Request-Id": request_id,
                 "X-Provider": provider.name,
             },
@@ -112,32 +198,40 @@ async def create_message(
     result = await provider.send_request(body, stream=False)
 
     if result.error:
-        return Response(
-            content=f'{{"error": {{"type": "provider_error", "message": "{result.error}"}}}}',
-            status_code=result.status_code or 500,
-            media_type="application/json",
+        return _error_response(
+            "provider_error",
+            str(result.error),
+            result.status_code or 500,
             headers={
                 "X-Request-Id": request_id,
                 "X-Provider": provider.name,
             },
         )
 
-    # Add tracking headers
-    response.headers["X-Request-Id"] = request_id
-    response.headers["X-Provider"] = provider.name
+    # Encode once here (or pass upstream bytes through) instead of letting
+    # FastAPI run the body through jsonable_encoder and re-serialize it
+    if result.raw_body is not None:
+        content = result.raw_body
+    else:
+        content = COMPACT_JSON_ENCODER.encode(result.body).encode()
 
-    return result.body
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={
+            "X-Request-Id": request_id,
+            "X-Provider": provider.name,
+        },
+    )
 
 
 @router.get("/models")
-async def list_models() -> dict[str, Any]:
+async def list_models(registry: RegistryDep) -> dict[str, Any]:
     """
     List available models.
 
     Returns models from all configured providers.
     """
-    registry = get_registry()
-
     models = []
 
     for provider in registry.list_configured_providers():
@@ -4,22 +4,69 @@ Debug API endpoints for request inspection and replay.
 Provides REST endpoints for querying and replaying stored requests.
 """
 
+import asyncio
+import json
 import logging
+import time
 import uuid
+import weakref
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-from a2c.debug import get_debug_store
-from a2c.providers import get_registry
-from a2c.server.config import get_settings
+from a2c.core.helpers import COMPACT_JSON_ENCODER
+from a2c.debug import DebugStore
+from a2c.server.dependencies import DebugStoreDep, RegistryDep, SettingsDep
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Dashboards poll stats endpoints frequently; aggregates are reused for this long
+STATS_CACHE_TTL_SECONDS = 2.0
+
+# Keyed per store so entries never outlive or leak across store instances
+_stats_cache: weakref.WeakKeyDictionary[DebugStore, dict[int, tuple[float, dict[str, Any]]]] = (
+    weakref.WeakKeyDictionary()
+)
+_stats_locks: weakref.WeakKeyDictionary[DebugStore, dict[int, asyncio.Lock]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _cached_stats(store: DebugStore, hours: int) -> dict[str, Any]:
+    """
+    Get aggregated stats from the debug store with a short TTL cache.
+
+    Concurrent misses for the same store and period share a single database query.
+
+    Args:
+        store: Debug store to query
+        hours: Number of hours to look back
+
+    Returns:
+        Aggregated stats
+    """
+    entries = _stats_cache.setdefault(store, {})
+    cached = entries.get(hours)
+    if cached and time.monotonic() - cached[0] < STATS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    lock = _stats_locks.setdefault(store, {}).setdefault(hours, asyncio.Lock())
+    async with lock:
+        # Another caller may have refreshed the entry while we waited
+        cached = entries.get(hours)
+        if cached and time.monotonic() - cached[0] < STATS_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        stats = await store.get_stats(hours=hours)
+        entries[hours] = (time.monotonic(), stats)
+        return stats
+
 
 class RequestListResponse(BaseModel):
     """Response for request list endpoint."""
@@ -53,6 +100,8 @@ class CleanupResponse(BaseModel):
 
 @router.get("/requests", response_model=RequestListResponse)
 async def list_requests(
+    settings: SettingsDep,
+    store: DebugStoreDep,
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
     provider: str | None = Query(default=None),
@@ -62,7 +111,7 @@ async def list_requests(
     has_error: bool | None = Query(default=None),
     since: datetime | None = Query(default=None),
     until: datetime | None = Query(default=None),
-) -> RequestListResponse:
+) -> RequestListResponse | Response:
     """
     List stored requests with filtering and pagination.
 
@@ -76,9 +125,10 @@ async def list_requests(
         has_error: Filter by error presence
         since: Filter by created_at >= since
         until: Filter by created_at <= until
-    """
-    settings = get_settings()
 
+    Store results are already JSON-ready, so they are returned directly
+    rather than re-validated through RequestListResponse.
+    """
     # Return empty if database disabled
     if not settings.database.enabled:
         return RequestListResponse(
@@ -89,8 +139,6 @@ async def list_requests(
             has_more=False,
         )
 
-    store = get_debug_store()
-
     result = await store.list_requests(
         limit=limit,
         offset=offset,
@@ -103,26 +151,26 @@ async def list_requests(
         until=until,
     )
 
-    return RequestListResponse(**result)
+    return JSONResponse(result)
 
 
 @router.get("/requests/{request_id}")
-async def get_request(request_id: str) -> dict[str, Any]:
+async def get_request(request_id: str, store: DebugStoreDep) -> dict[str, Any]:
     """
     Get a specific request by ID.
 
     Supports both request_id (req_xxx format) and database UUID.
     Returns full request/response data including headers and bodies.
     """
-    store = get_debug_store()
-
-    # Try to parse as UUID first
-    try:
-        uuid_id = uuid.UUID(request_id)
-        result = await store.get_request_by_uuid(uuid_id)
-    except ValueError:
-        # Not a UUID, try as request_id string
+    # Tracking IDs are the common case; only fall back to UUID parsing otherwise
+    if request_id.startswith("req_"):
         result = await store.get_request(request_id)
+    else:
+        try:
+            uuid_id = uuid.UUID(request_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid request ID") from None
+        result = await store.get_request_by_uuid(uuid_id)
 
     if not result:
         raise HTTPException(status_code=404, detail="Request not found")
@@ -130,44 +178,87 @@ async def get_request(request_id: str) -> dict[str, Any]:
     return result
 
 
+def _encode_event(event: dict[str, Any]) -> bytes:
+    """Serialize one SSE event row compactly."""
+    return COMPACT_JSON_ENCODER.encode(event).encode()
+
+
+async def _events_json(
+    request_id: str,
+    first: dict[str, Any] | None,
+    rows: AsyncIterator[tuple[bool, dict[str, Any] | None]],
+) -> AsyncIterator[bytes]:
+    """Stream the events response as a single JSON object."""
+    yield b'{"request_id":' + json.dumps(request_id).encode() + b',"is_streaming":true,"events":['
+    count = 0
+    if first is not None:
+        yield _encode_event(first)
+        count = 1
+    async for _, event in rows:
+        if event is not None:
+            yield b"," + _encode_event(event)
+            count += 1
+    # Count is only known once the cursor is drained, so it trails the list
+    yield b'],"events_count":' + str(count).encode() + b"}"
+
+
+async def _events_ndjson(
+    first: dict[str, Any] | None,
+    rows: AsyncIterator[tuple[bool, dict[str, Any] | None]],
+) -> AsyncIterator[bytes]:
+    """Stream events as newline-delimited JSON, one event per line."""
+    if first is not None:
+        yield _encode_event(first) + b"\n"
+    async for _, event in rows:
+        if event is not None:
+            yield _encode_event(event) + b"\n"
+
+
 @router.get("/requests/{request_id}/events")
-async def get_request_events(request_id: str) -> dict[str, Any]:
+async def get_request_events(
+    request_id: str,
+    store: DebugStoreDep,
+    accept: str | None = Header(None),
+) -> StreamingResponse:
     """
     Get SSE events for a streaming request.
 
-    Returns ordered list of SSE events with timing information.
+    Returns ordered list of SSE events with timing information. Events are
+    streamed from the database cursor; send ``Accept: application/x-ndjson``
+    to receive one event per line instead of a JSON object.
     """
-    store = get_debug_store()
-
-    # Get request first to verify it exists
-    request = await store.get_request(request_id)
-    if not request:
+    # Existence and the streaming flag arrive with the first row
+    rows = store.iter_sse_events(request_id)
+    first_row = await anext(rows, None)
+    if first_row is None:
         raise HTTPException(status_code=404, detail="Request not found")
 
-    if not request.get("is_streaming"):
+    is_streaming, first = first_row
+    if not is_streaming:
+        await rows.aclose()
         raise HTTPException(status_code=400, detail="Request is not a streaming request")
 
-    events = await store.get_sse_events(request_id)
+    if accept and "application/x-ndjson" in accept:
+        return StreamingResponse(_events_ndjson(first, rows), media_type="application/x-ndjson")
 
-    return {
-        "request_id": request_id,
-        "is_streaming": True,
-        "events_count": len(events),
-        "events": events,
-    }
+    return StreamingResponse(
+        _events_json(request_id, first, rows),
+        media_type="application/json",
+    )
 
 
 @router.post("/requests/{request_id}/replay")
-async def replay_request(request_id: str) -> Response:
+async def replay_request(
+    request_id: str,
+    store: DebugStoreDep,
+    registry: RegistryDep,
+) -> Response:
     """
     Replay a stored request.
 
     Sends the original request to the same provider and returns the response.
     Useful for debugging and testing.
     """
-    store = get_debug_store()
-    registry = get_registry()
-
     # Get the original request
     original = await store.get_request(request_id)
     if not original:
@@ -198,7 +289,7 @@ async def replay_request(request_id: str) -> Response:
 
     if result.error:
         return Response(
-            content=f'{{"error": {{"type": "provider_error", "message": "{result.error}"}}}}',
+            content=json.dumps({"error": {"type": "provider_error", "message": result.error}}),
             status_code=result.status_code or 500,
             media_type="application/json",
             headers={
@@ -208,7 +299,7 @@ async def replay_request(request_id: str) -> Response:
         )
 
     return Response(
-        content=str(result.body) if result.body else "{}",
+        content=json.dumps(result.body) if result.body else "{}",
         status_code=200,
         media_type="application/json",
         headers={
@@ -220,8 +311,10 @@ async def replay_request(request_id: str) -> Response:
 
 @router.get("/stats", response_model=StatsResponse)
 async def get_stats(
+    settings: SettingsDep,
+    store: DebugStoreDep,
     hours: int = Query(default=24, ge=1, le=168),
-) -> StatsResponse:
+) -> StatsResponse | Response:
     """
     Get aggregated statistics for the specified time period.
 
@@ -230,8 +323,6 @@ async def get_stats(
 
     Returns aggregated counts, latency stats, and breakdowns by provider.
     """
-    settings = get_settings()
-
     # Return empty stats if database disabled
     if not settings.database.enabled:
         return StatsResponse(
@@ -245,15 +336,15 @@ async def get_stats(
             by_provider={},
         )
 
-    store = get_debug_store()
+    stats = await _cached_stats(store, hours)
 
-    stats = await store.get_stats(hours=hours)
-
-    return StatsResponse(**stats)
+    return JSONResponse(stats)
 
 
 @router.delete("/cleanup")
 async def cleanup_old_requests(
+    settings: SettingsDep,
+    store: DebugStoreDep,
     days: int | None = Query(default=None, ge=1, le=30),
 ) -> CleanupResponse:
     """
@@ -264,12 +355,10 @@ async def cleanup_old_requests(
 
     Returns count of deleted requests.
     """
-    settings = get_settings()
-    store = get_debug_store()
-
     retention_days = days if days is not None else settings.database.retention_days
 
     deleted = await store.delete_old_requests(days=retention_days)
+    _stats_cache.pop(store, None)
 
     return CleanupResponse(
         deleted=deleted,
@@ -278,17 +367,14 @@ async def cleanup_old_requests(
 
 
 @router.get("/providers")
-async def list_debug_providers() -> dict[str, Any]:
+async def list_debug_providers(registry: RegistryDep, store: DebugStoreDep) -> dict[str, Any]:
     """
     List providers with debug statistics.
 
     Returns provider information with request counts and error rates.
     """
-    store = get_debug_store()
-    registry = get_registry()
-
     # Get stats for last 24 hours
-    stats = await store.get_stats(hours=24)
+    stats = await _cached_stats(store, 24)
     by_provider = stats.get("by_provider", {})
 
     providers = []
@@ -4,17 +4,34 @@ Health check endpoints.
 Provides liveness, readiness, and detailed health information.
 """
 
+import time
 from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, Response, status
 
 from a2c.debug import check_database_health
-from a2c.providers import ProviderStatus, get_registry
-from a2c.server.config import get_settings
+from a2c.providers import STATUS_VALUES
+from a2c.server.dependencies import RegistryDep, SettingsDep
 
 router = APIRouter()
 
+# Probes are polled many times per second; timestamps are reused for this long
+TIMESTAMP_TTL_SECONDS = 1.0
+
+_timestamp_cache: tuple[float, str] = (float("-inf"), "")
+
+
+def _now_iso() -> str:
+    """Get the current UTC time as ISO string, cached for TIMESTAMP_TTL_SECONDS."""
+    global _timestamp_cache
+    now = time.monotonic()
+    cached_at, value = _timestamp_cache
+    if now - cached_at >= TIMESTAMP_TTL_SECONDS:
+        value = datetime.utcnow().isoformat()
+        _timestamp_cache = (now, value)
+    return value
+
 
 @router.get("/live")
 async def liveness() -> dict[str, str]:
@@ -24,94 +41,77 @@ async def liveness() -> dict[str, str]:
     Returns 200 if the server is running.
     Used by orchestrators to check if the process is alive.
     """
-    return {"status": "alive", "timestamp": datetime.utcnow().isoformat()}
+    return {"status": "alive", "timestamp": _now_iso()}
 
 
 @router.get("/ready")
-async def readiness(response: Response) -> dict[str, Any]:
+async def readiness(response: Response, registry: RegistryDep) -> dict[str, Any]:
     """
     Readiness probe.
 
     Returns 200 if the server is ready to accept requests.
     Checks that at least one provider is healthy.
     """
-    registry = get_registry()
-    healthy_providers = registry.list_healthy_providers()
-    configured_providers = registry.list_configured_providers()
+    counts = registry.snapshot_counts()
 
-    is_ready = len(healthy_providers) > 0 or len(configured_providers) > 0
+    is_ready = counts.healthy > 0 or counts.configured > 0
 
     if not is_ready:
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
     return {
         "status": "ready" if is_ready else "not_ready",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _now_iso(),
         "providers": {
-            "total": len(registry.list_providers()),
-            "configured": len(configured_providers),
-            "healthy": len(healthy_providers),
+            "total": counts.total,
+            "configured": counts.configured,
+            "healthy": counts.healthy,
         },
     }
 
 
 @router.get("/providers")
-async def provider_health() -> dict[str, Any]:
+async def provider_health(registry: RegistryDep) -> dict[str, Any]:
     """
     Detailed provider health status.
 
     Returns health information for all registered providers.
     """
-    registry = get_registry()
-
     providers = {}
     for provider in registry.list_providers():
         providers[provider.name] = {
-            "display_name": provider.info.display_name,
+            "display_name": provider.metadata_dict()["display_name"],
             "is_configured": provider.is_configured,
             "is_healthy": provider.is_healthy,
-            "health": {
-                "status": provider.health.status.value,
-                "latency_ms": provider.health.latency_ms,
-                "last_check": provider.health.last_check.isoformat(),
-                "error": provider.health.error,
-            },
-            "capabilities": {
-                "streaming": provider.info.supports_streaming,
-                "thinking": provider.info.supports_thinking,
-                "tools": provider.info.supports_tools,
-                "vision": provider.info.supports_vision,
-                "max_context": provider.info.max_context_tokens,
-            },
+            "health": provider.health_dict(),
+            "capabilities": provider.capabilities_dict(),
         }
 
     # Determine overall status
-    all_healthy = all(p.is_healthy for p in registry.list_providers())
-    any_healthy = any(p.is_healthy for p in registry.list_providers())
+    counts = registry.snapshot_counts()
 
-    if all_healthy:
+    if counts.healthy == counts.total:
         overall = "healthy"
-    elif any_healthy:
+    elif counts.healthy > 0:
         overall = "degraded"
     else:
         overall = "unhealthy"
 
     return {
         "status": overall,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _now_iso(),
         "providers": providers,
     }
 
 
 @router.post("/providers/{name}/check")
-async def check_provider(name: str, response: Response) -> dict[str, Any]:
+async def check_provider(name: str, response: Response, registry: RegistryDep) -> dict[str, Any]:
     """
     Trigger health check for a specific provider.
 
     Args:
         name: Provider name to check
     """
-    registry = get_registry()
     provider = registry.get(name)
 
     if not provider:
@@ -123,7 +123,7 @@ async def check_provider(name: str, response: Response) -> dict[str, Any]:
     return {
         "provider": name,
         "health": {
-            "status": health.status.value,
+            "status": STATUS_VALUES[health.status],
             "latency_ms": health.latency_ms,
             "last_check": health.last_check.isoformat(),
             "error": health.error,
@@ -132,23 +132,13 @@ async def check_provider(name: str, response: Response) -> dict[str, Any]:
 
 
 @router.get("")
-async def health_summary() -> dict[str, Any]:
+async def health_summary(settings: SettingsDep, registry: RegistryDep) -> dict[str, Any]:
     """
     Overall health summary.
 
     Returns a summary of server and provider health.
     """
-    settings = get_settings()
-    registry = get_registry()
-
-    providers = registry.list_providers()
-    healthy = [p for p in providers if p.is_healthy]
-    degraded = [p for p in providers if p.health.status == ProviderStatus.DEGRADED]
-    unhealthy = [
-        p
-        for p in providers
-        if p.health.status in (ProviderStatus.UNHEALTHY, ProviderStatus.UNKNOWN)
-    ]
+    counts = registry.snapshot_counts()
 
     # Check database health if enabled
     database_health = None
@@ -164,16 +154,16 @@ async def health_summary() -> dict[str, Any]:
             "debug": settings.server.debug_enabled,
         },
         "providers": {
-            "total": len(providers),
-            "healthy": len(healthy),
-            "degraded": len(degraded),
-            "unhealthy": len(unhealthy),
+            "total": counts.total,
+            "healthy": counts.healthy,
+            "degraded": counts.degraded,
+            "unhealthy": counts.unhealthy,
             "names": {
-                "healthy": [p.name for p in healthy],
-                "degraded": [p.name for p in degraded],
-                "unhealthy": [p.name for p in unhealthy],
+                "healthy": counts.healthy_names,
+                "degraded": counts.degraded_names,
+                "unhealthy": counts.unhealthy_names,
             },
         },
         "database": database_health,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _now_iso(),
     }
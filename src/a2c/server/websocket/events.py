@@ -9,11 +9,15 @@ Provides real-time updates to connected clients for:
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable, Sequence
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from fastapi import WebSocket
+from fastapi import WebSocket, status
+
+from a2c.core.helpers import COMPACT_JSON_ENCODER
+from a2c.server.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +38,24 @@ class EventType(str, Enum):
     # Stats events
     STATS_UPDATE = "stats.update"
 
+    # Several coalesced events delivered in one frame
+    BATCH = "batch"
+
     # Connection events
     CONNECTED = "connected"
     PING = "ping"
     PONG = "pong"
 
 
+# Resolved once; Enum .value goes through a descriptor on every access
+_BATCH_TYPE = EventType.BATCH.value
+
+
+def _encode(message: dict[str, Any]) -> str:
+    """Serialize a message the same way WebSocket.send_json does."""
+    return COMPACT_JSON_ENCODER.encode(message)
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections and event broadcasting.
@@ -49,35 +65,90 @@ class ConnectionManager:
     - "providers": Provider health and status
     - "stats": Aggregated statistics
     - "all": All events
+
+    Delivery is push-based: the broadcasting (or flushing) coroutine writes
+    to subscribers directly, so a connection needs no sender task or
+    outbound queue of its own. Its handler's receive loop is the only
+    long-lived coroutine per client, and send tasks exist only while a
+    fan-out is in flight.
     """
 
-    def __init__(self) -> None:
-        """Initialize connection manager."""
+    def __init__(
+        self,
+        send_timeout: float = 1.0,
+        batch_window: float = 0.0,
+        max_batch_size: int = 64,
+    ) -> None:
+        """
+        Initialize connection manager.
+
+        Args:
+            send_timeout: Seconds a broadcast waits on one client before dropping it
+            batch_window: Seconds to coalesce events per topic (0 sends immediately)
+            max_batch_size: Queued events per topic that trigger an early flush
+        """
+        self.send_timeout = send_timeout
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._pending: dict[str, list[dict[str, Any]]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
         self.active_connections: dict[str, set[WebSocket]] = {
             "requests": set(),
             "providers": set(),
             "stats": set(),
             "all": set(),
         }
+        # Topics of every subscribed socket, so disconnect only touches those sets
+        self._subscriptions: dict[WebSocket, tuple[str, ...]] = {}
+        # Send method bound once at connect, and whether it takes binary frames
+        # (UTF-8 JSON, encoded once per broadcast) instead of text
+        self._senders: dict[WebSocket, tuple[Callable[[Any], Awaitable[None]], bool]] = {}
         self._lock = asyncio.Lock()
-
-    async def connect(self, websocket: WebSocket, topics: list[str] | None = None) -> None:
+        # Encoded /ws/connections body, reused until subscriptions change
+        self._info_cache: bytes | None = None
+        # Background closes of evicted slow clients (kept referenced until done)
+        self._closing: set[asyncio.Task[None]] = set()
+
+    def _recipients(self, topic: str) -> list[WebSocket]:
+        """Snapshot the sockets subscribed to a topic or to "all"."""
+        everyone = self.active_connections["all"]
+        connections = self.active_connections.get(topic)
+        if not connections or connections is everyone:
+            return list(everyone)
+        if not everyone:
+            return list(connections)
+        return list(connections | everyone)
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        topics: Sequence[str] | None = None,
+        binary: bool = False,
+    ) -> None:
         """
         Accept WebSocket connection and subscribe to topics.
 
         Args:
             websocket: WebSocket connection
             topics: List of topics to subscribe (defaults to ["all"])
+            binary: Send events as binary frames instead of text frames
         """
         await websocket.accept()
 
         if topics is None:
-            topics = ["all"]
+            topics = ("all",)
+
+        self._senders[websocket] = (
+            (websocket.send_bytes, True) if binary else (websocket.send_text, False)
+        )
 
         async with self._lock:
-            for topic in topics:
-                if topic in self.active_connections:
-                    self.active_connections[topic].add(websocket)
+            subscribed = tuple(topic for topic in topics if topic in self.active_connections)
+            for topic in subscribed:
+                self.active_connections[topic].add(websocket)
+            if subscribed:
+                self._subscriptions[websocket] = subscribed
+                self._info_cache = None
 
         # Send connected confirmation
         await self._send_event(
@@ -89,7 +160,7 @@ class ConnectionManager:
             },
         )
 
-        logger.debug(f"WebSocket connected, topics: {topics}")
+        logger.debug("WebSocket connected, topics: %s", topics)
 
     async def disconnect(self, websocket: WebSocket) -> None:
         """
@@ -99,8 +170,13 @@ class ConnectionManager:
             websocket: WebSocket connection to remove
         """
         async with self._lock:
-            for connections in self.active_connections.values():
-                connections.discard(websocket)
+            self._senders.pop(websocket, None)
+            topics = self._subscriptions.pop(websocket, None)
+            if topics is None:
+                return
+            for topic in topics:
+                self.active_connections[topic].discard(websocket)
+            self._info_cache = None
 
         logger.debug("WebSocket disconnected")
 
@@ -113,39 +189,116 @@ class ConnectionManager:
         """
         Broadcast event to all connections on a topic.
 
+        With batching enabled, the event is queued and delivered by the next
+        flush; otherwise it is sent immediately.
+
         Args:
             event_type: Type of event
             data: Event payload
             topic: Topic to broadcast to
         """
-        # Get connections for this topic and "all"
-        async with self._lock:
-            connections = set(self.active_connections.get(topic, set()))
-            connections.update(self.active_connections.get("all", set()))
-
-        if not connections:
+        # Skip building the message when nobody would receive it
+        if not self.active_connections.get(topic) and not self.active_connections["all"]:
             return
 
-        # Create message
         message = {
             "type": event_type.value,
             "data": data,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
-        # Send to all connections
-        disconnected = []
+        if self.batch_window <= 0:
+            await self._fan_out(topic, [message])
+            return
+
+        pending = self._pending.setdefault(topic, [])
+        pending.append(message)
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        elif len(pending) >= self.max_batch_size:
+            # Bound latency under bursts: deliver a full batch right away
+            await self._fan_out(topic, self._pending.pop(topic))
+
+    async def flush(self) -> None:
+        """Deliver all queued events immediately."""
+        pending, self._pending = self._pending, {}
+        for topic, messages in pending.items():
+            await self._fan_out(topic, messages)
+
+    async def _flush_after_window(self) -> None:
+        """Wait for the batch window, then flush."""
+        await asyncio.sleep(self.batch_window)
+        await self.flush()
+
+    async def _fan_out(self, topic: str, messages: list[dict[str, Any]]) -> None:
+        """Send queued messages for a topic as a single frame to its recipients."""
+        connections = self._recipients(topic)
+        if not connections:
+            return
+
+        # Serialize once for all recipients; coalesced events share one frame
+        if len(messages) == 1:
+            text = _encode(messages[0])
+        else:
+            text = _encode(
+                {
+                    "type": _BATCH_TYPE,
+                    "data": {"events": messages},
+                    "timestamp": messages[-1]["timestamp"],
+                }
+            )
+
+        payload: bytes | None = None
+        senders = self._senders
+
+        # One task per connection and a single shared deadline: sends that
+        # finish immediately cost no timer, and one slow client can't stall
+        # the rest
+        sends: dict[asyncio.Future[None], WebSocket] = {}
         for websocket in connections:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.debug(f"Failed to send to WebSocket: {e}")
-                disconnected.append(websocket)
+            send, binary = senders[websocket]
+            if binary:
+                if payload is None:
+                    payload = text.encode()
+                sends[asyncio.ensure_future(send(payload))] = websocket
+            else:
+                sends[asyncio.ensure_future(send(text))] = websocket
+        done, pending = await asyncio.wait(sends, timeout=self.send_timeout)
+
+        disconnected = []
+        for task in pending:
+            task.cancel()
+            logger.debug("WebSocket send timed out")
+            websocket = sends[task]
+            disconnected.append(websocket)
+            self._evict(websocket)
+        for task in done:
+            error = task.exception()
+            if error is not None:
+                logger.debug("Failed to send to WebSocket: %r", error)
+                disconnected.append(sends[task])
 
         # Clean up disconnected
         for websocket in disconnected:
             await self.disconnect(websocket)
 
+    def _evict(self, websocket: WebSocket) -> None:
+        """Close a client that can't keep up, without blocking the broadcast."""
+        task = asyncio.ensure_future(self._close_slow_client(websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_slow_client(self, websocket: WebSocket) -> None:
+        """Close a slow client with 1011, giving up after send_timeout."""
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=status.WS_1011_INTERNAL_ERROR),
+                timeout=self.send_timeout,
+            )
+        except Exception as e:
+            logger.debug("Failed to close slow WebSocket: %r", e)
+
     async def broadcast_request_started(
         self,
         request_id: str,
@@ -239,23 +392,46 @@ class ConnectionManager:
         data: dict[str, Any],
     ) -> None:
         """Send event to specific connection."""
-        message = {
-            "type": event_type.value,
-            "data": data,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        text = _encode(
+            {
+                "type": event_type.value,
+                "data": data,
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+        )
         try:
-            await websocket.send_json(message)
+            send, binary = self._senders[websocket]
+            await asyncio.wait_for(
+                send(text.encode() if binary else text), timeout=self.send_timeout
+            )
         except Exception as e:
-            logger.debug(f"Failed to send event: {e}")
+            logger.debug("Failed to send event: %s", e)
 
     @property
     def connection_count(self) -> int:
         """Get total unique connection count."""
-        all_connections: set[WebSocket] = set()
-        for connections in self.active_connections.values():
-            all_connections.update(connections)
-        return len(all_connections)
+        return len(self._subscriptions)
+
+    def connection_info_json(self) -> bytes:
+        """
+        Get connection count and per-topic subscriptions as encoded JSON.
+
+        The body is cached and only rebuilt after a subscription change.
+
+        Returns:
+            UTF-8 JSON bytes
+        """
+        if self._info_cache is None:
+            self._info_cache = _encode(
+                {
+                    "total_connections": self.connection_count,
+                    "topics": {
+                        topic: len(connections)
+                        for topic, connections in self.active_connections.items()
+                    },
+                }
+            ).encode()
+        return self._info_cache
 
 
 # Global connection manager
@@ -266,5 +442,8 @@ def get_connection_manager() -> ConnectionManager:
     """Get the global connection manager."""
     global _manager
     if _manager is None:
-        _manager = ConnectionManager()
+        _manager = ConnectionManager(
+            send_timeout=get_settings().server.ws_send_timeout,
+            batch_window=0.005,
+        )
     return _manager
@@ -5,17 +5,116 @@ Provides WebSocket endpoints for real-time updates.
 """
 
 import asyncio
+import json
 import logging
+from functools import lru_cache
 from typing import Any
 
-from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Query, Response, WebSocket, WebSocketDisconnect, status
 
+from a2c.server.config import get_settings
 from a2c.server.websocket.events import EventType, get_connection_manager
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Process-wide singleton, resolved once instead of on every connection
+_manager = get_connection_manager()
+
+# Connection slots; clients beyond the limit are turned away instead of
+# piling up unbounded
+_slots = asyncio.Semaphore(get_settings().server.ws_max_connections)
+
+# Client heartbeat as sent by the dashboard (JSON.stringify({type: "ping"}))
+_PING_TEXT = '{"type":"ping"}'
+_PONG_TYPE = EventType.PONG.value
+_PONG_TEXT = json.dumps({"type": _PONG_TYPE, "data": {}}, separators=(",", ":"))
+
+# Control frames for clients using binary encoding; JSON pings sent as
+# binary frames get the JSON pong back in the same framing
+_PING_BYTES = b"ping"
+_PONG_BYTES = b"pong"
+_PING_JSON_BYTES = _PING_TEXT.encode()
+_PONG_JSON_BYTES = _PONG_TEXT.encode()
+
+_REQUESTS_TOPICS = ("requests",)
+
+
+def _is_ping(message: str) -> bool:
+    """Check whether a client message is an application-level ping."""
+    if message == _PING_TEXT:
+        return True
+    # Only parse messages that could possibly be a ping
+    if '"ping"' not in message:
+        return False
+    try:
+        data = json.loads(message)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and data.get("type") == "ping"
+
+
+@lru_cache(maxsize=64)
+def _parse_topics(topics: str) -> tuple[str, ...]:
+    """Split the topics query parameter; clients reuse a handful of values."""
+    return tuple(t.strip() for t in topics.split(","))
+
+
+async def _reply_to_ping(websocket: WebSocket, message: dict[str, Any]) -> None:
+    """Answer a text or binary client ping received as a raw ASGI message."""
+    data = message.get("bytes")
+    if data is not None:
+        if data == _PING_BYTES:
+            await websocket.send_bytes(_PONG_BYTES)
+        elif data == _PING_JSON_BYTES:
+            await websocket.send_bytes(_PONG_JSON_BYTES)
+        return
+    text = message.get("text")
+    if text is not None and _is_ping(text):
+        await websocket.send_text(_PONG_TEXT)
+
+
+async def _serve(websocket: WebSocket, topics: tuple[str, ...], binary: bool) -> None:
+    """
+    Subscribe a client and answer its pings until it disconnects.
+
+    Clients arriving while all connection slots are taken are closed with
+    1013 (try again later).
+
+    Args:
+        websocket: WebSocket connection
+        topics: Topics to subscribe to
+        binary: Send events as binary frames
+    """
+    if _slots.locked():
+        await websocket.accept()
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
+    # Holding the slot for the whole session guarantees release on any exit
+    async with _slots:
+        await _manager.connect(websocket, topics, binary=binary)
+
+        try:
+            # Idle connections are kept alive by the server's protocol-level
+            # ping frames; only answer explicit client pings here. A normal
+            # close arrives as a disconnect message and ends the loop without
+            # raising.
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                await _reply_to_ping(websocket, message)
+
+        except WebSocketDisconnect:
+            # Only reachable if a pong races the client closing
+            pass
+        except Exception as e:
+            logger.debug("WebSocket error: %s", e)
+        finally:
+            await _manager.disconnect(websocket)
+
 
 @router.websocket("/live")
 async def websocket_live(
@@ -23,12 +122,14 @@ async def websocket_live(
     topics: str = Query(
         default="all", description="Comma-separated topics: requests,providers,stats,all"
     ),
+    encoding: str = Query(default="text", description="Frame encoding: text or binary"),
 ) -> None:
     """
     WebSocket endpoint for live updates.
 
     Query Parameters:
         topics: Comma-separated list of topics to subscribe to
+        encoding: "binary" to receive events as UTF-8 JSON in binary frames
 
     Events sent:
         - connected: Initial connection confirmation
@@ -39,90 +140,29 @@ async def websocket_live(
         - stats.update: Stats update
 
     Messages received:
-        - ping: Respond with pong
+        - ping: Respond with pong (binary clients send b"ping" and get b"pong")
     """
-    manager = get_connection_manager()
-    topic_list = [t.strip() for t in topics.split(",")]
-
-    await manager.connect(websocket, topic_list)
-
-    try:
-        while True:
-            try:
-                # Receive messages (for ping/pong)
-                data = await asyncio.wait_for(websocket.receive_json(), timeout=30)
-
-                if data.get("type") == "ping":
-                    await websocket.send_json(
-                        {
-                            "type": EventType.PONG.value,
-                            "data": {},
-                        }
-                    )
-
-            except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                try:
-                    await websocket.send_json(
-                        {
-                            "type": EventType.PING.value,
-                            "data": {},
-                        }
-                    )
-                except Exception:
-                    break
-
-    except WebSocketDisconnect:
-        pass
-    except Exception as e:
-        logger.debug(f"WebSocket error: {e}")
-    finally:
-        await manager.disconnect(websocket)
+    await _serve(websocket, _parse_topics(topics), binary=encoding == "binary")
 
 
 @router.websocket("/requests/stream")
-async def websocket_requests_stream(websocket: WebSocket) -> None:
+async def websocket_requests_stream(
+    websocket: WebSocket,
+    encoding: str = Query(default="text", description="Frame encoding: text or binary"),
+) -> None:
     """
     WebSocket endpoint specifically for request events.
 
     Subscribes only to the "requests" topic.
     """
-    manager = get_connection_manager()
-
-    await manager.connect(websocket, ["requests"])
-
-    try:
-        while True:
-            try:
-                data = await asyncio.wait_for(websocket.receive_json(), timeout=30)
-                if data.get("type") == "ping":
-                    await websocket.send_json({"type": EventType.PONG.value, "data": {}})
-            except asyncio.TimeoutError:
-                try:
-                    await websocket.send_json({"type": EventType.PING.value, "data": {}})
-                except Exception:
-                    break
-
-    except WebSocketDisconnect:
-        pass
-    except Exception as e:
-        logger.debug(f"WebSocket error: {e}")
-    finally:
-        await manager.disconnect(websocket)
+    await _serve(websocket, _REQUESTS_TOPICS, binary=encoding == "binary")
 
 
 @router.get("/connections")
-async def get_connections() -> dict[str, Any]:
+async def get_connections() -> Response:
     """
     Get WebSocket connection info.
 
     Returns current connection count and topic subscriptions.
     """
-    manager = get_connection_manager()
-
-    return {
-        "total_connections": manager.connection_count,
-        "topics": {
-            topic: len(connections) for topic, connections in manager.active_connections.items()
-        },
-    }
+    return Response(content=_manager.connection_info_json(), media_type="application/json")
@@ -22,6 +22,34 @@ logger = logging.getLogger(__name__)
 DEFAULT_THINKING_BUDGET = 1024
 DEFAULT_TEMPERATURE = 0.4
 
+# Downstream models that are passed through unchanged
+_SUPPORTED_MODELS = frozenset(
+    {
+        "gemini-2.5-flash",
+        "gemini-2.5-flash-thinking",
+        "gemini-2.5-pro",
+        "gemini-3-pro-low",
+        "gemini-3-pro-high",
+        "gemini-3-pro-image",
+        "gemini-2.5-flash-lite",
+        "gemini-2.5-flash-image",
+        "claude-sonnet-4-5",
+        "claude-sonnet-4-5-thinking",
+        "claude-opus-4-5-thinking",
+        "gpt-oss-120b-medium",
+    }
+)
+
+# Fixed mappings for legacy and alias Claude model names
+_CLAUDE_MODEL_MAP = {
+    "claude-sonnet-4.5": "claude-sonnet-4-5",
+    "claude-3-5-sonnet-20241022": "claude-sonnet-4-5",
+    "claude-3-5-sonnet-20240620": "claude-sonnet-4-5",
+    "claude-opus-4": "gemini-3-pro-high",
+    "claude-haiku-4": "claude-haiku-4.5",
+    "claude-3-haiku-20240307": "gemini-2.5-flash",
+}
+
 
 def _is_non_whitespace_text(value: Any) -> bool:
     """
@@ -34,12 +62,17 @@ def _is_non_whitespace_text(value: Any) -> bool:
     This filters out whitespace-only text parts to avoid 400 errors:
     `messages: text content blocks must contain non-whitespace text`
     """
+    # str.isspace uses the same whitespace definition as strip() but does
+    # not build a stripped copy of the text
+    if type(value) is str:
+        return bool(value) and not value.isspace()
     if value is None:
         return False
     try:
-        return bool(str(value).strip())
+        text = str(value)
     except Exception:
         return False
+    return bool(text) and not text.isspace()
 
 
 def get_thinking_config(
@@ -101,34 +134,10 @@ def map_claude_model_to_gemini(claude_model: str) -> str:
     if claude_model == "claude-haiku-4-5":
         return "gemini-2.5-flash"
 
-    supported_models = {
-        "gemini-2.5-flash",
-        "gemini-2.5-flash-thinking",
-        "gemini-2.5-pro",
-        "gemini-3-pro-low",
-        "gemini-3-pro-high",
-        "gemini-3-pro-image",
-        "gemini-2.5-flash-lite",
-        "gemini-2.5-flash-image",
-        "claude-sonnet-4-5",
-        "claude-sonnet-4-5-thinking",
-        "claude-opus-4-5-thinking",
-        "gpt-oss-120b-medium",
-    }
-
-    if claude_model in supported_models:
+    if claude_model in _SUPPORTED_MODELS:
         return claude_model
 
-    model_mapping = {
-        "claude-sonnet-4.5": "claude-sonnet-4-5",
-        "claude-3-5-sonnet-20241022": "claude-sonnet-4-5",
-        "claude-3-5-sonnet-20240620": "claude-sonnet-4-5",
-        "claude-opus-4": "gemini-3-pro-high",
-        "claude-haiku-4": "claude-haiku-4.5",
-        "claude-3-haiku-20240307": "gemini-2.5-flash",
-    }
-
-    return model_mapping.get(claude_model, "claude-sonnet-4-5")
+    return _CLAUDE_MODEL_MAP.get(claude_model, "claude-sonnet-4-5")
 
 
 def clean_json_schema(schema: Any) -> Any:
@@ -4,26 +4,37 @@ Integration tests for API endpoints.
 Tests the health, admin, and debug API endpoints.
 """
 
+import json
 import os
 
 import pytest
+from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
 # Set database to disabled for tests
 os.environ["A2C_DATABASE_ENABLED"] = "false"
 
+from a2c.providers import ProviderResponse
 from a2c.server.app import create_app
+from a2c.server.dependencies import provide_registry, provide_router
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app():
-    """Create test application."""
+    """Create the test application once for the module."""
     return create_app()
 
 
+@pytest.fixture(autouse=True)
+def reset_overrides(app):
+    """Drop dependency overrides installed by a test."""
+    yield
+    app.dependency_overrides.clear()
+
+
 @pytest.fixture
 async def client(app):
-    """Create async test client."""
+    """Create async test client (cheap: in-process transport, shared app)."""
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
@@ -146,6 +157,75 @@ class TestDebugEndpoints:
         assert data["total_errors"] == 0
 
 
+class StubProvider:
+    """Provider double returning a canned non-streaming response."""
+
+    name = "stub"
+
+    def __init__(self, result: ProviderResponse):
+        self.result = result
+
+    async def send_request(self, request: dict, stream: bool = False) -> ProviderResponse:
+        return self.result
+
+
+class StubRegistry:
+    """Registry double holding a single provider."""
+
+    def __init__(self, provider: StubProvider):
+        self.provider = provider
+
+    def get(self, name: str) -> StubProvider | None:
+        return self.provider if name == self.provider.name else None
+
+
+class StubRouter:
+    """Router double that always selects the stub provider."""
+
+    def select_provider(self, request: dict, agent_type: str | None = None) -> str:
+        return "stub"
+
+
+class TestMessagesEndpoint:
+    """Tests for the non-streaming /v1/messages path."""
+
+    def _install(self, app, result: ProviderResponse) -> None:
+        app.dependency_overrides[provide_registry] = lambda: StubRegistry(StubProvider(result))
+        app.dependency_overrides[provide_router] = lambda: StubRouter()
+
+    async def test_encodes_body(self, app, client: AsyncClient):
+        """Test provider body is returned as JSON with tracking headers."""
+        self._install(app, ProviderResponse(status_code=200, headers={}, body={"id": "msg_1"}))
+
+        response = await client.post("/v1/messages", json={"model": "m", "messages": []})
+
+        assert response.status_code == 200
+        assert response.json() == {"id": "msg_1"}
+        assert response.headers["X-Provider"] == "stub"
+        assert response.headers["X-Request-Id"].startswith("req_")
+
+    async def test_passes_raw_body_through(self, app, client: AsyncClient):
+        """Test upstream bytes are forwarded unchanged when available."""
+        raw = b'{"id": "msg_raw"}'
+        self._install(
+            app,
+            ProviderResponse(status_code=200, headers={}, body={"id": "msg_raw"}, raw_body=raw),
+        )
+
+        response = await client.post("/v1/messages", json={"model": "m", "messages": []})
+
+        assert response.content == raw
+
+    async def test_provider_error(self, app, client: AsyncClient):
+        """Test provider errors are returned as JSON error bodies."""
+        self._install(app, ProviderResponse(status_code=502, headers={}, error='bad "gateway"'))
+
+        response = await client.post("/v1/messages", json={"model": "m", "messages": []})
+
+        assert response.status_code == 502
+        assert response.json()["error"]["message"] == 'bad "gateway"'
+
+
 class TestWebSocketEndpoints:
     """Tests for WebSocket endpoints."""
 
@@ -157,6 +237,39 @@ class TestWebSocketEndpoints:
         assert "total_connections" in data
         assert "topics" in data
 
+    def test_live_ping_pong(self, app):
+        """Test client pings are answered with pong on the live socket."""
+        with TestClient(app).websocket_connect("/ws/live?topics=stats") as ws:
+            assert ws.receive_json()["type"] == "connected"
+
+            ws.send_text('{"type":"ping"}')
+            assert ws.receive_json() == {"type": "pong", "data": {}}
+
+            ws.send_text('{"type": "subscribe"}')
+            ws.send_text("not json")
+            ws.send_text('{"type": "ping"}')
+            assert ws.receive_json()["type"] == "pong"
+
+    def test_requests_stream_subscribes_requests(self, app):
+        """Test the request stream subscribes to the requests topic only."""
+        with TestClient(app).websocket_connect("/ws/requests/stream") as ws:
+            connected = ws.receive_json()
+            assert connected["data"]["topics"] == ["requests"]
+
+            ws.send_text('{"type":"ping"}')
+            assert ws.receive_json()["type"] == "pong"
+
+    def test_live_binary_encoding(self, app):
+        """Test binary clients get binary frames and byte-level pongs."""
+        with TestClient(app).websocket_connect("/ws/live?topics=stats&encoding=binary") as ws:
+            assert json.loads(ws.receive_bytes())["type"] == "connected"
+
+            ws.send_bytes(b"ping")
+            assert ws.receive_bytes() == b"pong"
+
+            ws.send_bytes(b'{"type":"ping"}')
+            assert json.loads(ws.receive_bytes()) == {"type": "pong", "data": {}}
+
 
 class TestOpenAPIEndpoints:
     """Tests for OpenAPI documentation endpoints."""
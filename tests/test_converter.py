@@ -12,8 +12,12 @@ These tests cover:
 import pytest
 
 from antigravity2claudecode.converter import (
+    _CLAUDE_MODEL_MAP,
+    _SUPPORTED_MODELS,
     DEFAULT_TEMPERATURE,
     DEFAULT_THINKING_BUDGET,
+    _extract_tool_result_output,
+    _is_non_whitespace_text,
     build_generation_config,
     build_system_instruction,
     clean_json_schema,
@@ -25,74 +29,152 @@ from antigravity2claudecode.converter import (
     reorganize_tool_messages,
 )
 
+# Fixed message payloads, built once at import. The converters only read
+# their input, so tests pass shallow list copies of these tuples.
+_MSG_USER_HELLO = ({"role": "user", "content": "Hello"},)
+_MSG_ASSISTANT_HI = ({"role": "assistant", "content": "Hi there"},)
+_MSG_USER_WHITESPACE = ({"role": "user", "content": "   "},)
+_MSG_ASSISTANT_THINKING = (
+    {
+        "role": "assistant",
+        "content": [
+            {"type": "thinking", "thinking": "Let me think...", "signature": "sig1"},
+            {"type": "text", "text": "Here is my answer"},
+        ],
+    },
+)
+_MSG_ASSISTANT_UNSIGNED_THINKING = (
+    {
+        "role": "assistant",
+        "content": [
+            {"type": "thinking", "thinking": "No signature"},
+            {"type": "text", "text": "Answer"},
+        ],
+    },
+)
+_MSG_ASSISTANT_TOOL_USE = (
+    {
+        "role": "assistant",
+        "content": [{"type": "tool_use", "id": "tool_1", "name": "search", "input": {"q": "test"}}],
+    },
+)
+_MSG_USER_TOOL_RESULT = (
+    {
+        "role": "user",
+        "content": [{"type": "tool_result", "tool_use_id": "tool_1", "content": "Result"}],
+    },
+)
+_MSG_USER_IMAGE = (
+    {
+        "role": "user",
+        "content": [
+            {
+                "type": "image",
+                "source": {"type": "base64", "media_type": "image/png", "data": "base64data"},
+            }
+        ],
+    },
+)
+_MSG_ASSISTANT_NULL_THINKING = (
+    {
+        "role": "assistant",
+        "content": [{"type": "thinking", "thinking": None, "signature": "sig"}],
+    },
+)
+_MSG_ASSISTANT_REDACTED_THINKING = (
+    {
+        "role": "assistant",
+        "content": [{"type": "redacted_thinking", "data": "redacted", "signature": "sig"}],
+    },
+)
+_MSG_ASSISTANT_UNSIGNED_REDACTED_THINKING = (
+    {
+        "role": "assistant",
+        "content": [
+            {"type": "redacted_thinking", "data": "redacted"},
+            {"type": "text", "text": "visible"},
+        ],
+    },
+)
+_MSG_USER_CUSTOM_BLOCK = ({"role": "user", "content": [{"type": "custom", "data": "value"}]},)
+_MSG_USER_NON_DICT_ITEMS = ({"role": "user", "content": ["plain string", 123]},)
+_MSG_USER_NUMBER = ({"role": "user", "content": 42},)
+
+_CONTENTS_TOOL_PAIR = (
+    {
+        "role": "model",
+        "parts": [{"functionCall": {"id": "t1", "name": "search", "args": {}}}],
+    },
+    {
+        "role": "user",
+        "parts": [
+            {"functionResponse": {"id": "t1", "name": "search", "response": {"output": "result"}}}
+        ],
+    },
+)
 
-class TestModelMapping:
-    """Tests for map_claude_model_to_gemini"""
-
-    def test_empty_model_defaults_to_sonnet(self):
-        """Empty model should default to claude-sonnet-4-5"""
-        assert map_claude_model_to_gemini("") == "claude-sonnet-4-5"
-        assert map_claude_model_to_gemini(None) == "claude-sonnet-4-5"
-
-    def test_opus_maps_to_thinking(self):
-        """claude-opus-4-5 should map to thinking variant"""
-        assert map_claude_model_to_gemini("claude-opus-4-5") == "claude-opus-4-5-thinking"
 
-    def test_sonnet_maps_to_itself(self):
-        """claude-sonnet-4-5 should stay as is"""
-        assert map_claude_model_to_gemini("claude-sonnet-4-5") == "claude-sonnet-4-5"
+def _first_part(contents):
+    """Return the first part of the first converted message."""
+    return contents[0]["parts"][0]
 
-    def test_haiku_maps_to_gemini_flash(self):
-        """claude-haiku-4-5 should map to gemini-2.5-flash"""
-        assert map_claude_model_to_gemini("claude-haiku-4-5") == "gemini-2.5-flash"
 
-    def test_versioned_model_names_normalized(self):
-        """Versioned model names like claude-opus-4-5-20251101 should be normalized"""
-        assert map_claude_model_to_gemini("claude-opus-4-5-20251101") == "claude-opus-4-5-thinking"
-        assert map_claude_model_to_gemini("claude-sonnet-4-5-20241022") == "claude-sonnet-4-5"
+class TestModelMapping:
+    """Tests for map_claude_model_to_gemini"""
 
-    def test_supported_models_passthrough(self):
+    @pytest.mark.parametrize(
+        "model,expected",
+        [
+            # Empty model defaults to sonnet
+            ("", "claude-sonnet-4-5"),
+            (None, "claude-sonnet-4-5"),
+            # Claude 4.5 aliases
+            ("claude-opus-4-5", "claude-opus-4-5-thinking"),
+            ("claude-sonnet-4-5", "claude-sonnet-4-5"),
+            ("claude-haiku-4-5", "gemini-2.5-flash"),
+            # Version-dated names are normalized
+            ("claude-opus-4-5-20251101", "claude-opus-4-5-thinking"),
+            ("claude-sonnet-4-5-20241022", "claude-sonnet-4-5"),
+            # Unknown models fall back to sonnet
+            ("unknown-model", "claude-sonnet-4-5"),
+        ],
+    )
+    def test_mapping(self, model, expected):
+        """Model names should map to the expected downstream model"""
+        assert map_claude_model_to_gemini(model) == expected
+
+    @pytest.mark.parametrize("model", sorted(_SUPPORTED_MODELS))
+    def test_supported_models_passthrough(self, model):
         """Supported models should pass through unchanged"""
-        assert map_claude_model_to_gemini("gemini-2.5-flash") == "gemini-2.5-flash"
-        assert map_claude_model_to_gemini("gemini-2.5-pro") == "gemini-2.5-pro"
+        assert map_claude_model_to_gemini(model) == model
 
-    def test_legacy_model_mapping(self):
-        """Legacy model names should map correctly"""
-        assert map_claude_model_to_gemini("claude-3-5-sonnet-20241022") == "claude-sonnet-4-5"
-        assert map_claude_model_to_gemini("claude-3-haiku-20240307") == "gemini-2.5-flash"
+    @pytest.mark.parametrize("model,expected", sorted(_CLAUDE_MODEL_MAP.items()))
+    def test_legacy_model_mapping(self, model, expected):
+        """Every legacy and alias name in the mapping table should map correctly"""
+        assert map_claude_model_to_gemini(model) == expected
 
 
 class TestThinkingConfig:
     """Tests for get_thinking_config"""
 
-    def test_none_enables_thinking_with_default_budget(self):
-        """None should enable thinking with default budget"""
-        config = get_thinking_config(None)
-        assert config["includeThoughts"] is True
-        assert config["thinkingBudget"] == DEFAULT_THINKING_BUDGET
-
-    def test_true_enables_thinking(self):
-        """True should enable thinking with default budget"""
-        config = get_thinking_config(True)
-        assert config["includeThoughts"] is True
-        assert config["thinkingBudget"] == DEFAULT_THINKING_BUDGET
-
-    def test_false_disables_thinking(self):
-        """False should disable thinking"""
-        config = get_thinking_config(False)
-        assert config["includeThoughts"] is False
-        assert "thinkingBudget" not in config
-
-    def test_dict_enabled_with_budget(self):
-        """Dict with type=enabled should use provided budget"""
-        config = get_thinking_config({"type": "enabled", "budget_tokens": 5000})
-        assert config["includeThoughts"] is True
-        assert config["thinkingBudget"] == 5000
-
-    def test_dict_disabled(self):
-        """Dict with type=disabled should disable thinking"""
-        config = get_thinking_config({"type": "disabled"})
-        assert config["includeThoughts"] is False
+    @pytest.mark.parametrize(
+        "thinking,include_thoughts,budget",
+        [
+            # None and True enable thinking with the default budget
+            (None, True, DEFAULT_THINKING_BUDGET),
+            (True, True, DEFAULT_THINKING_BUDGET),
+            # Dict with type=enabled uses the provided budget
+            ({"type": "enabled", "budget_tokens": 5000}, True, 5000),
+            # False and type=disabled turn thinking off without a budget
+            (False, False, None),
+            ({"type": "disabled"}, False, None),
+        ],
+    )
+    def test_thinking_config(self, thinking, include_thoughts, budget):
+        """Thinking values should produce the expected thinkingConfig"""
+        config = get_thinking_config(thinking)
+        assert config["includeThoughts"] is include_thoughts
+        assert config.get("thinkingBudget") == budget
 
 
 class TestCleanJsonSchema:
@@ -177,132 +259,59 @@ class TestConvertMessagesToContents:
 
     def test_user_role_stays_user(self):
         """User role should stay as user"""
-        messages = [{"role": "user", "content": "Hello"}]
-        contents = convert_messages_to_contents(messages)
+        contents = convert_messages_to_contents(list(_MSG_USER_HELLO))
         assert contents[0]["role"] == "user"
-        assert contents[0]["parts"][0]["text"] == "Hello"
+        assert _first_part(contents)["text"] == "Hello"
 
     def test_assistant_role_becomes_model(self):
         """Assistant role should become model"""
-        messages = [{"role": "assistant", "content": "Hi there"}]
-        contents = convert_messages_to_contents(messages)
+        contents = convert_messages_to_contents(list(_MSG_ASSISTANT_HI))
         assert contents[0]["role"] == "model"
-        assert contents[0]["parts"][0]["text"] == "Hi there"
+        assert _first_part(contents)["text"] == "Hi there"
 
     def test_thinking_blocks_included_when_enabled(self):
         """Thinking blocks should be included when include_thinking=True"""
-        messages = [
-            {
-                "role": "assistant",
-                "content": [
-                    {
-                        "type": "thinking",
-                        "thinking": "Let me think...",
-                        "signature": "sig1",
-                    },
-                    {"type": "text", "text": "Here is my answer"},
-                ],
-            }
-        ]
-        contents = convert_messages_to_contents(messages, include_thinking=True)
+        contents = convert_messages_to_contents(list(_MSG_ASSISTANT_THINKING))
         assert len(contents[0]["parts"]) == 2
-        assert contents[0]["parts"][0]["thought"] is True
+        assert _first_part(contents)["thought"] is True
 
     def test_thinking_blocks_skipped_when_disabled(self):
         """Thinking blocks should be skipped when include_thinking=False"""
-        messages = [
-            {
-                "role": "assistant",
-                "content": [
-                    {
-                        "type": "thinking",
-                        "thinking": "Let me think...",
-                        "signature": "sig1",
-                    },
-                    {"type": "text", "text": "Here is my answer"},
-                ],
-            }
-        ]
-        contents = convert_messages_to_contents(messages, include_thinking=False)
+        contents = convert_messages_to_contents(
+            list(_MSG_ASSISTANT_THINKING), include_thinking=False
+        )
         assert len(contents[0]["parts"]) == 1
         assert contents[0]["parts"][0]["text"] == "Here is my answer"
 
     def test_thinking_without_signature_skipped(self):
         """Thinking blocks without signature should be skipped"""
-        messages = [
-            {
-                "role": "assistant",
-                "content": [
-                    {"type": "thinking", "thinking": "No signature"},
-                    {"type": "text", "text": "Answer"},
-                ],
-            }
-        ]
-        contents = convert_messages_to_contents(messages, include_thinking=True)
+        contents = convert_messages_to_contents(list(_MSG_ASSISTANT_UNSIGNED_THINKING))
         # Only text should be included
         assert len(contents[0]["parts"]) == 1
 
     def test_tool_use_converted(self):
         """Tool use should be converted to functionCall"""
-        messages = [
-            {
-                "role": "assistant",
-                "content": [
-                    {
-                        "type": "tool_use",
-                        "id": "tool_1",
-                        "name": "search",
-                        "input": {"q": "test"},
-                    }
-                ],
-            }
-        ]
-        contents = convert_messages_to_contents(messages)
-        assert "functionCall" in contents[0]["parts"][0]
-        assert contents[0]["parts"][0]["functionCall"]["name"] == "search"
+        contents = convert_messages_to_contents(list(_MSG_ASSISTANT_TOOL_USE))
+        part = _first_part(contents)
+        assert "functionCall" in part
+        assert part["functionCall"]["name"] == "search"
 
     def test_tool_result_converted(self):
         """Tool result should be converted to functionResponse"""
-        messages = [
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": "tool_1",
-                        "content": "Result",
-                    }
-                ],
-            }
-        ]
-        contents = convert_messages_to_contents(messages)
-        assert "functionResponse" in contents[0]["parts"][0]
+        contents = convert_messages_to_contents(list(_MSG_USER_TOOL_RESULT))
+        part = _first_part(contents)
+        assert "functionResponse" in part
 
     def test_image_converted(self):
         """Image content should be converted to inlineData"""
-        messages = [
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": "image/png",
-                            "data": "base64data",
-                        },
-                    }
-                ],
-            }
-        ]
-        contents = convert_messages_to_contents(messages)
-        assert "inlineData" in contents[0]["parts"][0]
-        assert contents[0]["parts"][0]["inlineData"]["mimeType"] == "image/png"
+        contents = convert_messages_to_contents(list(_MSG_USER_IMAGE))
+        part = _first_part(contents)
+        assert "inlineData" in part
+        assert part["inlineData"]["mimeType"] == "image/png"
 
     def test_whitespace_only_text_skipped(self):
         """Whitespace-only text should be skipped"""
-        messages = [{"role": "user", "content": "   "}]
-        contents = convert_messages_to_contents(messages)
+        contents = convert_messages_to_contents(list(_MSG_USER_WHITESPACE))
         assert len(contents) == 0
 
 
@@ -311,25 +320,7 @@ class TestReorganizeToolMessages:
 
     def test_pairs_function_call_with_response(self):
         """Function call should be paired with its response"""
-        contents = [
-            {
-                "role": "model",
-                "parts": [{"functionCall": {"id": "t1", "name": "search", "args": {}}}],
-            },
-            {
-                "role": "user",
-                "parts": [
-                    {
-                        "functionResponse": {
-                            "id": "t1",
-                            "name": "search",
-                            "response": {"output": "result"},
-                        }
-                    }
-                ],
-            },
-        ]
-        reorganized = reorganize_tool_messages(contents)
+        reorganized = reorganize_tool_messages(list(_CONTENTS_TOOL_PAIR))
         # Should maintain order
         assert len(reorganized) == 2
 
@@ -435,41 +426,37 @@ class TestConvertAnthropicRequest:
         assert len(components["tools"]) == 1
 
 
-class TestThinkingPreferenceDetection:
-    """Tests for thinking preference detection"""
-
-    def test_thinking_type_enabled(self):
-        """thinking: {type: "enabled"} should enable thinking"""
-        thinking_value = {"type": "enabled", "budget_tokens": 10000}
-        client_thinking_enabled = thinking_value.get("type") == "enabled"
-        assert client_thinking_enabled is True
+# Thinking preference cases: (thinking value, model, thinking enabled, thinking to text)
+_THINKING_DECISIONS = {
+    "dict_enabled": ({"type": "enabled", "budget_tokens": 10000}, "claude-opus-4-5", True, False),
+    "dict_disabled": ({"type": "disabled"}, "claude-opus-4-5", False, False),
+    "bool_false": (False, "claude-opus-4-5", False, False),
+    "nothinking_model": (None, "claude-opus-4-5-nothinking", False, True),
+}
 
-    def test_thinking_type_disabled(self):
-        """thinking: {type: "disabled"} should disable thinking"""
-        thinking_value = {"type": "disabled"}
-        client_thinking_enabled = thinking_value.get("type") == "enabled"
-        assert client_thinking_enabled is False
 
-    def test_thinking_false(self):
-        """thinking: false should disable thinking"""
-        thinking_value = False
-        client_thinking_enabled = True
-        if thinking_value is False:
-            client_thinking_enabled = False
-        assert client_thinking_enabled is False
+def _thinking_preference(thinking, model):
+    """Resolve client thinking preference the way the streaming path does."""
+    client_thinking_enabled = True
+    thinking_to_text = False
+    if isinstance(thinking, dict):
+        client_thinking_enabled = thinking.get("type") != "disabled"
+    elif thinking is False:
+        client_thinking_enabled = False
+    if "-nothinking" in model.lower():
+        client_thinking_enabled = False
+        thinking_to_text = True
+    return client_thinking_enabled, thinking_to_text
 
-    def test_nothinking_model_variant(self):
-        """Model ending with -nothinking should disable thinking"""
-        model = "claude-opus-4-5-nothinking"
-        client_thinking_enabled = True
-        thinking_to_text = False
 
-        if "-nothinking" in model.lower():
-            client_thinking_enabled = False
-            thinking_to_text = True
+class TestThinkingPreferenceDetection:
+    """Tests for thinking preference detection"""
 
-        assert client_thinking_enabled is False
-        assert thinking_to_text is True
+    @pytest.mark.parametrize("case", list(_THINKING_DECISIONS))
+    def test_thinking_preference(self, case):
+        """Thinking value and model variant should resolve to the expected preference"""
+        thinking, model, enabled, to_text = _THINKING_DECISIONS[case]
+        assert _thinking_preference(thinking, model) == (enabled, to_text)
 
 
 class TestIsNonWhitespaceTextEdgeCases:
@@ -477,36 +464,34 @@ class TestIsNonWhitespaceTextEdgeCases:
 
     def test_none_returns_false(self):
         """None should return False"""
-        from antigravity2claudecode.converter import _is_non_whitespace_text
-
         assert _is_non_whitespace_text(None) is False
 
     def test_empty_string_returns_false(self):
         """Empty string should return False"""
-        from antigravity2claudecode.converter import _is_non_whitespace_text
-
         assert _is_non_whitespace_text("") is False
 
     def test_whitespace_only_returns_false(self):
         """Whitespace-only should return False"""
-        from antigravity2claudecode.converter import _is_non_whitespace_text
-
         assert _is_non_whitespace_text("   ") is False
         assert _is_non_whitespace_text("\t\n\r") is False
 
     def test_regular_text_returns_true(self):
         """Normal text should return True"""
-        from antigravity2claudecode.converter import _is_non_whitespace_text
-
         assert _is_non_whitespace_text("hello") is True
 
     def test_number_returns_true(self):
         """Numbers should work after str conversion"""
-        from antigravity2claudecode.converter import _is_non_whitespace_text
-
         assert _is_non_whitespace_text(42) is True
         assert _is_non_whitespace_text(0) is True
 
+    @pytest.mark.parametrize(
+        "value",
+        ["", " ", "\u00a0", "\u2003\u3000", "\x1c\x1d", " a ", "\u200b", "x\n"],
+    )
+    def test_matches_strip(self, value):
+        """Should agree with strip() on unicode whitespace"""
+        assert _is_non_whitespace_text(value) is bool(value.strip())
+
 
 class TestThinkingConfigEdgeCases:
     """Additional edge case tests for get_thinking_config"""
@@ -536,25 +521,35 @@ class TestThinkingConfigEdgeCases:
 class TestCleanJsonSchemaEdgeCases:
     """Additional edge case tests for clean_json_schema"""
 
-    def test_non_dict_passthrough(self):
-        """Non-dict values should pass through unchanged"""
-        assert clean_json_schema("string") == "string"
-        assert clean_json_schema(123) == 123
-        assert clean_json_schema([1, 2, 3]) == [1, 2, 3]
-
-    def test_type_array_without_null(self):
-        """Type array without null should use first type"""
-        schema = {"type": ["string", "integer"]}
-        cleaned = clean_json_schema(schema)
-        assert cleaned["type"] == "string"
-        assert "nullable" not in cleaned
-
-    def test_type_array_only_null(self):
-        """Type array with only null should default to string"""
-        schema = {"type": ["null"]}
-        cleaned = clean_json_schema(schema)
-        assert cleaned["type"] == "string"
-        assert cleaned["nullable"] is True
+    @pytest.mark.parametrize(
+        "schema,check",
+        [
+            # Non-dict values pass through unchanged
+            ("string", lambda r: r == "string"),
+            (123, lambda r: r == 123),
+            ([1, 2, 3], lambda r: r == [1, 2, 3]),
+            # Type array without null uses the first type
+            (
+                {"type": ["string", "integer"]},
+                lambda r: r["type"] == "string" and "nullable" not in r,
+            ),
+            # Type array with only null defaults to a nullable string
+            ({"type": ["null"]}, lambda r: r["type"] == "string" and r["nullable"] is True),
+            # Validation fields create a description if none exists
+            ({"type": "string", "minLength": 1}, lambda r: "minLength: 1" in r["description"]),
+        ],
+        ids=[
+            "str-passthrough",
+            "int-passthrough",
+            "list-passthrough",
+            "type-array-without-null",
+            "type-array-only-null",
+            "validation-creates-description",
+        ],
+    )
+    def test_clean_passthrough_and_types(self, schema, check):
+        """Scalar schemas and type/validation edge cases should be normalized"""
+        assert check(clean_json_schema(schema))
 
     def test_nested_schema_cleaning(self):
         """Nested schemas should be cleaned recursively"""
@@ -571,48 +566,31 @@ class TestCleanJsonSchemaEdgeCases:
         cleaned = clean_json_schema(schema)
         assert "$ref" not in cleaned["items"][0]
 
-    def test_validation_creates_description_if_none(self):
-        """Validation fields should create description if none exists"""
-        schema = {"type": "string", "minLength": 1}
-        cleaned = clean_json_schema(schema)
-        assert "description" in cleaned
-        assert "minLength: 1" in cleaned["description"]
-
 
 class TestExtractToolResultOutputEdgeCases:
     """Tests for _extract_tool_result_output edge cases"""
 
     def test_empty_list_returns_empty(self):
         """Empty list should return empty string"""
-        from antigravity2claudecode.converter import _extract_tool_result_output
-
         assert _extract_tool_result_output([]) == ""
 
     def test_list_with_text_block(self):
         """List with text block should extract text"""
-        from antigravity2claudecode.converter import _extract_tool_result_output
-
         content = [{"type": "text", "text": "result"}]
         assert _extract_tool_result_output(content) == "result"
 
     def test_list_with_non_text_block(self):
         """List with non-text block should stringify first item"""
-        from antigravity2claudecode.converter import _extract_tool_result_output
-
         content = [{"type": "other", "data": "value"}]
         result = _extract_tool_result_output(content)
         assert "other" in result
 
     def test_none_returns_empty(self):
         """None should return empty string"""
-        from antigravity2claudecode.converter import _extract_tool_result_output
-
         assert _extract_tool_result_output(None) == ""
 
     def test_string_returns_itself(self):
         """String should return itself"""
-        from antigravity2claudecode.converter import _extract_tool_result_output
-
         assert _extract_tool_result_output("direct string") == "direct string"
 
 
@@ -621,75 +599,34 @@ class TestConvertMessagesEdgeCases:
 
     def test_thinking_block_with_none_thinking_text(self):
         """Thinking block with None thinking field should use empty string"""
-        messages = [
-            {
-                "role": "assistant",
-                "content": [
-                    {"type": "thinking", "thinking": None, "signature": "sig"},
-                ],
-            }
-        ]
-        contents = convert_messages_to_contents(messages, include_thinking=True)
+        contents = convert_messages_to_contents(list(_MSG_ASSISTANT_NULL_THINKING))
         assert contents[0]["parts"][0]["text"] == ""
 
     def test_redacted_thinking_with_data_field(self):
         """Redacted thinking should fallback to data field"""
-        messages = [
-            {
-                "role": "assistant",
-                "content": [
-                    {
-                        "type": "redacted_thinking",
-                        "data": "redacted",
-                        "signature": "sig",
-                    },
-                ],
-            }
-        ]
-        contents = convert_messages_to_contents(messages, include_thinking=True)
-        assert contents[0]["parts"][0]["text"] == "redacted"
+        contents = convert_messages_to_contents(list(_MSG_ASSISTANT_REDACTED_THINKING))
+        part = _first_part(contents)
+        assert part["text"] == "redacted"
 
     def test_redacted_thinking_without_signature_skipped(self):
         """Redacted thinking without signature should be skipped"""
-        messages = [
-            {
-                "role": "assistant",
-                "content": [
-                    {"type": "redacted_thinking", "data": "redacted"},
-                    {"type": "text", "text": "visible"},
-                ],
-            }
-        ]
-        contents = convert_messages_to_contents(messages, include_thinking=True)
+        contents = convert_messages_to_contents(list(_MSG_ASSISTANT_UNSIGNED_REDACTED_THINKING))
         assert len(contents[0]["parts"]) == 1
         assert contents[0]["parts"][0]["text"] == "visible"
 
     def test_unknown_content_type_serialized(self):
         """Unknown content type should be JSON serialized"""
-        messages = [
-            {
-                "role": "user",
-                "content": [{"type": "custom", "data": "value"}],
-            }
-        ]
-        contents = convert_messages_to_contents(messages)
+        contents = convert_messages_to_contents(list(_MSG_USER_CUSTOM_BLOCK))
         assert "custom" in contents[0]["parts"][0]["text"]
 
     def test_non_dict_list_items(self):
         """Non-dict items in content list should be stringified"""
-        messages = [
-            {
-                "role": "user",
-                "content": ["plain string", 123],
-            }
-        ]
-        contents = convert_messages_to_contents(messages)
+        contents = convert_messages_to_contents(list(_MSG_USER_NON_DICT_ITEMS))
         assert len(contents[0]["parts"]) == 2
 
     def test_non_list_non_string_content(self):
         """Non-list/non-string content should be stringified"""
-        messages = [{"role": "user", "content": 42}]
-        contents = convert_messages_to_contents(messages)
+        contents = convert_messages_to_contents(list(_MSG_USER_NUMBER))
         assert contents[0]["parts"][0]["text"] == "42"
 
 
@@ -746,15 +683,17 @@ class TestBuildSystemInstructionEdgeCases:
         assert len(result["parts"]) == 1
 
 
+# Shared payload pieces; build_generation_config never mutates its payload
+_EMPTY_MSGS: list = []
+_ENABLED = {"type": "enabled"}
+
+
 class TestBuildGenerationConfigEdgeCases:
     """Additional edge case tests for build_generation_config"""
 
     def test_thinking_disabled_includes_config(self):
         """Thinking disabled should include thinkingConfig with includeThoughts=False"""
-        payload = {
-            "thinking": {"type": "disabled"},
-            "messages": [],
-        }
+        payload = {"thinking": {"type": "disabled"}, "messages": _EMPTY_MSGS}
         config, should_include = build_generation_config(payload)
         assert config["thinkingConfig"]["includeThoughts"] is False
         assert should_include is False
@@ -762,7 +701,7 @@ class TestBuildGenerationConfigEdgeCases:
     def test_thinking_with_incompatible_history(self):
         """Thinking enabled but incompatible history should skip thinkingConfig"""
         payload = {
-            "thinking": {"type": "enabled"},
+            "thinking": _ENABLED,
             "messages": [{"role": "assistant", "content": [{"type": "text", "text": "Hi"}]}],
         }
         config, should_include = build_generation_config(payload)
@@ -771,9 +710,9 @@ class TestBuildGenerationConfigEdgeCases:
     def test_thinking_budget_adjustment(self):
         """Budget >= max_tokens should be auto-adjusted"""
         payload = {
-            "thinking": {"type": "enabled", "budget_tokens": 1000},
+            "thinking": {**_ENABLED, "budget_tokens": 1000},
             "max_tokens": 500,
-            "messages": [],
+            "messages": _EMPTY_MSGS,
         }
         config, should_include = build_generation_config(payload)
         assert config["thinkingConfig"]["thinkingBudget"] == 499
@@ -781,9 +720,9 @@ class TestBuildGenerationConfigEdgeCases:
     def test_thinking_budget_too_low_skips(self):
         """Budget adjustment to 0 or less should skip thinkingConfig"""
         payload = {
-            "thinking": {"type": "enabled", "budget_tokens": 1000},
+            "thinking": {**_ENABLED, "budget_tokens": 1000},
             "max_tokens": 1,
-            "messages": [],
+            "messages": _EMPTY_MSGS,
         }
         config, should_include = build_generation_config(payload)
         assert "thinkingConfig" not in config
@@ -798,7 +737,7 @@ class TestBuildGenerationConfigEdgeCases:
 
     def test_thinking_null_value(self):
         """thinking=null should not enable thinking"""
-        payload = {"thinking": None, "messages": []}
+        payload = {"thinking": None, "messages": _EMPTY_MSGS}
         config, should_include = build_generation_config(payload)
         # When explicitly null, thinking should not be enabled
         assert "thinkingConfig" not in config or should_include is False
@@ -825,5 +764,6 @@ class TestConvertToolsEdgeCases:
 
 
 # Run tests with: python -m pytest tests/test_converter.py -v
+# Tests share no mutable state, so they also run under pytest-xdist (-n auto)
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -8,6 +8,9 @@ These tests cover:
 4. Edge cases
 """
 
+from collections import OrderedDict
+from types import MappingProxyType
+
 import pytest
 
 from antigravity2claudecode.token_estimator import estimate_input_tokens
@@ -181,6 +184,55 @@ class TestEstimateInputTokens:
         result = estimate_input_tokens(payload)
         assert result >= 1
 
+    def test_characters_summed_before_division(self):
+        """Short strings should add up rather than each rounding down to zero"""
+        payload = {"content": ["abc", "abc", "abc", "abc"]}
+        assert estimate_input_tokens(payload) == 3
+
+    def test_container_subclasses_traversed(self):
+        """dict and list subclasses should be walked like plain containers"""
+
+        class Blocks(list):
+            pass
+
+        payload = OrderedDict(content=Blocks([OrderedDict(type="image"), "abcdefghijklmnop"]))
+        # "image" + 16 chars = 21 chars -> 5 tokens, plus one image
+        assert estimate_input_tokens(payload) == 5 + 300
+
+    def test_read_only_mappings_and_tuples_traversed(self):
+        """Mappings that are not dicts and tuples should be walked too"""
+        payload = MappingProxyType(
+            {"content": ({"type": "image"}, MappingProxyType({"text": "abcdefghijklmnop"}))}
+        )
+        assert estimate_input_tokens(payload) == 5 + 300
+
+    def test_deeply_nested_payload(self):
+        """Nesting deeper than the recursion limit should not raise"""
+        payload: dict = {"text": "abcd" * 10}
+        for _ in range(5000):
+            payload = {"content": [payload]}
+        assert estimate_input_tokens(payload) == 10
+
+    def test_text_only_request_counts_every_string(self):
+        """Plain string messages should count model, system and roles too"""
+        payload = {
+            "model": "abcd",
+            "max_tokens": 1024,
+            "stream": True,
+            "system": "abcd",
+            "messages": [
+                {"role": "user", "content": "abcdefgh"},
+                {"role": "assistant", "content": "abcdefgh"},
+            ],
+        }
+        # 4 + 4 + (4 + 8) + (9 + 8) = 37 chars -> 9 tokens
+        assert estimate_input_tokens(payload) == 9
+
+    def test_text_only_request_with_image_message(self):
+        """An image marker on a string-content message should still be counted"""
+        payload = {"messages": [{"type": "image", "content": "abcd"}]}
+        assert estimate_input_tokens(payload) == 2 + 300
+
 
 # Run tests with: python -m pytest tests/test_token_estimator.py -v
 if __name__ == "__main__":
@@ -0,0 +1,13 @@
+"""Shared helpers for unit tests."""
+
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze(obj: Any) -> Any:
+    """Recursively wrap dicts in MappingProxyType and lists in tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(freeze(v) for v in obj)
+    return obj
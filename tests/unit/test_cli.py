@@ -0,0 +1,24 @@
+"""
+Tests for CLI helpers.
+
+Tests cover:
+1. TCP keepalive configuration of the listening socket
+"""
+
+import socket
+
+from a2c.cli.main import TCP_KEEPALIVE_IDLE, _enable_tcp_keepalive
+
+
+class TestTcpKeepalive:
+    """Tests for _enable_tcp_keepalive."""
+
+    def test_enables_keepalive(self):
+        """Should turn on SO_KEEPALIVE and set the idle time where supported."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            _enable_tcp_keepalive(sock)
+
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) != 0
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                idle = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE)
+                assert idle == TCP_KEEPALIVE_IDLE
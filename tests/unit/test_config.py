@@ -15,85 +15,92 @@ import yaml
 from a2c.router.config import (
     ConfigValidationError,
     RoutingConfig,
+    RuleConfig,
     load_routing_config,
     validate_routing_config,
 )
 
-
-class TestLoadRoutingConfig:
-    """Tests for loading routing configuration from YAML."""
-
-    def test_load_yaml_config_file(self, tmp_path: Path):
-        """Should load valid YAML config file."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
+MULTI_RULE_YAML = """
 routing:
   default_provider: anthropic
   rules:
-    - name: test-rule
+    - name: background
       provider: antigravity
+      priority: 80
       match:
         agent_type: background
-""")
 
-        config = load_routing_config(config_file)
-
-        assert config.default_provider == "anthropic"
-        assert len(config.rules) == 1
-        assert config.rules[0].name == "test-rule"
-
-    def test_load_yaml_with_multiple_rules(self, tmp_path: Path):
-        """Should load config with multiple routing rules."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-routing:
-  default_provider: anthropic
-  rules:
     - name: thinking-requests
       provider: antigravity
       priority: 100
       match:
         thinking: enabled
 
+    - name: opus-requests
+      provider: antigravity
+      priority: 70
+      fallback_provider: anthropic
+      match:
+        model_pattern: ".*opus.*"
+
     - name: long-context
       provider: gemini
       priority: 90
       match:
         min_context_tokens: 100000
+"""
 
-    - name: background
-      provider: antigravity
-      priority: 80
-      match:
-        agent_type: background
-""")
 
-        config = load_routing_config(config_file)
+@pytest.fixture(scope="session")
+def multi_rule_config_dict() -> dict:
+    """Parse the shared multi-rule YAML document once per session."""
+    return yaml.safe_load(MULTI_RULE_YAML)
 
-        assert len(config.rules) == 3
-        # Rules should be sorted by priority
-        assert config.rules[0].name == "thinking-requests"
-        assert config.rules[0].priority == 100
-        assert config.rules[1].name == "long-context"
-        assert config.rules[2].name == "background"
 
-    def test_load_yaml_with_fallback_providers(self, tmp_path: Path):
-        """Should load rules with fallback providers."""
+@pytest.fixture(scope="session")
+def multi_rule_config(multi_rule_config_dict: dict) -> RoutingConfig:
+    """Validated config for the shared multi-rule document; read-only in tests."""
+    return validate_routing_config(multi_rule_config_dict["routing"])
+
+
+class TestLoadRoutingConfig:
+    """Tests for loading routing configuration from YAML."""
+
+    def test_load_yaml_config_file(self, tmp_path: Path):
+        """Should load valid YAML config file."""
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 routing:
   default_provider: anthropic
   rules:
-    - name: primary-rule
+    - name: test-rule
       provider: antigravity
-      fallback_provider: anthropic
       match:
-        model_pattern: ".*opus.*"
+        agent_type: background
 """)
 
         config = load_routing_config(config_file)
 
-        assert config.rules[0].fallback_provider == "anthropic"
+        assert config.default_provider == "anthropic"
+        assert len(config.rules) == 1
+        assert config.rules[0].name == "test-rule"
+
+    def test_load_yaml_with_multiple_rules(self, multi_rule_config: RoutingConfig):
+        """Should load config with multiple routing rules."""
+        assert len(multi_rule_config.rules) == 4
+        # Rules should be sorted by priority
+        assert multi_rule_config.rules[0].name == "thinking-requests"
+        assert multi_rule_config.rules[0].priority == 100
+        assert multi_rule_config.rules[1].name == "long-context"
+        assert multi_rule_config.rules[2].name == "background"
+        assert multi_rule_config.rules[3].name == "opus-requests"
+
+    def test_load_yaml_with_fallback_providers(self, multi_rule_config: RoutingConfig):
+        """Should load rules with fallback providers."""
+        rule = next(r for r in multi_rule_config.rules if r.name == "opus-requests")
+
+        assert rule.fallback_provider == "anthropic"
+        assert rule.match["model_pattern"] == ".*opus.*"
 
     def test_load_yaml_file_not_found(self):
         """Should raise error for missing config file."""
@@ -135,6 +142,33 @@ server:
 
         assert config.default_provider == "anthropic"
 
+    def test_load_yaml_picks_up_file_changes(self, tmp_path: Path):
+        """Reloading after the file changes should return the new config."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("routing:\n  default_provider: anthropic\n")
+        assert load_routing_config(config_file).default_provider == "anthropic"
+
+        config_file.write_text("routing:\n  default_provider: antigravity\n")
+        assert load_routing_config(config_file).default_provider == "antigravity"
+
+    def test_load_yaml_returns_independent_configs(self, tmp_path: Path):
+        """Configs loaded from the same file should not share match dicts."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+routing:
+  rules:
+    - name: test-rule
+      provider: antigravity
+      match:
+        agent_type: background
+""")
+
+        first = load_routing_config(config_file)
+        first.rules[0].match["agent_type"] = "changed"
+        second = load_routing_config(config_file)
+
+        assert second.rules[0].match["agent_type"] == "background"
+
 
 class TestValidateRoutingConfig:
     """Tests for routing config validation."""
@@ -211,6 +245,21 @@ class TestValidateRoutingConfig:
         with pytest.raises(ConfigValidationError, match="unknown"):
             validate_routing_config(config_dict)
 
+    def test_validate_non_mapping_match(self):
+        """Should fail validation, naming the rule, when match is not a mapping."""
+        config_dict = {
+            "rules": [
+                {
+                    "name": "test",
+                    "provider": "a",
+                    "match": ["model_pattern"],
+                }
+            ],
+        }
+
+        with pytest.raises(ConfigValidationError, match="Rule 'test': match must be a mapping"):
+            validate_routing_config(config_dict)
+
     def test_validate_invalid_priority_type(self):
         """Should fail validation for non-integer priority."""
         config_dict = {
@@ -227,6 +276,21 @@ class TestValidateRoutingConfig:
         with pytest.raises(ConfigValidationError, match="priority"):
             validate_routing_config(config_dict)
 
+    def test_validate_invalid_model_pattern(self):
+        """Should fail validation for a model_pattern that is not a valid regex."""
+        config_dict = {
+            "rules": [
+                {
+                    "name": "test",
+                    "provider": "a",
+                    "match": {"model_pattern": "claude-(opus"},
+                }
+            ],
+        }
+
+        with pytest.raises(ConfigValidationError, match="model_pattern"):
+            validate_routing_config(config_dict)
+
 
 class TestRoutingConfig:
     """Tests for RoutingConfig dataclass."""
@@ -283,6 +347,19 @@ class TestRoutingConfig:
         assert d["long_context_threshold"] == 100000
         assert "rules" in d
 
+    def test_routing_config_sorts_rules_and_router_keeps_order(self):
+        """Rules should be sorted by priority on construction and kept by to_router."""
+        config = RoutingConfig(
+            rules=[
+                RuleConfig(name="low", provider="anthropic", priority=1),
+                RuleConfig(name="high", provider="gemini", priority=10),
+                RuleConfig(name="mid", provider="openai", priority=5),
+            ]
+        )
+
+        assert [r.name for r in config.rules] == ["high", "mid", "low"]
+        assert [r.name for r in config.to_router().rules] == ["high", "mid", "low"]
+
 
 class TestConfigHotReload:
     """Tests for config hot-reloading."""
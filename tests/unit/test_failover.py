@@ -10,6 +10,12 @@ from a2c.providers import ProviderHealth, ProviderResponse, ProviderStatus
 from a2c.router.failover import FailoverService, FailoverResult
 
 
+@pytest.fixture(scope="class")
+def service() -> FailoverService:
+    """Default failover service shared by a test class; it holds no per-call state."""
+    return FailoverService()
+
+
 class TestFailoverService:
     """Tests for failover service."""
 
@@ -27,64 +33,48 @@ class TestFailoverService:
         assert service.max_retries == 5
         assert service.retry_delay_ms == 200
 
-    def test_should_retry_on_5xx(self):
-        """Should retry on 5xx errors."""
-        service = FailoverService()
-
-        assert service.should_retry(500) is True
-        assert service.should_retry(502) is True
-        assert service.should_retry(503) is True
-        assert service.should_retry(504) is True
-
-    def test_should_retry_on_429(self):
-        """Should retry on rate limit errors."""
-        service = FailoverService()
-
-        assert service.should_retry(429) is True
-
-    def test_should_not_retry_on_4xx(self):
-        """Should not retry on client errors (except 429)."""
-        service = FailoverService()
-
-        assert service.should_retry(400) is False
-        assert service.should_retry(401) is False
-        assert service.should_retry(403) is False
-        assert service.should_retry(404) is False
-
-    def test_should_not_retry_on_success(self):
-        """Should not retry on success."""
-        service = FailoverService()
-
-        assert service.should_retry(200) is False
-        assert service.should_retry(201) is False
-
-    def test_should_failover_on_unhealthy(self):
-        """Should failover when provider is unhealthy."""
-        service = FailoverService()
-
-        health = ProviderHealth(status=ProviderStatus.UNHEALTHY)
-        assert service.should_failover(health) is True
-
-    def test_should_not_failover_on_healthy(self):
-        """Should not failover when provider is healthy."""
-        service = FailoverService()
-
-        health = ProviderHealth(status=ProviderStatus.HEALTHY)
-        assert service.should_failover(health) is False
-
-    def test_should_failover_on_degraded_with_high_latency(self):
-        """Should failover when provider is degraded with high latency."""
-        service = FailoverService(latency_threshold_ms=1000)
-
-        health = ProviderHealth(status=ProviderStatus.DEGRADED, latency_ms=2000)
-        assert service.should_failover(health) is True
-
-    def test_should_not_failover_on_degraded_with_low_latency(self):
-        """Should not failover when provider is degraded but latency is acceptable."""
-        service = FailoverService(latency_threshold_ms=1000)
-
-        health = ProviderHealth(status=ProviderStatus.DEGRADED, latency_ms=500)
-        assert service.should_failover(health) is False
+    @pytest.mark.parametrize(
+        "status_code,expected",
+        [
+            # 5xx errors and rate limits are retried
+            (500, True),
+            (502, True),
+            (503, True),
+            (504, True),
+            (429, True),
+            # Other client errors and successes are not
+            (400, False),
+            (401, False),
+            (403, False),
+            (404, False),
+            (200, False),
+            (201, False),
+        ],
+    )
+    def test_should_retry(self, service: FailoverService, status_code: int, expected: bool):
+        """Should retry only on retryable status codes."""
+        assert service.should_retry(status_code) is expected
+
+    @pytest.mark.parametrize(
+        "status,latency_ms,expected",
+        [
+            (ProviderStatus.UNHEALTHY, None, True),
+            (ProviderStatus.HEALTHY, None, False),
+            # Degraded providers fail over only above the latency threshold
+            (ProviderStatus.DEGRADED, 6000, True),
+            (ProviderStatus.DEGRADED, 500, False),
+        ],
+    )
+    def test_should_failover(
+        self,
+        service: FailoverService,
+        status: ProviderStatus,
+        latency_ms: float | None,
+        expected: bool,
+    ):
+        """Should failover on unhealthy or slow degraded providers."""
+        health = ProviderHealth(status=status, latency_ms=latency_ms)
+        assert service.should_failover(health) is expected
 
 
 class TestFailoverResult:
@@ -157,58 +147,33 @@ class TestFailoverResult:
 class TestFailoverChain:
     """Tests for failover chain building."""
 
-    def test_build_chain_with_fallback(self):
-        """Should build chain with fallback provider prioritized."""
-        service = FailoverService()
-
-        chain = service.build_failover_chain(
-            primary="anthropic",
-            fallback="openai",
-            available=["anthropic", "openai", "gemini"],
-        )
-
-        # Primary first, then fallback, then others
-        assert chain[0] == "anthropic"
-        assert chain[1] == "openai"
-        assert "gemini" in chain
-
-    def test_build_chain_without_fallback(self):
-        """Should build chain with all available providers."""
-        service = FailoverService()
-
-        chain = service.build_failover_chain(
-            primary="anthropic",
-            fallback=None,
-            available=["anthropic", "openai", "gemini"],
-        )
-
-        assert chain[0] == "anthropic"
-        assert "openai" in chain
-        assert "gemini" in chain
-
-    def test_build_chain_excludes_unavailable(self):
-        """Should exclude unavailable providers."""
-        service = FailoverService()
-
-        chain = service.build_failover_chain(
-            primary="anthropic",
-            fallback="openai",
-            available=["anthropic", "gemini"],  # openai not available
-        )
-
-        assert chain == ["anthropic", "gemini"]
-
-    def test_build_chain_primary_not_available(self):
-        """Should handle primary not being available."""
-        service = FailoverService()
-
+    @pytest.mark.parametrize(
+        "fallback,available,expected",
+        [
+            # Primary first, then fallback, then others
+            ("openai", ["anthropic", "openai", "gemini"], ["anthropic", "openai", "gemini"]),
+            (None, ["anthropic", "openai", "gemini"], ["anthropic", "openai", "gemini"]),
+            # Unavailable providers are excluded
+            ("openai", ["anthropic", "gemini"], ["anthropic", "gemini"]),
+            ("openai", ["openai", "gemini"], ["openai", "gemini"]),
+        ],
+        ids=["with-fallback", "without-fallback", "excludes-unavailable", "primary-unavailable"],
+    )
+    def test_build_chain(
+        self,
+        service: FailoverService,
+        fallback: str | None,
+        available: list[str],
+        expected: list[str],
+    ):
+        """Should order available providers as primary, fallback, then the rest."""
         chain = service.build_failover_chain(
             primary="anthropic",
-            fallback="openai",
-            available=["openai", "gemini"],  # anthropic not available
+            fallback=fallback,
+            available=available,
         )
 
-        assert chain == ["openai", "gemini"]
+        assert chain == expected
 
 
 class TestRetryBackoff:
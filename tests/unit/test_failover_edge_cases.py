@@ -82,6 +82,18 @@ class TestFailoverServiceEdgeCases:
         assert chain.count("anthropic") == 1
         assert "openai" in chain
 
+    def test_build_chain_deduplicates_available(self):
+        """Should list each provider once even if available repeats it."""
+        service = FailoverService()
+
+        chain = service.build_failover_chain(
+            primary="openai",
+            fallback="gemini",
+            available=["anthropic", "openai", "anthropic", "gemini", "openai"],
+        )
+
+        assert chain == ["openai", "gemini", "anthropic"]
+
     def test_retry_delay_first_attempt(self):
         """Should return base delay for first attempt."""
         service = FailoverService(retry_delay_ms=100)
@@ -102,6 +114,104 @@ class TestFailoverServiceEdgeCases:
         assert service.get_retry_delay(attempt=1) == 0
         assert service.get_retry_delay(attempt=5) == 0
 
+    def test_retry_delay_uneven_cap(self):
+        """Should cap at max when it is not a power-of-two multiple of the base."""
+        service = FailoverService(retry_delay_ms=300, max_retry_delay_ms=1000)
+
+        delays = [service.get_retry_delay(attempt=n) for n in range(1, 6)]
+        assert delays == [300, 600, 1000, 1000, 1000]
+
+    def test_retry_delay_huge_attempt(self):
+        """Should return the cap without computing an enormous power of two."""
+        service = FailoverService(retry_delay_ms=100, max_retry_delay_ms=5000)
+
+        assert service.get_retry_delay(attempt=10**9) == 5000
+
+
+class TestFailoverCooldown:
+    """Tests for skipping recently failed providers."""
+
+    def test_failed_provider_skipped(self):
+        """Should drop a provider from new chains while it cools down."""
+        service = FailoverService(cooldown_ms=60_000)
+        service.mark_failed("anthropic")
+
+        chain = service.build_failover_chain(
+            primary="anthropic",
+            fallback="openai",
+            available=["anthropic", "openai", "gemini"],
+        )
+
+        assert chain == ["openai", "gemini"]
+
+    def test_all_cooling_keeps_earliest_expiry(self):
+        """Should keep the provider that recovers first when all are cooling down."""
+        service = FailoverService(cooldown_ms=60_000)
+        service.mark_failed("openai")
+        service.mark_failed("anthropic")
+
+        chain = service.build_failover_chain(
+            primary="anthropic",
+            fallback=None,
+            available=["anthropic", "openai"],
+        )
+
+        assert chain == ["openai"]
+
+    def test_cooldown_expires(self):
+        """Should include the provider again once the cooldown has passed."""
+        service = FailoverService(cooldown_ms=0)
+        service.mark_failed("anthropic")
+
+        chain = service.build_failover_chain(
+            primary="anthropic",
+            fallback=None,
+            available=["anthropic", "openai"],
+        )
+
+        assert chain == ["anthropic", "openai"]
+
+    def test_success_clears_cooldown(self):
+        """Should include the provider again after it succeeds."""
+        service = FailoverService(cooldown_ms=60_000)
+        service.mark_failed("anthropic")
+        service.mark_succeeded("anthropic")
+
+        chain = service.build_failover_chain(
+            primary="anthropic",
+            fallback=None,
+            available=["anthropic", "openai"],
+        )
+
+        assert chain == ["anthropic", "openai"]
+
+
+class TestDecorrelatedJitter:
+    """Tests for jittered retry backoff."""
+
+    def test_delay_within_bounds(self):
+        """Should stay between the base delay and three times the previous delay."""
+        service = FailoverService(
+            retry_delay_ms=100, max_retry_delay_ms=5000, jitter="decorrelated"
+        )
+
+        prev = None
+        for attempt in range(1, 50):
+            delay = service.get_retry_delay(attempt, prev_delay=prev)
+            assert 100 <= delay <= min(5000, (prev or 100) * 3)
+            prev = delay
+
+    def test_delay_capped(self):
+        """Should never exceed the maximum delay."""
+        service = FailoverService(retry_delay_ms=100, max_retry_delay_ms=500, jitter="decorrelated")
+
+        assert all(service.get_retry_delay(5, prev_delay=10_000) <= 500 for _ in range(100))
+
+    def test_unknown_jitter_rejected(self):
+        """Should reject unsupported jitter modes."""
+        with pytest.raises(ValueError, match="jitter"):
+            FailoverService(jitter="full")
+
 
 class TestFailoverResultEdgeCases:
     """Edge case tests for failover result."""
@@ -171,6 +281,13 @@ class TestFailoverServiceConfiguration:
         assert service.max_retry_delay_ms == 5000
         assert service.latency_threshold_ms == 5000
 
+    def test_service_has_no_instance_dict(self):
+        """Should use slots so unknown attributes cannot be set by typo."""
+        service = FailoverService()
+
+        with pytest.raises(AttributeError):
+            service.max_retry = 5  # type: ignore[attr-defined]
+
     def test_custom_configuration(self):
         """Should accept custom configuration."""
         service = FailoverService(
@@ -189,5 +306,6 @@ class TestFailoverServiceConfiguration:
         """Should have correct retryable status codes."""
         service = FailoverService()
 
-        expected_codes = {408, 429, 500, 502, 503, 504}
+        expected_codes = frozenset({408, 429, 500, 502, 503, 504})
         assert service.RETRYABLE_STATUS_CODES == expected_codes
+        assert isinstance(service.RETRYABLE_STATUS_CODES, frozenset)
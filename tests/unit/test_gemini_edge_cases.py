@@ -4,7 +4,6 @@ Comprehensive tests for Gemini provider edge cases.
 
 import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
 from a2c.providers.gemini import GeminiProvider, DEFAULT_MODEL_MAPPING
 
@@ -237,12 +236,17 @@ class TestGeminiProviderEdgeCases:
         assert provider._map_model("unknown-model") == "gemini-2.5-flash"
         assert provider._map_model("some-random-model") == "gemini-2.5-flash"
 
-    def test_model_mapping_all_claude_models(self):
+    @pytest.mark.parametrize(("claude_model", "gemini_model"), list(DEFAULT_MODEL_MAPPING.items()))
+    def test_model_mapping_all_claude_models(self, claude_model, gemini_model):
         """Should map all known Claude models."""
         provider = GeminiProvider(api_key="test")
 
-        for claude_model, gemini_model in DEFAULT_MODEL_MAPPING.items():
-            assert provider._map_model(claude_model) == gemini_model
+        assert provider._map_model(claude_model) == gemini_model
+
+    def test_default_model_mapping_read_only(self):
+        """Should not allow the shared default mapping to be modified."""
+        with pytest.raises(TypeError):
+            DEFAULT_MODEL_MAPPING["claude-opus-4-5"] = "gemini-custom"  # type: ignore[index]
 
     def test_custom_model_mapping_override(self):
         """Should allow custom mapping to override defaults."""
@@ -262,10 +266,34 @@ class TestGeminiProviderEdgeCases:
         assert provider._map_model("claude-opus-4-5") == "gemini-2.5-pro"
 
 
+# Cheap not-configured and lifecycle checks share one event loop
+@pytest.mark.asyncio(loop_scope="module")
 class TestGeminiProviderAsync:
     """Async tests for Gemini provider."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("finish_reason", "stop_reason"),
+        [("STOP", "end_turn"), ("MAX_TOKENS", "max_tokens"), ("SAFETY", "end_turn")],
+    )
+    async def test_stream_stop_reason_matches_response(self, finish_reason, stop_reason):
+        """Streaming should translate finish reasons like the buffered response."""
+        provider = GeminiProvider(api_key="test")
+        chunk = {
+            "candidates": [{"content": {"parts": [{"text": "hi"}]}, "finishReason": finish_reason}]
+        }
+
+        async def lines():
+            yield f"data: {json.dumps(chunk)}"
+
+        events = [e async for e in provider._convert_stream(lines(), "claude-sonnet-4-5")]
+        deltas = [
+            json.loads(e.decode().split("data: ", 1)[1])
+            for e in events
+            if e.startswith(b"event: message_delta")
+        ]
+
+        assert [d["delta"]["stop_reason"] for d in deltas] == [stop_reason]
+
     async def test_send_request_not_configured(self):
         """Should return error when not configured."""
         provider = GeminiProvider(api_key=None)
@@ -277,7 +305,26 @@ class TestGeminiProviderAsync:
         assert response.status_code == 401
         assert "not configured" in response.error.lower()
 
-    @pytest.mark.asyncio
+    async def test_send_request_body_is_compact_utf8_json(self, httpx_mock):
+        """Should send the converted request as compact UTF-8 JSON."""
+        httpx_mock.add_response(
+            json={"candidates": [{"content": {"parts": [{"text": "ok"}]}, "finishReason": "STOP"}]}
+        )
+        provider = GeminiProvider(api_key="test")
+
+        await provider.send_request(
+            {"model": "claude-sonnet-4-5", "messages": [{"role": "user", "content": "héllo"}]}
+        )
+        await provider.close()
+
+        sent = httpx_mock.get_request()
+        assert sent.headers["Content-Type"] == "application/json"
+        assert "héllo".encode() in sent.content
+        assert b", " not in sent.content
+        assert json.loads(sent.content)["contents"] == [
+            {"role": "user", "parts": [{"text": "héllo"}]}
+        ]
+
     async def test_health_check_not_configured(self):
         """Should return unhealthy when not configured."""
         provider = GeminiProvider(api_key=None)
@@ -287,7 +334,6 @@ class TestGeminiProviderAsync:
         assert health.status.value == "unhealthy"
         assert "not configured" in health.error.lower()
 
-    @pytest.mark.asyncio
     async def test_close_client(self):
         """Should close HTTP client properly."""
         provider = GeminiProvider(api_key="test")
@@ -299,3 +345,14 @@ class TestGeminiProviderAsync:
         # Close client
         await provider.close()
         assert provider._client is None
+
+    async def test_client_reused_across_calls(self):
+        """Should hand out the same pooled client until it is closed."""
+        provider = GeminiProvider(api_key="test")
+
+        first = await provider._get_client()
+        assert await provider._get_client() is first
+
+        await provider.close()
+        assert await provider._get_client() is not first
+        await provider.close()
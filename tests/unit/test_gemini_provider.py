@@ -4,12 +4,101 @@ TDD Tests for Gemini provider.
 Tests written FIRST following TDD methodology.
 """
 
-import json
+import copy
 
 import pytest
 
 from a2c.providers import ApiFormat, ProviderHealth, ProviderStatus
 from a2c.providers.gemini import GeminiProvider
+from tests.unit.helpers import freeze
+
+# Shared request payloads; converters must not mutate their input
+_IMAGE_REQUEST = {
+    "model": "claude-sonnet-4-5",
+    "messages": [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "What's this?"},
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "image/png",
+                        "data": "base64data",
+                    },
+                },
+            ],
+        }
+    ],
+}
+
+_TOOL_USE_REQUEST = {
+    "model": "claude-sonnet-4-5",
+    "messages": [
+        {"role": "user", "content": "Search for cats"},
+        {
+            "role": "assistant",
+            "content": [
+                {
+                    "type": "tool_use",
+                    "id": "tool_1",
+                    "name": "search",
+                    "input": {"query": "cats"},
+                }
+            ],
+        },
+    ],
+}
+
+
+# Shared upstream responses; frozen so a mutating converter fails loudly
+_SIMPLE_RESPONSE = freeze(
+    {
+        "candidates": [
+            {
+                "content": {
+                    "parts": [{"text": "Hello!"}],
+                    "role": "model",
+                },
+                "finishReason": "STOP",
+            }
+        ],
+        "usageMetadata": {
+            "promptTokenCount": 10,
+            "candidatesTokenCount": 5,
+            "totalTokenCount": 15,
+        },
+    }
+)
+
+_FUNCTION_CALL_RESPONSE = freeze(
+    {
+        "candidates": [
+            {
+                "content": {
+                    "parts": [
+                        {
+                            "functionCall": {
+                                "name": "search",
+                                "args": {"query": "cats"},
+                            }
+                        }
+                    ],
+                    "role": "model",
+                },
+                "finishReason": "STOP",
+            }
+        ],
+        "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 5},
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def gemini_provider() -> GeminiProvider:
+    """Shared provider for tests that only convert payloads; do not mutate."""
+    return GeminiProvider(api_key="test")
 
 
 class TestGeminiProviderInfo:
@@ -43,33 +132,29 @@ class TestGeminiProviderInfo:
 class TestGeminiRequestConversion:
     """Tests for Anthropic to Gemini request conversion."""
 
-    def test_convert_simple_message(self):
+    def test_convert_simple_message(self, gemini_provider):
         """Should convert simple text message."""
-        provider = GeminiProvider(api_key="test")
-
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "max_tokens": 1000,
             "messages": [{"role": "user", "content": "Hello"}],
         }
 
-        gemini_request = provider._convert_request(anthropic_request)
+        gemini_request = gemini_provider._convert_request(anthropic_request)
 
         assert "contents" in gemini_request
         assert gemini_request["contents"][0]["role"] == "user"
         assert gemini_request["contents"][0]["parts"][0]["text"] == "Hello"
 
-    def test_convert_system_prompt(self):
+    def test_convert_system_prompt(self, gemini_provider):
         """Should convert system prompt to system_instruction."""
-        provider = GeminiProvider(api_key="test")
-
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "system": "You are a helpful assistant.",
             "messages": [{"role": "user", "content": "Hi"}],
         }
 
-        gemini_request = provider._convert_request(anthropic_request)
+        gemini_request = gemini_provider._convert_request(anthropic_request)
 
         # System should be in system_instruction
         assert "system_instruction" in gemini_request
@@ -78,10 +163,8 @@ class TestGeminiRequestConversion:
             == "You are a helpful assistant."
         )
 
-    def test_convert_assistant_message(self):
+    def test_convert_assistant_message(self, gemini_provider):
         """Should convert assistant messages to model role."""
-        provider = GeminiProvider(api_key="test")
-
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "messages": [
@@ -90,16 +173,14 @@ class TestGeminiRequestConversion:
             ],
         }
 
-        gemini_request = provider._convert_request(anthropic_request)
+        gemini_request = gemini_provider._convert_request(anthropic_request)
 
         # Gemini uses "model" instead of "assistant"
         assert gemini_request["contents"][1]["role"] == "model"
         assert gemini_request["contents"][1]["parts"][0]["text"] == "Hi there!"
 
-    def test_convert_content_blocks(self):
+    def test_convert_content_blocks(self, gemini_provider):
         """Should convert content block format."""
-        provider = GeminiProvider(api_key="test")
-
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "messages": [
@@ -112,44 +193,19 @@ class TestGeminiRequestConversion:
             ],
         }
 
-        gemini_request = provider._convert_request(anthropic_request)
+        gemini_request = gemini_provider._convert_request(anthropic_request)
 
         assert gemini_request["contents"][0]["parts"][0]["text"] == "What's in this image?"
 
-    def test_convert_image_content(self):
+    def test_convert_image_content(self, gemini_provider):
         """Should convert image content to Gemini format."""
-        provider = GeminiProvider(api_key="test")
+        gemini_request = gemini_provider._convert_request(_IMAGE_REQUEST)
 
-        anthropic_request = {
-            "model": "claude-sonnet-4-5",
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": "What's this?"},
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/png",
-                                "data": "base64data",
-                            },
-                        },
-                    ],
-                }
-            ],
-        }
-
-        gemini_request = provider._convert_request(anthropic_request)
-
-        # Should have inline_data format
-        parts = gemini_request["contents"][0]["parts"]
-        assert any("inline_data" in p for p in parts)
+        # Should have inline_data format, after the text part
+        assert "inline_data" in gemini_request["contents"][0]["parts"][1]
 
-    def test_convert_tools(self):
+    def test_convert_tools(self, gemini_provider):
         """Should convert tools to Gemini function declarations."""
-        provider = GeminiProvider(api_key="test")
-
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "messages": [{"role": "user", "content": "Search for cats"}],
@@ -166,44 +222,22 @@ class TestGeminiRequestConversion:
             ],
         }
 
-        gemini_request = provider._convert_request(anthropic_request)
+        gemini_request = gemini_provider._convert_request(anthropic_request)
 
         assert "tools" in gemini_request
         assert gemini_request["tools"][0]["function_declarations"][0]["name"] == "search"
 
-    def test_convert_tool_use(self):
+    def test_convert_tool_use(self, gemini_provider):
         """Should convert tool_use to function_call."""
-        provider = GeminiProvider(api_key="test")
-
-        anthropic_request = {
-            "model": "claude-sonnet-4-5",
-            "messages": [
-                {"role": "user", "content": "Search for cats"},
-                {
-                    "role": "assistant",
-                    "content": [
-                        {
-                            "type": "tool_use",
-                            "id": "tool_1",
-                            "name": "search",
-                            "input": {"query": "cats"},
-                        }
-                    ],
-                },
-            ],
-        }
-
-        gemini_request = provider._convert_request(anthropic_request)
+        gemini_request = gemini_provider._convert_request(_TOOL_USE_REQUEST)
 
         # Model message should have function_call
         model_msg = gemini_request["contents"][1]
         assert model_msg["role"] == "model"
-        assert any("functionCall" in p for p in model_msg["parts"])
+        assert "functionCall" in model_msg["parts"][0]
 
-    def test_convert_tool_result(self):
+    def test_convert_tool_result(self, gemini_provider):
         """Should convert tool_result to function_response."""
-        provider = GeminiProvider(api_key="test")
-
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "messages": [
@@ -220,16 +254,14 @@ class TestGeminiRequestConversion:
             ],
         }
 
-        gemini_request = provider._convert_request(anthropic_request)
+        gemini_request = gemini_provider._convert_request(anthropic_request)
 
         # Should be function role with function_response
         assert gemini_request["contents"][0]["role"] == "function"
-        assert any("functionResponse" in p for p in gemini_request["contents"][0]["parts"])
+        assert "functionResponse" in gemini_request["contents"][0]["parts"][0]
 
-    def test_convert_generation_config(self):
+    def test_convert_generation_config(self, gemini_provider):
         """Should convert generation parameters."""
-        provider = GeminiProvider(api_key="test")
-
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "max_tokens": 1000,
@@ -238,119 +270,96 @@ class TestGeminiRequestConversion:
             "messages": [{"role": "user", "content": "Hi"}],
         }
 
-        gemini_request = provider._convert_request(anthropic_request)
+        gemini_request = gemini_provider._convert_request(anthropic_request)
 
         assert "generationConfig" in gemini_request
-        assert gemini_request["generationConfig"]["maxOutputTokens"] == 1000
-        assert gemini_request["generationConfig"]["temperature"] == 0.7
-        assert gemini_request["generationConfig"]["stopSequences"] == ["STOP", "END"]
+        gc = gemini_request["generationConfig"]
+        assert gc["maxOutputTokens"] == 1000
+        assert gc["temperature"] == 0.7
+        assert gc["stopSequences"] == ["STOP", "END"]
+
+    @pytest.mark.parametrize("request_body", [_IMAGE_REQUEST, _TOOL_USE_REQUEST])
+    def test_convert_request_does_not_mutate_input(self, gemini_provider, request_body):
+        """Should leave the shared request payload untouched."""
+        snapshot = copy.deepcopy(request_body)
+
+        gemini_provider._convert_request(request_body)
+
+        assert request_body == snapshot
 
 
 class TestGeminiResponseConversion:
     """Tests for Gemini to Anthropic response conversion."""
 
-    def test_convert_simple_response(self):
+    def test_convert_simple_response(self, gemini_provider):
         """Should convert simple text response."""
-        provider = GeminiProvider(api_key="test")
-
-        gemini_response = {
-            "candidates": [
-                {
-                    "content": {
-                        "parts": [{"text": "Hello!"}],
-                        "role": "model",
-                    },
-                    "finishReason": "STOP",
-                }
-            ],
-            "usageMetadata": {
-                "promptTokenCount": 10,
-                "candidatesTokenCount": 5,
-                "totalTokenCount": 15,
-            },
-        }
-
-        anthropic_response = provider._convert_response(gemini_response, "claude-sonnet-4-5")
+        anthropic_response = gemini_provider._convert_response(
+            _SIMPLE_RESPONSE, "claude-sonnet-4-5"
+        )
 
         assert anthropic_response["type"] == "message"
         assert anthropic_response["role"] == "assistant"
-        assert anthropic_response["content"][0]["type"] == "text"
-        assert anthropic_response["content"][0]["text"] == "Hello!"
+        content = anthropic_response["content"][0]
+        assert content["type"] == "text"
+        assert content["text"] == "Hello!"
         assert anthropic_response["stop_reason"] == "end_turn"
-        assert anthropic_response["usage"]["input_tokens"] == 10
-        assert anthropic_response["usage"]["output_tokens"] == 5
+        usage = anthropic_response["usage"]
+        assert usage["input_tokens"] == 10
+        assert usage["output_tokens"] == 5
 
-    def test_convert_function_call_response(self):
+    def test_convert_function_call_response(self, gemini_provider):
         """Should convert function_call to tool_use."""
-        provider = GeminiProvider(api_key="test")
-
-        gemini_response = {
-            "candidates": [
-                {
-                    "content": {
-                        "parts": [
-                            {
-                                "functionCall": {
-                                    "name": "search",
-                                    "args": {"query": "cats"},
-                                }
-                            }
-                        ],
-                        "role": "model",
-                    },
-                    "finishReason": "STOP",
-                }
-            ],
-            "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 5},
-        }
-
-        anthropic_response = provider._convert_response(gemini_response, "claude-sonnet-4-5")
+        anthropic_response = gemini_provider._convert_response(
+            _FUNCTION_CALL_RESPONSE, "claude-sonnet-4-5"
+        )
 
-        assert anthropic_response["content"][0]["type"] == "tool_use"
-        assert anthropic_response["content"][0]["name"] == "search"
-        assert anthropic_response["content"][0]["input"] == {"query": "cats"}
+        content = anthropic_response["content"][0]
+        assert content["type"] == "tool_use"
+        assert content["name"] == "search"
+        assert content["input"] == {"query": "cats"}
         assert anthropic_response["stop_reason"] == "tool_use"
 
-    def test_convert_max_tokens_finish(self):
-        """Should convert MAX_TOKENS finish reason."""
-        provider = GeminiProvider(api_key="test")
-
+    @pytest.mark.parametrize(
+        ("finish_reason", "stop_reason"), [("STOP", "end_turn"), ("MAX_TOKENS", "max_tokens")]
+    )
+    def test_convert_finish_reason(self, gemini_provider, finish_reason, stop_reason):
+        """Should convert Gemini finish reasons to Anthropic stop reasons."""
         gemini_response = {
             "candidates": [
                 {
-                    "content": {
-                        "parts": [{"text": "Truncated..."}],
-                        "role": "model",
-                    },
-                    "finishReason": "MAX_TOKENS",
+                    "content": {"parts": [{"text": "x"}], "role": "model"},
+                    "finishReason": finish_reason,
                 }
             ],
-            "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 100},
+            "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 1},
         }
 
-        anthropic_response = provider._convert_response(gemini_response, "claude-sonnet-4-5")
+        anthropic_response = gemini_provider._convert_response(gemini_response, "claude-sonnet-4-5")
 
-        assert anthropic_response["stop_reason"] == "max_tokens"
+        assert anthropic_response["stop_reason"] == stop_reason
 
 
 class TestGeminiModelMapping:
     """Tests for model name mapping."""
 
-    def test_map_claude_to_gemini(self):
+    @pytest.mark.parametrize(
+        ("claude_model", "gemini_model"),
+        [
+            ("claude-opus-4-5", "gemini-2.5-pro"),
+            ("claude-sonnet-4-5", "gemini-2.5-flash"),
+            ("claude-3-haiku-20240307", "gemini-2.5-flash-lite"),
+        ],
+    )
+    def test_map_claude_to_gemini(self, gemini_provider, claude_model, gemini_model):
         """Should map Claude models to Gemini equivalents."""
-        provider = GeminiProvider(api_key="test")
-
-        assert provider._map_model("claude-opus-4-5") == "gemini-2.5-pro"
-        assert provider._map_model("claude-sonnet-4-5") == "gemini-2.5-flash"
-        assert provider._map_model("claude-3-haiku-20240307") == "gemini-2.5-flash-lite"
+        assert gemini_provider._map_model(claude_model) == gemini_model
 
-    def test_passthrough_gemini_models(self):
+    @pytest.mark.parametrize(
+        "model", ["gemini-2.5-pro", "gemini-2.5-flash", "gemini-2.0-flash-exp"]
+    )
+    def test_passthrough_gemini_models(self, gemini_provider, model):
         """Should pass through Gemini model names."""
-        provider = GeminiProvider(api_key="test")
-
-        assert provider._map_model("gemini-2.5-pro") == "gemini-2.5-pro"
-        assert provider._map_model("gemini-2.5-flash") == "gemini-2.5-flash"
-        assert provider._map_model("gemini-2.0-flash-exp") == "gemini-2.0-flash-exp"
+        assert gemini_provider._map_model(model) == model
 
     def test_custom_model_mapping(self):
         """Should use custom model mapping if provided."""
@@ -365,19 +374,15 @@ class TestGeminiModelMapping:
 class TestGeminiProviderHeaders:
     """Tests for request headers."""
 
-    def test_build_headers(self):
+    def test_build_headers(self, gemini_provider):
         """Should build correct headers."""
-        provider = GeminiProvider(api_key="test-api-key")
-
-        headers = provider._build_headers()
+        headers = gemini_provider._build_headers()
 
         assert headers["Content-Type"] == "application/json"
 
-    def test_build_headers_streaming(self):
+    def test_build_headers_streaming(self, gemini_provider):
         """Should add accept header for streaming."""
-        provider = GeminiProvider(api_key="test-api-key")
-
-        headers = provider._build_headers(stream=True)
+        headers = gemini_provider._build_headers(stream=True)
 
         assert headers["Accept"] == "text/event-stream"
 
@@ -385,13 +390,15 @@ class TestGeminiProviderHeaders:
 class TestGeminiProviderToDict:
     """Tests for provider serialization."""
 
-    def test_to_dict(self):
-        """Should convert to dictionary."""
+    def test_to_dict(self, monkeypatch):
+        """Should convert to dictionary from the cached health, without probing."""
         provider = GeminiProvider(api_key="test-api-key")
+        monkeypatch.setattr(provider, "_health", ProviderHealth(status=ProviderStatus.UNKNOWN))
 
         d = provider.to_dict()
 
         assert d["name"] == "gemini"
         assert d["display_name"] == "Google Gemini"
         assert d["is_configured"] is True
-        assert "health" in d
+        assert d["health"]["status"] == "unknown"
+        assert provider._client is None
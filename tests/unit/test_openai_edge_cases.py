@@ -2,32 +2,119 @@
 Comprehensive tests for OpenAI provider edge cases.
 """
 
-import json
+import copy
+
 import pytest
 
-from a2c.providers.openai import OpenAIProvider, DEFAULT_MODEL_MAPPING
+from a2c.providers.openai import DEFAULT_MODEL_MAPPING, OpenAIProvider
+from tests.unit.helpers import freeze
+
+# Shared request payloads; converters must not mutate their input
+_MULTIPLE_TOOL_USES_REQUEST = {
+    "model": "claude-sonnet-4-5",
+    "messages": [
+        {
+            "role": "assistant",
+            "content": [
+                {
+                    "type": "tool_use",
+                    "id": "tool_1",
+                    "name": "search",
+                    "input": {"query": "cats"},
+                },
+                {
+                    "type": "tool_use",
+                    "id": "tool_2",
+                    "name": "calculate",
+                    "input": {"expression": "2+2"},
+                },
+            ],
+        }
+    ],
+}
+
+_MIXED_IMAGES_REQUEST = {
+    "model": "claude-sonnet-4-5",
+    "messages": [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "What's in these images?"},
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "image/jpeg",
+                        "data": "base64data1",
+                    },
+                },
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "image/png",
+                        "data": "base64data2",
+                    },
+                },
+            ],
+        }
+    ],
+}
+
+
+# Shared upstream response; frozen so a mutating converter fails loudly
+_INVALID_ARGUMENTS_RESPONSE = freeze(
+    {
+        "id": "chatcmpl-123",
+        "model": "gpt-4.1",
+        "choices": [
+            {
+                "message": {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_123",
+                            "type": "function",
+                            "function": {
+                                "name": "search",
+                                "arguments": "invalid json {",
+                            },
+                        }
+                    ],
+                },
+                "finish_reason": "tool_calls",
+            }
+        ],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+    }
+)
+
+_MAPPING_CASES = list(DEFAULT_MODEL_MAPPING.items())
+
+
+@pytest.fixture(scope="module")
+def openai_provider() -> OpenAIProvider:
+    """Shared provider for tests that only convert payloads; do not mutate."""
+    return OpenAIProvider(api_key="test")
 
 
 class TestOpenAIProviderEdgeCases:
     """Edge case tests for OpenAI provider."""
 
-    def test_convert_empty_messages(self):
+    def test_convert_empty_messages(self, openai_provider):
         """Should handle empty messages list."""
-        provider = OpenAIProvider(api_key="test")
-
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "messages": [],
         }
 
-        openai_request = provider._convert_request(anthropic_request)
+        openai_request = openai_provider._convert_request(anthropic_request)
 
         assert openai_request["messages"] == []
 
-    def test_convert_system_prompt_as_list(self):
+    def test_convert_system_prompt_as_list(self, openai_provider):
         """Should handle system prompt as list of content blocks."""
-        provider = OpenAIProvider(api_key="test")
-
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "system": [
@@ -37,79 +124,25 @@ class TestOpenAIProviderEdgeCases:
             "messages": [{"role": "user", "content": "Hi"}],
         }
 
-        openai_request = provider._convert_request(anthropic_request)
+        openai_request = openai_provider._convert_request(anthropic_request)
 
-        assert openai_request["messages"][0]["role"] == "system"
-        assert "You are helpful." in openai_request["messages"][0]["content"]
-        assert "Be concise." in openai_request["messages"][0]["content"]
+        system_message = openai_request["messages"][0]
+        assert system_message["role"] == "system"
+        assert "You are helpful." in system_message["content"]
+        assert "Be concise." in system_message["content"]
 
-    def test_convert_multiple_tool_uses(self):
+    def test_convert_multiple_tool_uses(self, openai_provider):
         """Should handle multiple tool uses in one message."""
-        provider = OpenAIProvider(api_key="test")
-
-        anthropic_request = {
-            "model": "claude-sonnet-4-5",
-            "messages": [
-                {
-                    "role": "assistant",
-                    "content": [
-                        {
-                            "type": "tool_use",
-                            "id": "tool_1",
-                            "name": "search",
-                            "input": {"query": "cats"},
-                        },
-                        {
-                            "type": "tool_use",
-                            "id": "tool_2",
-                            "name": "calculate",
-                            "input": {"expression": "2+2"},
-                        },
-                    ],
-                }
-            ],
-        }
-
-        openai_request = provider._convert_request(anthropic_request)
+        openai_request = openai_provider._convert_request(_MULTIPLE_TOOL_USES_REQUEST)
 
         tool_calls = openai_request["messages"][0]["tool_calls"]
         assert len(tool_calls) == 2
         assert tool_calls[0]["function"]["name"] == "search"
         assert tool_calls[1]["function"]["name"] == "calculate"
 
-    def test_convert_mixed_content_with_images(self):
+    def test_convert_mixed_content_with_images(self, openai_provider):
         """Should handle mixed text and image content."""
-        provider = OpenAIProvider(api_key="test")
-
-        anthropic_request = {
-            "model": "claude-sonnet-4-5",
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": "What's in these images?"},
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/jpeg",
-                                "data": "base64data1",
-                            },
-                        },
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/png",
-                                "data": "base64data2",
-                            },
-                        },
-                    ],
-                }
-            ],
-        }
-
-        openai_request = provider._convert_request(anthropic_request)
+        openai_request = openai_provider._convert_request(_MIXED_IMAGES_REQUEST)
 
         content = openai_request["messages"][0]["content"]
         assert isinstance(content, list)
@@ -118,10 +151,42 @@ class TestOpenAIProviderEdgeCases:
         assert content[1]["type"] == "image_url"
         assert content[2]["type"] == "image_url"
 
-    def test_convert_tool_result_with_content_blocks(self):
-        """Should handle tool result with content blocks."""
-        provider = OpenAIProvider(api_key="test")
+    def test_convert_vision_blocks(self, openai_provider):
+        """Should emit data URLs for base64 images and drop unsupported blocks."""
+        openai_request = openai_provider._convert_request(
+            {
+                "model": "claude-sonnet-4-5",
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "text", "text": "Compare"},
+                            {"type": "image", "source": {"type": "base64", "data": "abc"}},
+                            {"type": "image", "source": {"type": "url", "url": "https://x"}},
+                            {"type": "document", "source": {}},
+                            "bare string",
+                        ],
+                    }
+                ],
+            }
+        )
+
+        assert openai_request["messages"][0]["content"] == [
+            {"type": "text", "text": "Compare"},
+            {"type": "image_url", "image_url": {"url": "data:image/png;base64,abc"}},
+        ]
+
+    @pytest.mark.parametrize("request_body", [_MULTIPLE_TOOL_USES_REQUEST, _MIXED_IMAGES_REQUEST])
+    def test_convert_request_does_not_mutate_input(self, openai_provider, request_body):
+        """Should leave the shared request payload untouched."""
+        snapshot = copy.deepcopy(request_body)
+
+        openai_provider._convert_request(request_body)
 
+        assert request_body == snapshot
+
+    def test_convert_tool_result_with_content_blocks(self, openai_provider):
+        """Should handle tool result with content blocks."""
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "messages": [
@@ -141,82 +206,70 @@ class TestOpenAIProviderEdgeCases:
             ],
         }
 
-        openai_request = provider._convert_request(anthropic_request)
+        openai_request = openai_provider._convert_request(anthropic_request)
 
-        assert openai_request["messages"][0]["role"] == "tool"
-        assert "Result line 1" in openai_request["messages"][0]["content"]
-        assert "Result line 2" in openai_request["messages"][0]["content"]
+        tool_message = openai_request["messages"][0]
+        assert tool_message["role"] == "tool"
+        assert "Result line 1" in tool_message["content"]
+        assert "Result line 2" in tool_message["content"]
 
-    def test_convert_response_invalid_json_arguments(self):
+    def test_convert_response_invalid_json_arguments(self, openai_provider):
         """Should handle invalid JSON in function arguments."""
-        provider = OpenAIProvider(api_key="test")
-
-        openai_response = {
-            "id": "chatcmpl-123",
-            "model": "gpt-4.1",
-            "choices": [
-                {
-                    "message": {
-                        "role": "assistant",
-                        "content": None,
-                        "tool_calls": [
-                            {
-                                "id": "call_123",
-                                "type": "function",
-                                "function": {
-                                    "name": "search",
-                                    "arguments": "invalid json {",
-                                },
-                            }
-                        ],
-                    },
-                    "finish_reason": "tool_calls",
-                }
-            ],
-            "usage": {"prompt_tokens": 10, "completion_tokens": 5},
-        }
-
-        anthropic_response = provider._convert_response(openai_response, "claude-sonnet-4-5")
+        anthropic_response = openai_provider._convert_response(
+            _INVALID_ARGUMENTS_RESPONSE, "claude-sonnet-4-5"
+        )
 
         # Should handle gracefully with raw argument
-        assert anthropic_response["content"][0]["type"] == "tool_use"
-        assert "raw" in anthropic_response["content"][0]["input"]
-
-    def test_convert_response_content_filter(self):
-        """Should handle content_filter finish reason."""
-        provider = OpenAIProvider(api_key="test")
-
+        content = anthropic_response["content"][0]
+        assert content["type"] == "tool_use"
+        assert "raw" in content["input"]
+
+    @pytest.mark.parametrize(
+        ("finish_reason", "stop_reason"),
+        [
+            ("stop", "end_turn"),
+            ("length", "max_tokens"),
+            ("tool_calls", "tool_use"),
+            ("content_filter", "end_turn"),
+        ],
+    )
+    def test_convert_response_finish_reason(self, openai_provider, finish_reason, stop_reason):
+        """Should convert OpenAI finish reasons to Anthropic stop reasons."""
         openai_response = {
             "id": "chatcmpl-123",
             "model": "gpt-4.1",
             "choices": [
                 {
-                    "message": {"role": "assistant", "content": "Filtered content"},
-                    "finish_reason": "content_filter",
+                    "message": {"role": "assistant", "content": "x"},
+                    "finish_reason": finish_reason,
                 }
             ],
-            "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+            "usage": {"prompt_tokens": 10, "completion_tokens": 1},
         }
 
-        anthropic_response = provider._convert_response(openai_response, "claude-sonnet-4-5")
+        anthropic_response = openai_provider._convert_response(openai_response, "claude-sonnet-4-5")
 
-        assert anthropic_response["stop_reason"] == "end_turn"
+        assert anthropic_response["stop_reason"] == stop_reason
 
-    def test_model_mapping_o_series(self):
+    @pytest.mark.parametrize("model", ["o1-preview", "o1-mini", "o3-mini", "o4-mini"])
+    def test_model_mapping_o_series(self, openai_provider, model):
         """Should pass through o-series models."""
-        provider = OpenAIProvider(api_key="test")
+        assert openai_provider._map_model(model) == model
 
-        assert provider._map_model("o1-preview") == "o1-preview"
-        assert provider._map_model("o1-mini") == "o1-mini"
-        assert provider._map_model("o3-mini") == "o3-mini"
-        assert provider._map_model("o4-mini") == "o4-mini"
+    @pytest.mark.parametrize("model", ["unknown-model", "claude-unreleased", "o2-mini", ""])
+    def test_model_mapping_unknown_model(self, openai_provider, model):
+        """Should default to gpt-4.1 for unmapped, non-OpenAI models."""
+        assert openai_provider._map_model(model) == "gpt-4.1"
 
-    def test_model_mapping_all_claude_models(self):
+    @pytest.mark.parametrize(("claude_model", "openai_model"), _MAPPING_CASES)
+    def test_model_mapping_all_claude_models(self, openai_provider, claude_model, openai_model):
         """Should map all known Claude models."""
-        provider = OpenAIProvider(api_key="test")
+        assert openai_provider._map_model(claude_model) == openai_model
 
-        for claude_model, openai_model in DEFAULT_MODEL_MAPPING.items():
-            assert provider._map_model(claude_model) == openai_model
+    def test_default_model_mapping_read_only(self):
+        """Should not allow the shared default mapping to be modified."""
+        with pytest.raises(TypeError):
+            DEFAULT_MODEL_MAPPING["claude-opus-4-5"] = "gpt-custom"  # type: ignore[index]
 
     def test_custom_model_mapping_override(self):
         """Should allow custom mapping to override defaults."""
@@ -235,10 +288,8 @@ class TestOpenAIProviderEdgeCases:
         # Default mapping should still work for non-overridden models
         assert provider._map_model("claude-opus-4-5") == "gpt-4.1"
 
-    def test_convert_multiple_tools(self):
+    def test_convert_multiple_tools(self, openai_provider):
         """Should convert multiple tools correctly."""
-        provider = OpenAIProvider(api_key="test")
-
         anthropic_request = {
             "model": "claude-sonnet-4-5",
             "messages": [{"role": "user", "content": "Help me"}],
@@ -262,17 +313,18 @@ class TestOpenAIProviderEdgeCases:
             ],
         }
 
-        openai_request = provider._convert_request(anthropic_request)
+        openai_request = openai_provider._convert_request(anthropic_request)
 
         assert len(openai_request["tools"]) == 2
         assert openai_request["tools"][0]["function"]["name"] == "search"
         assert openai_request["tools"][1]["function"]["name"] == "calculate"
 
 
+# Cheap not-configured and lifecycle checks share one event loop
+@pytest.mark.asyncio(loop_scope="module")
 class TestOpenAIProviderAsync:
     """Async tests for OpenAI provider."""
 
-    @pytest.mark.asyncio
     async def test_send_request_not_configured(self):
         """Should return error when not configured."""
         provider = OpenAIProvider(api_key=None)
@@ -284,7 +336,6 @@ class TestOpenAIProviderAsync:
         assert response.status_code == 401
         assert "not configured" in response.error.lower()
 
-    @pytest.mark.asyncio
     async def test_health_check_not_configured(self):
         """Should return unhealthy when not configured."""
         provider = OpenAIProvider(api_key=None)
@@ -294,7 +345,6 @@ class TestOpenAIProviderAsync:
         assert health.status.value == "unhealthy"
         assert "not configured" in health.error.lower()
 
-    @pytest.mark.asyncio
     async def test_close_client(self):
         """Should close HTTP client properly."""
         provider = OpenAIProvider(api_key="test")
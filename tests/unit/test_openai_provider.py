@@ -225,6 +225,38 @@ class TestOpenAIRequestConversion:
         assert openai_request["messages"][0]["role"] == "tool"
         assert openai_request["messages"][0]["tool_call_id"] == "tool_1"
 
+    def test_convert_block_precedence(self):
+        """Should prefer the first tool_result, then tool_use, over images and text."""
+        provider = OpenAIProvider(api_key="test")
+        image = {"type": "image", "source": {"type": "base64", "data": "x"}}
+        tool_use = {"type": "tool_use", "id": "tool_1", "name": "search", "input": {}}
+
+        openai_request = provider._convert_request(
+            {
+                "model": "claude-sonnet-4-5",
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": [
+                            image,
+                            tool_use,
+                            {"type": "tool_result", "tool_use_id": "tool_1", "content": "a"},
+                            {"type": "tool_result", "tool_use_id": "tool_2", "content": "b"},
+                        ],
+                    },
+                    {
+                        "role": "assistant",
+                        "content": [{"type": "text", "text": "t"}, image, tool_use],
+                    },
+                ],
+            }
+        )
+
+        tool_message, assistant_message = openai_request["messages"]
+        assert tool_message == {"role": "tool", "tool_call_id": "tool_1", "content": "a"}
+        assert assistant_message["content"] is None
+        assert [tc["id"] for tc in assistant_message["tool_calls"]] == ["tool_1"]
+
     def test_convert_temperature(self):
         """Should pass through temperature."""
         provider = OpenAIProvider(api_key="test")
@@ -321,6 +353,20 @@ class TestOpenAIResponseConversion:
         assert anthropic_response["content"][0]["input"] == {"query": "cats"}
         assert anthropic_response["stop_reason"] == "tool_use"
 
+    def test_convert_tool_calls_without_arguments(self):
+        """Should give each parameterless tool call its own empty input."""
+        provider = OpenAIProvider(api_key="test")
+        call = {"id": "call_1", "type": "function", "function": {"name": "now", "arguments": "{}"}}
+
+        anthropic_response = provider._convert_response(
+            {"choices": [{"message": {"tool_calls": [call, call]}, "finish_reason": "tool_calls"}]},
+            "claude-sonnet-4-5",
+        )
+
+        first, second = (block["input"] for block in anthropic_response["content"])
+        assert first == second == {}
+        assert first is not second
+
     def test_convert_max_tokens_finish(self):
         """Should convert length finish_reason to max_tokens."""
         provider = OpenAIProvider(api_key="test")
@@ -391,6 +437,17 @@ class TestOpenAIProviderHeaders:
 
         assert headers["Accept"] == "text/event-stream"
 
+    def test_build_headers_returns_copies(self):
+        """Should not let callers mutate the cached header templates."""
+        provider = OpenAIProvider(api_key="sk-test-key")
+
+        provider._build_headers()["Authorization"] = "Bearer other"
+        provider._build_headers(stream=True).clear()
+
+        assert provider._build_headers()["Authorization"] == "Bearer sk-test-key"
+        assert "Accept" not in provider._build_headers()
+        assert provider._build_headers(stream=True)["Accept"] == "text/event-stream"
+
 
 class TestOpenAIProviderToDict:
     """Tests for provider serialization."""
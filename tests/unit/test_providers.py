@@ -7,9 +7,14 @@ Tests cover:
 3. Provider health checks
 """
 
+import json
+
 import pytest
 
+from a2c.core import estimate_input_tokens
 from a2c.providers import (
+    API_FORMAT_VALUES,
+    STATUS_VALUES,
     AnthropicProvider,
     AntigravityProvider,
     ApiFormat,
@@ -62,6 +67,18 @@ class TestProviderRegistry:
         assert registry.get("test") is None
         assert len(registry.list_providers()) == 0
 
+    def test_register_sync_stream_raises(self):
+        """Should reject providers whose stream_response is not an async generator."""
+
+        class SyncStreamProvider(AnthropicProvider):
+            def stream_response(self, request, *, timeout=120.0):  # type: ignore[override]
+                yield b""
+
+        registry = ProviderRegistry()
+
+        with pytest.raises(TypeError, match="async generator"):
+            registry.register(SyncStreamProvider(name="sync"))
+
     def test_get_or_raise(self):
         """Should raise on missing provider."""
         registry = ProviderRegistry()
@@ -86,6 +103,76 @@ class TestProviderRegistry:
         assert len(healthy_list) == 1
         assert healthy_list[0].name == "healthy"
 
+    def test_list_healthy_providers_tracks_health_changes(self):
+        """Should reflect health stored after registration, until unregistered."""
+        registry = ProviderRegistry()
+        provider = AnthropicProvider(name="test")
+        registry.register(provider)
+        assert registry.list_healthy_providers() == []
+
+        provider._health = ProviderHealth(status=ProviderStatus.HEALTHY)
+        assert registry.list_healthy_providers() == [provider]
+        assert registry.to_dict()["healthy"] == 1
+
+        provider._health = ProviderHealth(status=ProviderStatus.DEGRADED)
+        assert registry.list_healthy_providers() == []
+
+        provider._health = ProviderHealth(status=ProviderStatus.HEALTHY)
+        registry.unregister("test")
+        assert registry.list_healthy_providers() == []
+        assert provider._health_listener is None
+
+    def test_snapshot_counts(self):
+        """Should count providers by health status in one pass."""
+        registry = ProviderRegistry()
+
+        healthy = AnthropicProvider(name="healthy", api_key="key")
+        healthy._health = ProviderHealth(status=ProviderStatus.HEALTHY)
+        degraded = AnthropicProvider(name="degraded", api_key="key")
+        degraded._health = ProviderHealth(status=ProviderStatus.DEGRADED)
+        unknown = AnthropicProvider(name="unknown", api_key="key")
+
+        for provider in (healthy, degraded, unknown):
+            registry.register(provider)
+
+        counts = registry.snapshot_counts()
+        assert counts.total == 3
+        assert counts.configured == 3
+        assert counts.healthy_names == ["healthy"]
+        assert counts.degraded_names == ["degraded"]
+        assert counts.unhealthy_names == ["unknown"]
+
+    def test_snapshot_counts_reset_on_register(self):
+        """Should not serve cached counts after the provider set changes."""
+        registry = ProviderRegistry()
+        assert registry.snapshot_counts().total == 0
+
+        registry.register(AnthropicProvider(name="test"))
+
+        assert registry.snapshot_counts().total == 1
+
+    def test_snapshot_counts_reset_on_health_change(self):
+        """Should not serve cached counts after a provider's health changes."""
+        registry = ProviderRegistry()
+        provider = AnthropicProvider(name="test", api_key="key")
+        registry.register(provider)
+        assert registry.snapshot_counts().healthy_names == []
+
+        provider._health = ProviderHealth(status=ProviderStatus.HEALTHY)
+
+        assert registry.snapshot_counts().healthy_names == ["test"]
+
+    def test_list_configured_tracks_registration(self):
+        """Should refresh the cached configured list on register/unregister."""
+        registry = ProviderRegistry()
+        provider = AnthropicProvider(name="test", api_key="key")
+
+        registry.register(provider)
+        assert registry.list_configured_providers() == (provider,)
+
+        registry.unregister("test")
+        assert registry.list_configured_providers() == ()
+
     def test_to_dict(self):
         """Should convert to dictionary."""
         registry = ProviderRegistry()
@@ -147,6 +234,15 @@ class TestAnthropicProvider:
         headers = provider._build_headers(stream=True)
         assert headers["accept"] == "text/event-stream"
 
+    def test_build_headers_returns_copies(self):
+        """Should not let callers mutate the cached header templates."""
+        provider = AnthropicProvider(api_key="test-key")
+
+        provider._build_headers()["x-api-key"] = "other"
+
+        assert provider._build_headers()["x-api-key"] == "test-key"
+        assert "accept" not in provider._build_headers()
+
     def test_to_dict(self):
         """Should convert to dictionary."""
         provider = AnthropicProvider(api_key="test-key")
@@ -157,6 +253,32 @@ class TestAnthropicProvider:
         assert d["is_configured"] is True
         assert "health" in d
 
+    def test_to_dict_reuses_fragments_until_health_changes(self):
+        """Should rebuild only the health fragment when a new result is stored."""
+        provider = AnthropicProvider(api_key="test-key")
+
+        first = provider.to_dict()
+        second = provider.to_dict()
+        assert second is not first
+        assert second["health"] is first["health"]
+
+        provider._health = ProviderHealth(status=ProviderStatus.HEALTHY, latency_ms=5.0)
+        third = provider.to_dict()
+        assert third["health"]["status"] == "healthy"
+        assert third["health"]["latency_ms"] == 5.0
+        assert third["is_healthy"] is True
+        assert first["health"]["status"] == "unknown"
+        assert list(third) == list(first)
+
+    def test_fragments_shared_with_to_dict(self):
+        """Should expose the same cached fragments that to_dict embeds."""
+        provider = AnthropicProvider(api_key="test-key")
+
+        assert provider.to_dict()["health"] is provider.health_dict()
+        assert provider.capabilities_dict() is provider.capabilities_dict()
+        assert provider.capabilities_dict()["streaming"] is True
+        assert provider.metadata_dict()["display_name"] == "Anthropic"
+
 
 class TestAntigravityProvider:
     """Tests for AntigravityProvider."""
@@ -203,6 +325,26 @@ class TestAntigravityProvider:
         assert "streamGenerateContent" in url
         assert "alt=sse" in url
 
+    async def test_stream_reports_estimated_input_tokens(self, httpx_mock):
+        """Streaming should start with the request's estimated input tokens."""
+        chunk = {"response": {"candidates": [{"content": {"parts": [{"text": "Hi"}]}}]}}
+        httpx_mock.add_response(
+            content=f"data: {json.dumps(chunk)}\n\n".encode(),
+            headers={"content-type": "text/event-stream"},
+        )
+        provider = AntigravityProvider(api_key="test-key")
+        request = {
+            "model": "claude-sonnet-4-5",
+            "messages": [{"role": "user", "content": "Hello there, how are you?"}],
+        }
+
+        output = b"".join([c async for c in provider.stream_response(request)]).decode()
+
+        assert "event: error" not in output
+        message_start = json.loads(output.split("data: ", 1)[1].split("\n", 1)[0])
+        expected = estimate_input_tokens(request)
+        assert message_start["message"]["usage"]["input_tokens"] == expected
+
 
 class TestProviderHealth:
     """Tests for ProviderHealth dataclass."""
@@ -226,6 +368,16 @@ class TestProviderHealth:
         assert health.status == ProviderStatus.UNHEALTHY
         assert health.error == "Connection timeout"
 
+    def test_health_and_info_have_no_instance_dict(self):
+        """Should use slots for the per-check and per-call metadata records."""
+        health = ProviderHealth(status=ProviderStatus.UNKNOWN)
+        info = ProviderInfo(name="test", display_name="Test", api_format=ApiFormat.OPENAI)
+
+        with pytest.raises(AttributeError):
+            health.latency = 1.0  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            info.context_tokens = 1  # type: ignore[attr-defined]
+
 
 class TestProviderStatus:
     """Tests for ProviderStatus enum."""
@@ -237,6 +389,12 @@ class TestProviderStatus:
         assert ProviderStatus.UNHEALTHY.value == "unhealthy"
         assert ProviderStatus.UNKNOWN.value == "unknown"
 
+    def test_status_value_table(self):
+        """Should map every status, and its plain string, to the wire value."""
+        assert STATUS_VALUES == {member: member.value for member in ProviderStatus}
+        assert STATUS_VALUES["healthy"] == "healthy"
+        assert type(STATUS_VALUES[ProviderStatus.HEALTHY]) is str
+
 
 class TestApiFormat:
     """Tests for ApiFormat enum."""
@@ -246,3 +404,27 @@ class TestApiFormat:
         assert ApiFormat.ANTHROPIC.value == "anthropic"
         assert ApiFormat.OPENAI.value == "openai"
         assert ApiFormat.GEMINI.value == "gemini"
+
+    def test_format_value_table(self):
+        """Should map every format to its wire value."""
+        assert API_FORMAT_VALUES == {member: member.value for member in ApiFormat}
+
+
+class TestLazyProviderImports:
+    """Tests for lazily imported provider classes."""
+
+    def test_provider_classes_resolve(self):
+        """Should resolve provider classes from their defining modules."""
+        import a2c.providers as providers
+        from a2c.providers.gemini import GeminiProvider
+        from a2c.providers.openai import OpenAIProvider
+
+        assert providers.GeminiProvider is GeminiProvider
+        assert providers.OpenAIProvider is OpenAIProvider
+
+    def test_unknown_attribute_raises(self):
+        """Should raise AttributeError for names that are not exported."""
+        import a2c.providers as providers
+
+        with pytest.raises(AttributeError):
+            providers.MissingProvider  # noqa: B018
@@ -7,6 +7,11 @@ Tests cover:
 3. Default routing behavior
 """
 
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
 import pytest
 
 from a2c.router import (
@@ -37,6 +42,18 @@ class TestRoutingRule:
         assert rule.matches({}, agent_type="default") is False
         assert rule.matches({}, agent_type=None) is False
 
+    def test_agent_type_canonicalized(self):
+        """Built-in agent types should share one string object; custom ones pass through."""
+        from_enum = RoutingRule(name="a", provider="p", agent_type=AgentType.BACKGROUND)
+        from_copy = RoutingRule(name="b", provider="p", agent_type="".join(["back", "ground"]))
+        custom = RoutingRule(name="c", provider="p", agent_type="my-agent")
+
+        assert type(from_enum.agent_type) is str
+        assert from_enum.agent_type is AgentType.BACKGROUND.value
+        assert from_copy.agent_type is AgentType.BACKGROUND.value
+        assert custom.agent_type == "my-agent"
+        assert from_enum.to_dict()["conditions"]["agent_type"] == "background"
+
     def test_matches_model_pattern(self):
         """Rule should match on model pattern."""
         rule = RoutingRule(
@@ -53,6 +70,47 @@ class TestRoutingRule:
         assert rule.matches({"model": "claude-sonnet-4-5"}) is False
         assert rule.matches({"model": "gpt-4"}) is False
 
+    def test_model_pattern_compiled_once(self):
+        """Should compile the pattern at construction, case-insensitively."""
+        rule = RoutingRule(name="opus-rule", provider="antigravity", model_pattern=r"claude-opus")
+
+        assert rule._model_re is not None
+        assert rule._model_re.flags & re.IGNORECASE
+        assert rule.matches({"model": "CLAUDE-OPUS-4-5"}) is True
+        # re.match semantics: anchored at the start of the model name
+        assert rule.matches({"model": "x-claude-opus"}) is False
+        assert rule.matches({}) is False
+
+        with pytest.raises(re.error):
+            RoutingRule(name="bad", provider="antigravity", model_pattern="(")
+
+    def test_model_pattern_prefers_re2(self, monkeypatch):
+        """Should compile with RE2 when present and fall back for unsupported patterns."""
+        from a2c.router import rules
+
+        compiled = []
+
+        class FakeRe2:
+            error = ValueError
+
+            @staticmethod
+            def compile(pattern):
+                if "(?=" in pattern:
+                    raise ValueError("lookahead not supported")
+                compiled.append(pattern)
+                return re.compile(pattern)
+
+        monkeypatch.setattr(rules, "_re2", FakeRe2)
+
+        rule = RoutingRule(name="opus-rule", provider="antigravity", model_pattern="a|claude-opus")
+        assert compiled == ["(?i:a|claude-opus)"]
+        assert rule.matches({"model": "CLAUDE-OPUS-4-5"}) is True
+        assert rule.matches({"model": "x-claude-opus"}) is False
+
+        fallback = RoutingRule(name="la", provider="antigravity", model_pattern="(?=claude)c")
+        assert compiled == ["(?i:a|claude-opus)"]
+        assert fallback.matches({"model": "Claude"}) is True
+
     def test_matches_thinking_enabled(self):
         """Rule should match on thinking enabled."""
         rule = RoutingRule(
@@ -102,6 +160,19 @@ class TestRoutingRule:
         assert rule.matches({"thinking": {"type": "enabled"}}, agent_type="default") is False
         assert rule.matches({}, agent_type="think") is False
 
+    def test_rule_has_no_instance_dict(self):
+        """Rules should be slotted and immutable."""
+        rule = RoutingRule(name="r", provider="p", model_pattern="opus")
+
+        assert not hasattr(rule, "__dict__")
+        # Frozen and slotted; older Pythons raise TypeError from the generated
+        # __setattr__ of slotted frozen dataclasses instead of FrozenInstanceError
+        with pytest.raises((AttributeError, TypeError)):
+            rule.unknown = 1  # type: ignore[attr-defined]
+        with pytest.raises((AttributeError, TypeError)):
+            rule.priority = 5  # type: ignore[misc]
+        assert replace(rule, priority=5).matches({"model": "opus-4"}) is True
+
     def test_to_dict(self):
         """Rule should convert to dictionary."""
         rule = RoutingRule(
@@ -118,6 +189,19 @@ class TestRoutingRule:
         assert d["priority"] == 50
         assert d["conditions"]["agent_type"] == "background"
 
+    def test_to_dict_returns_independent_copies(self):
+        """Mutating one to_dict result should not affect later results."""
+        rule = RoutingRule(name="test-rule", provider="anthropic", thinking_enabled=True)
+
+        first = rule.to_dict()
+        first["provider"] = "changed"
+        first["conditions"]["thinking_enabled"] = False
+        second = rule.to_dict()
+
+        assert second["provider"] == "anthropic"
+        assert second["conditions"] is not first["conditions"]
+        assert second["conditions"]["thinking_enabled"] is True
+
 
 class TestRouter:
     """Tests for Router class."""
@@ -134,6 +218,29 @@ class TestRouter:
         assert router.rules[1].name == "mid"
         assert router.rules[2].name == "low"
 
+    def test_add_rule_keeps_insertion_order_for_equal_priority(self):
+        """Rules with the same priority should stay in the order they were added."""
+        router = Router()
+
+        for name, priority in [("a", 5), ("b", 10), ("c", 5), ("d", 10), ("e", 0)]:
+            router.add_rule(RoutingRule(name=name, provider="p", priority=priority))
+
+        assert [r.name for r in router.rules] == ["b", "d", "a", "c", "e"]
+
+    def test_add_rule_sorts_unsorted_initial_rules(self):
+        """Adding a rule should sort rules passed to the constructor in any order."""
+        router = Router(
+            rules=[
+                RoutingRule(name="low", provider="a", priority=10),
+                RoutingRule(name="high", provider="b", priority=100),
+            ]
+        )
+
+        router.add_rule(RoutingRule(name="mid", provider="c", priority=50))
+
+        assert [r.name for r in router.rules] == ["high", "mid", "low"]
+        assert router.get_matching_rule({}) == "high"
+
     def test_select_provider_matches_first_rule(self):
         """Should return provider from first matching rule."""
         router = Router(default_provider="default")
@@ -202,6 +309,223 @@ class TestRouter:
         assert router.get_matching_rule({}, agent_type="background") == "background"
         assert router.get_matching_rule({}, agent_type="default") is None
 
+    def test_agent_buckets_match_linear_scan(self):
+        """Bucketing rules by agent type should pick the same rule as a full scan."""
+        router = Router(default_provider="fallback")
+        router.add_rule(
+            RoutingRule(name="think", provider="t", priority=100, thinking_enabled=True)
+        )
+        router.add_rule(RoutingRule(name="bg", provider="b", priority=90, agent_type="background"))
+        router.add_rule(RoutingRule(name="opus", provider="o", priority=80, model_pattern="opus"))
+        router.add_rule(RoutingRule(name="dflt", provider="d", priority=70, agent_type="default"))
+        router.add_rule(RoutingRule(name="code", provider="c", priority=60, agent_type="code"))
+        router.add_rule(
+            RoutingRule(name="long", provider="l", priority=50, min_context_tokens=1000)
+        )
+        router.add_rule(RoutingRule(name="calm", provider="n", priority=40, thinking_enabled=False))
+
+        requests = [{}, {"model": "opus-4"}, {"thinking": {"type": "enabled"}}]
+        for agent_type in [None, "default", "background", "code", "websearch"]:
+            for request in requests:
+                for tokens in [0, 1000]:
+                    expected = next(
+                        (r.name for r in router.rules if r.matches(request, agent_type, tokens)),
+                        None,
+                    )
+                    assert router.get_matching_rule(request, agent_type, tokens) == expected
+
+    def test_agent_buckets_rebuilt_on_rule_changes(self):
+        """Should not route with stale buckets after rules are added or removed."""
+        router = Router(default_provider="fallback")
+        assert router.select_provider({}, agent_type="background") == "fallback"
+
+        router.add_rule(RoutingRule(name="bg", provider="b", agent_type="background"))
+        assert router.select_provider({}, agent_type="background") == "b"
+
+        router.remove_rule("bg")
+        assert router.select_provider({}, agent_type="background") == "fallback"
+
+    def test_agent_buckets_rebuilt_on_direct_list_edits(self):
+        """Should pick up rules appended, replaced or removed on router.rules directly."""
+        router = Router(default_provider="fallback")
+        assert router.select_provider({}, agent_type="background") == "fallback"
+
+        router.rules.append(RoutingRule(name="bg", provider="b", agent_type="background"))
+        assert router.select_provider({}, agent_type="background") == "b"
+        assert [r.name for r in router.rules_with_agent_type()] == ["bg"]
+
+        router.rules[0] = replace(router.rules[0], provider="b2")
+        assert router.select_provider({}, agent_type="background") == "b2"
+
+        router.rules = []
+        assert router.select_provider({}, agent_type="background") == "fallback"
+        assert router.rules_with_agent_type() == []
+
+    def test_memoized_routing_respects_context_thresholds(self):
+        """Memoized decisions should flip exactly at each rule's context limits."""
+        router = Router(default_provider="fallback")
+        router.add_rule(
+            RoutingRule(name="long", provider="l", priority=10, min_context_tokens=100_000)
+        )
+        router.add_rule(RoutingRule(name="short", provider="s", max_context_tokens=999))
+
+        for tokens, expected in [
+            (0, "s"),
+            (999, "s"),
+            (1000, "fallback"),
+            (99_999, "fallback"),
+            (100_000, "l"),
+            (999, "s"),
+        ]:
+            assert router.select_provider({"model": "m"}, context_tokens=tokens) == expected
+
+        assert len(router._route_memo) == 3
+
+    def test_context_ranges_match_linear_scan(self):
+        """Context-range buckets should admit exactly the rules whose limits allow the size."""
+        router = Router(default_provider="fallback")
+        router.add_rule(RoutingRule(name="huge", provider="h", priority=40, min_context_tokens=500))
+        for name, priority, low, high in [("mid", 30, 100, 499), ("never", 20, 50, 9)]:
+            router.add_rule(
+                RoutingRule(
+                    name=name,
+                    provider="p",
+                    priority=priority,
+                    min_context_tokens=low,
+                    max_context_tokens=high,
+                )
+            )
+        router.add_rule(RoutingRule(name="tiny", provider="t", priority=10, max_context_tokens=99))
+
+        for tokens in [0, 9, 10, 49, 50, 99, 100, 499, 500, 10**6]:
+            expected = next((r.name for r in router.rules if r.matches({}, None, tokens)), None)
+            assert router.get_matching_rule({}, context_tokens=tokens) == expected
+
+    def test_thinking_mask_agrees_with_matches(self):
+        """The thinking quick-reject should never drop a rule that would match."""
+        router = Router(default_provider="fallback")
+        router.add_rule(RoutingRule(name="on", provider="t", priority=20, thinking_enabled=True))
+        router.add_rule(RoutingRule(name="off", provider="f", priority=10, thinking_enabled=False))
+
+        assert router.rules[0]._mask != router.rules[1]._mask
+        assert RoutingRule(name="any", provider="p")._mask == 0
+        for thinking, expected in [
+            ({"type": "enabled"}, "on"),
+            (True, "on"),
+            ({"type": "disabled"}, "off"),
+            (None, "off"),
+        ]:
+            assert router.get_matching_rule({"thinking": thinking}) == expected
+
+    def test_thinking_extracted_once_per_request(self, monkeypatch):
+        """Routing should normalize the thinking field once, not once per rule."""
+        from a2c.router import rules
+
+        calls = []
+        original = rules._is_thinking
+        monkeypatch.setattr(rules, "_is_thinking", lambda r: calls.append(r) or original(r))
+        router = Router(default_provider="fallback")
+        for i in range(5):
+            router.add_rule(
+                RoutingRule(name=f"r{i}", provider="p", priority=i, thinking_enabled=True)
+            )
+
+        assert router.select_provider({"thinking": {"type": "disabled"}}) == "fallback"
+        assert len(calls) == 1
+
+    def test_overlapping_model_patterns(self):
+        """A lower-priority pattern should still match when a higher one is filtered out."""
+        router = Router(default_provider="fallback")
+        router.add_rule(
+            RoutingRule(
+                name="opus-think",
+                provider="t",
+                priority=20,
+                model_pattern="claude-opus",
+                thinking_enabled=True,
+            )
+        )
+        router.add_rule(
+            RoutingRule(name="claude", provider="c", priority=10, model_pattern="claude")
+        )
+        router.add_rule(RoutingRule(name="opus-bg", provider="b", model_pattern="claude-opus"))
+        thinking = {"model": "claude-opus-4", "thinking": True}
+
+        assert router.get_matching_rule({"model": "claude-opus-4"}) == "claude"
+        assert router.get_matching_rule(thinking) == "opus-think"
+        assert router.get_matching_rule({"model": "gpt-4"}) is None
+
+        # Shared pattern strings get one bit; each model is tested once
+        assert len(router._patterns) == 2
+        assert router._model_bits == {"claude-opus-4": 0b11, "gpt-4": 0}
+
+    def test_select_provider_batch_matches_scalar(self):
+        """Batch routing should agree with select_provider request by request."""
+        router = create_default_router()
+        requests = [
+            {"model": "claude-opus-4-5"},
+            {"model": "claude-sonnet-4-5", "thinking": {"type": "enabled"}},
+            {"model": "claude-haiku-4-5"},
+            {"model": "claude-opus-4-5"},
+            {},
+        ]
+        agent_types = [None, None, "background", "websearch", "think"]
+        tokens = [0, 10, 0, 10**7, 0]
+
+        expected = [
+            router.select_provider(r, a, t)
+            for r, a, t in zip(requests, agent_types, tokens, strict=True)
+        ]
+
+        assert router.select_provider_batch(requests, agent_types, tokens) == expected
+        assert router.select_provider_batch(requests) == [
+            router.select_provider(r) for r in requests
+        ]
+        assert router.select_provider_batch([]) == []
+        with pytest.raises(ValueError):
+            router.select_provider_batch(requests, agent_types[:2])
+
+    def test_memoized_routing_not_stale_after_direct_edits(self):
+        """Memoized decisions should be dropped when router.rules changes in any way."""
+        router = Router(default_provider="fallback")
+        router.rules.append(RoutingRule(name="opus", provider="o", model_pattern="opus"))
+        assert router.select_provider({"model": "opus-4"}) == "o"
+        assert router._route_memo
+
+        router.rules.insert(0, RoutingRule(name="all", provider="a", priority=10))
+        assert router.select_provider({"model": "opus-4"}) == "a"
+
+        router.rules = [replace(r, provider="o2") for r in router.rules if r.name == "opus"]
+        assert router.select_provider({"model": "opus-4"}) == "o2"
+
+    def test_memoized_routing_isolated_between_default_routers(self):
+        """Changing one default router's rules should not affect another's decisions."""
+        first = create_default_router()
+        second = create_default_router()
+        request = {"model": "claude-opus-4-5"}
+        assert first.select_provider(request) == second.select_provider(request) == "antigravity"
+
+        index = next(i for i, r in enumerate(first.rules) if r.name == "opus-models")
+        first.rules[index] = replace(first.rules[index], provider="other")
+
+        assert first.select_provider(request) == "other"
+        assert second.select_provider(request) == "antigravity"
+
+    def test_memoized_routing_keys_on_model_and_thinking(self):
+        """Requests differing only in model or thinking should not share a decision."""
+        router = Router(default_provider="fallback")
+        router.add_rule(RoutingRule(name="think", provider="t", priority=10, thinking_enabled=True))
+        router.add_rule(RoutingRule(name="opus", provider="o", model_pattern="opus"))
+
+        assert router.select_provider({"model": "opus-4"}) == "o"
+        assert router.select_provider({"model": "sonnet-4"}) == "fallback"
+        assert router.select_provider({"model": "sonnet-4", "thinking": True}) == "t"
+        assert router.select_provider({"model": "opus-4"}) == "o"
+
+        router.remove_rule("opus")
+        assert router._route_memo == {}
+        assert router.select_provider({"model": "opus-4"}) == "fallback"
+
     def test_to_dict(self):
         """Router should convert to dictionary."""
         router = Router(default_provider="anthropic")
@@ -227,6 +551,20 @@ class TestDefaultRouter:
         assert len(router.rules) > 0
         assert router.default_provider == "anthropic"
 
+    def test_default_routers_share_rules_not_lists(self):
+        """Default routers should reuse built rules but own their rule lists."""
+        first = create_default_router()
+        second = create_default_router()
+
+        assert first.rules is not second.rules
+        assert all(a is b for a, b in zip(first.rules, second.rules, strict=True))
+        assert [r.priority for r in first.rules] == sorted(
+            (r.priority for r in first.rules), reverse=True
+        )
+
+        first.remove_rule("opus-models")
+        assert second.get_matching_rule({"model": "claude-opus-4-5"}) == "opus-models"
+
     def test_default_router_has_thinking_rule(self):
         """Default router should have thinking rule."""
         router = create_default_router()
@@ -243,6 +581,16 @@ class TestDefaultRouter:
         agent_rules = [r for r in router.rules if r.agent_type is not None]
         assert len(agent_rules) >= 3  # background, think, websearch
 
+    def test_rules_with_agent_type(self):
+        """Should list agent-restricted rules in priority order and track changes."""
+        router = create_default_router()
+
+        names = [r.name for r in router.rules_with_agent_type()]
+        assert names == [r.name for r in router.rules if r.agent_type is not None]
+
+        router.remove_rule("background")
+        assert "background" not in [r.name for r in router.rules_with_agent_type()]
+
     def test_get_router_singleton(self):
         """get_router should return same instance."""
         router1 = get_router()
@@ -258,6 +606,28 @@ class TestDefaultRouter:
 
         assert router1 is not router2
 
+    def test_get_router_creates_once_across_threads(self, monkeypatch):
+        """Concurrent first calls should all get the one router created."""
+        from a2c.router import rules
+
+        created = []
+
+        def slow_create() -> Router:
+            time.sleep(0.01)
+            created.append(Router())
+            return created[-1]
+
+        monkeypatch.setattr(rules, "create_default_router", slow_create)
+        reset_router()
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                routers = list(pool.map(lambda _: get_router(), range(16)))
+        finally:
+            reset_router()
+
+        assert len(created) == 1
+        assert all(r is created[0] for r in routers)
+
 
 class TestAgentType:
     """Tests for AgentType enum."""
@@ -0,0 +1,280 @@
+"""
+Tests for server route helpers.
+
+Tests cover:
+1. SSE keep-alive wrapper for streaming responses
+2. JSON error responses
+3. Debug stats caching
+4. Debug request lookup by ID
+5. Debug SSE event streaming
+"""
+
+import asyncio
+import json
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from a2c.server.routes import debug
+from a2c.server.routes.anthropic import SSE_PING_EVENT, _error_response, _with_keepalive
+
+
+async def _collect(stream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+class TestSSEKeepalive:
+    """Tests for the SSE keep-alive wrapper."""
+
+    async def test_passes_chunks_through(self):
+        """Should forward chunks unchanged when upstream is fast."""
+
+        async def upstream():
+            yield b"event: a\ndata: {}\n\n"
+            yield b"event: b\ndata: {}\n\n"
+
+        chunks = await _collect(_with_keepalive(upstream(), interval=1.0))
+
+        assert chunks == [b"event: a\ndata: {}\n\n", b"event: b\ndata: {}\n\n"]
+
+    async def test_pings_while_idle(self):
+        """Should emit ping events while upstream is silent."""
+
+        async def upstream():
+            yield b"event: a\ndata: {}\n\n"
+            await asyncio.sleep(0.05)
+            yield b"event: b\ndata: {}\n\n"
+
+        chunks = await _collect(_with_keepalive(upstream(), interval=0.01))
+
+        assert chunks[0] == b"event: a\ndata: {}\n\n"
+        assert chunks[-1] == b"event: b\ndata: {}\n\n"
+        assert SSE_PING_EVENT in chunks
+
+    async def test_no_ping_mid_event(self):
+        """Should not inject pings when an event is split across chunks."""
+
+        async def upstream():
+            yield b"event: a\ndata: {"
+            await asyncio.sleep(0.05)
+            yield b"}\n\n"
+
+        chunks = await _collect(_with_keepalive(upstream(), interval=0.01))
+
+        assert chunks == [b"event: a\ndata: {", b"}\n\n"]
+
+    async def test_upstream_error_propagates(self):
+        """Should re-raise errors from the upstream stream."""
+
+        async def upstream():
+            yield b"event: a\ndata: {}\n\n"
+            raise RuntimeError("upstream failed")
+
+        chunks = []
+        with pytest.raises(RuntimeError, match="upstream failed"):
+            async for chunk in _with_keepalive(upstream(), interval=1.0):
+                chunks.append(chunk)
+
+        assert chunks == [b"event: a\ndata: {}\n\n"]
+
+    async def test_close_stops_upstream(self):
+        """Should stop reading upstream when the client goes away."""
+        closed = asyncio.Event()
+
+        async def upstream():
+            try:
+                yield b"event: a\ndata: {}\n\n"
+                await asyncio.sleep(10)
+                yield b"event: b\ndata: {}\n\n"
+            finally:
+                closed.set()
+
+        stream = _with_keepalive(upstream(), interval=1.0)
+        assert await stream.__anext__() == b"event: a\ndata: {}\n\n"
+        await stream.aclose()
+
+        await asyncio.wait_for(closed.wait(), timeout=1.0)
+
+
+class TestErrorResponse:
+    """Tests for the JSON error response helper."""
+
+    def test_escapes_message(self):
+        """Should produce valid JSON for messages with quotes and newlines."""
+        response = _error_response("provider_error", 'bad "value"\nline two', 502)
+
+        assert response.status_code == 502
+        assert json.loads(response.body) == {
+            "error": {"type": "provider_error", "message": 'bad "value"\nline two'}
+        }
+
+    def test_extra_headers(self):
+        """Should attach extra headers."""
+        response = _error_response("routing_error", "oops", 500, headers={"X-Provider": "p"})
+
+        assert response.headers["X-Provider"] == "p"
+
+
+class CountingStatsStore:
+    """Debug store double that counts get_stats calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_stats(self, hours: int = 24) -> dict:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {"period_hours": hours, "total_requests": self.calls}
+
+
+class TestDebugStatsCache:
+    """Tests for the debug stats TTL cache."""
+
+    @pytest.fixture
+    def store(self):
+        """Provide a counting store with an empty cache."""
+        return CountingStatsStore()
+
+    async def test_concurrent_misses_share_query(self, store):
+        """Should run one query for concurrent callers of the same period."""
+        results = await asyncio.gather(*(debug._cached_stats(store, 24) for _ in range(5)))
+
+        assert store.calls == 1
+        assert all(r is results[0] for r in results)
+
+    async def test_periods_cached_separately(self, store):
+        """Should key the cache by period."""
+        await debug._cached_stats(store, 24)
+        await debug._cached_stats(store, 1)
+
+        assert store.calls == 2
+
+    async def test_expired_entry_refreshed(self, store, monkeypatch):
+        """Should query again once the TTL has elapsed."""
+        monkeypatch.setattr(debug, "STATS_CACHE_TTL_SECONDS", 0.0)
+
+        await debug._cached_stats(store, 24)
+        await debug._cached_stats(store, 24)
+
+        assert store.calls == 2
+
+    async def test_stores_cached_separately(self, store):
+        """Should key the cache by store, not just by period."""
+        other = CountingStatsStore()
+
+        await debug._cached_stats(store, 24)
+        await debug._cached_stats(other, 24)
+
+        assert store.calls == 1
+        assert other.calls == 1
+
+
+class LookupStore:
+    """Debug store double recording which lookup was used."""
+
+    def __init__(self):
+        self.lookups: list[tuple[str, object]] = []
+
+    async def get_request(self, request_id: str) -> dict:
+        self.lookups.append(("request_id", request_id))
+        return {"request_id": request_id}
+
+    async def get_request_by_uuid(self, uuid_id: uuid.UUID) -> dict:
+        self.lookups.append(("uuid", uuid_id))
+        return {"id": str(uuid_id)}
+
+
+class TestDebugGetRequest:
+    """Tests for the debug request lookup endpoint."""
+
+    async def test_tracking_id_lookup(self):
+        """Should look up req_ IDs by request_id."""
+        store = LookupStore()
+
+        await debug.get_request("req_abc123", store)
+
+        assert store.lookups == [("request_id", "req_abc123")]
+
+    async def test_uuid_lookup(self):
+        """Should look up UUIDs by database ID."""
+        store = LookupStore()
+        uuid_id = uuid.uuid4()
+
+        await debug.get_request(str(uuid_id), store)
+
+        assert store.lookups == [("uuid", uuid_id)]
+
+    async def test_malformed_id_rejected(self):
+        """Should return 400 for IDs that are neither format."""
+        store = LookupStore()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await debug.get_request("not-an-id", store)
+
+        assert exc_info.value.status_code == 400
+        assert store.lookups == []
+
+
+class EventsStore:
+    """Debug store double streaming canned SSE event rows."""
+
+    def __init__(self, rows: list[tuple[bool, dict | None]]):
+        self.rows = rows
+
+    async def iter_sse_events(self, request_id: str):
+        for row in self.rows:
+            yield row
+
+
+async def _body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+class TestDebugRequestEvents:
+    """Tests for the streamed SSE events endpoint."""
+
+    async def test_streams_json_object(self):
+        """Should stream a JSON object with all events and a count."""
+        store = EventsStore([(True, {"sequence": 0}), (True, {"sequence": 1})])
+
+        response = await debug.get_request_events("req_1", store, None)
+        body = json.loads(await _body(response))
+
+        assert body["request_id"] == "req_1"
+        assert body["events_count"] == 2
+        assert [e["sequence"] for e in body["events"]] == [0, 1]
+
+    async def test_streams_ndjson(self):
+        """Should emit one event per line for NDJSON clients."""
+        store = EventsStore([(True, {"sequence": 0}), (True, {"sequence": 1})])
+
+        response = await debug.get_request_events("req_1", store, "application/x-ndjson")
+        lines = (await _body(response)).splitlines()
+
+        assert response.media_type == "application/x-ndjson"
+        assert [json.loads(line)["sequence"] for line in lines] == [0, 1]
+
+    async def test_streaming_request_without_events(self):
+        """Should return an empty list when no events were recorded."""
+        store = EventsStore([(True, None)])
+
+        response = await debug.get_request_events("req_1", store, None)
+        body = json.loads(await _body(response))
+
+        assert body["events"] == []
+        assert body["events_count"] == 0
+
+    async def test_missing_request(self):
+        """Should return 404 for unknown requests."""
+        with pytest.raises(HTTPException) as exc_info:
+            await debug.get_request_events("req_missing", EventsStore([]))
+
+        assert exc_info.value.status_code == 404
+
+    async def test_non_streaming_request(self):
+        """Should return 400 for non-streaming requests."""
+        with pytest.raises(HTTPException) as exc_info:
+            await debug.get_request_events("req_1", EventsStore([(False, None)]))
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,273 @@
+"""
+Tests for WebSocket connection management and broadcasting.
+
+Tests cover:
+1. Topic subscription and disconnection
+2. Broadcast fan-out and serialization
+3. Cleanup of failed connections
+4. The shared connection loop
+"""
+
+import asyncio
+import json
+
+from a2c.server.websocket import routes as ws_routes
+from a2c.server.websocket.events import ConnectionManager, EventType
+
+
+class FakeWebSocket:
+    """Minimal WebSocket double recording sent frames."""
+
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        self.fail = fail
+        self.delay = delay
+        self.accepted = False
+        self.close_code: int | None = None
+        self.sent: list[str | bytes] = []
+
+    async def accept(self) -> None:
+        self.accepted = True
+
+    async def send_text(self, data: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(data)
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self.send_text(data)  # type: ignore[arg-type]
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+    def messages(self) -> list[dict]:
+        return [json.loads(m) for m in self.sent]
+
+
+class TestConnectionManager:
+    """Tests for ConnectionManager."""
+
+    async def test_connect_sends_confirmation(self):
+        """Should accept and send a connected event."""
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+
+        await manager.connect(ws, ["requests"])
+
+        assert ws.accepted is True
+        assert ws.messages()[0]["type"] == EventType.CONNECTED.value
+        assert manager.connection_count == 1
+
+    async def test_broadcast_reaches_topic_and_all(self):
+        """Should deliver to topic subscribers and "all" subscribers only."""
+        manager = ConnectionManager()
+        requests_ws = FakeWebSocket()
+        all_ws = FakeWebSocket()
+        stats_ws = FakeWebSocket()
+        await manager.connect(requests_ws, ["requests"])
+        await manager.connect(all_ws, ["all"])
+        await manager.connect(stats_ws, ["stats"])
+
+        await manager.broadcast(EventType.REQUEST_STARTED, {"id": 1}, topic="requests")
+
+        assert requests_ws.messages()[-1]["data"] == {"id": 1}
+        assert all_ws.messages()[-1]["type"] == EventType.REQUEST_STARTED.value
+        assert len(stats_ws.sent) == 1  # Only the connected event
+
+    async def test_broadcast_delivers_once_per_socket(self):
+        """Should not send twice to a socket subscribed to a topic and "all"."""
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws, ["requests", "all"])
+
+        await manager.broadcast(EventType.REQUEST_STARTED, {}, topic="requests")
+
+        assert len(ws.sent) == 2  # connected + one event
+
+    async def test_broadcast_payload_identical_across_recipients(self):
+        """Should send the same serialized frame to every recipient."""
+        manager = ConnectionManager()
+        first = FakeWebSocket()
+        second = FakeWebSocket()
+        await manager.connect(first, ["stats"])
+        await manager.connect(second, ["stats"])
+
+        await manager.broadcast_stats_update({"total": 3})
+
+        assert first.sent[-1] == second.sent[-1]
+
+    async def test_broadcast_drops_failed_connections(self):
+        """Should disconnect sockets that fail to receive."""
+        manager = ConnectionManager()
+        good = FakeWebSocket()
+        bad = FakeWebSocket()
+        await manager.connect(good, ["requests"])
+        await manager.connect(bad, ["requests"])
+        bad.fail = True
+
+        await manager.broadcast(EventType.REQUEST_ERROR, {}, topic="requests")
+
+        assert manager.connection_count == 1
+        assert len(good.sent) == 2
+
+    async def test_broadcast_drops_stalled_connections(self):
+        """Should not let a stalled client block delivery to others."""
+        manager = ConnectionManager(send_timeout=0.01)
+        fast = FakeWebSocket()
+        slow = FakeWebSocket()
+        await manager.connect(fast, ["requests"])
+        await manager.connect(slow, ["requests"])
+        slow.delay = 1.0
+
+        await manager.broadcast(EventType.REQUEST_STARTED, {}, topic="requests")
+        await asyncio.sleep(0.01)  # Let the background close run
+
+        assert len(fast.sent) == 2
+        assert manager.connection_count == 1
+        assert slow.close_code == 1011
+        assert fast.close_code is None
+
+    async def test_binary_subscribers_get_bytes(self):
+        """Should send binary frames to binary clients and text to others."""
+        manager = ConnectionManager()
+        text_ws = FakeWebSocket()
+        binary_ws = FakeWebSocket()
+        await manager.connect(text_ws, ["stats"])
+        await manager.connect(binary_ws, ["stats"], binary=True)
+
+        await manager.broadcast_stats_update({"total": 1})
+
+        assert isinstance(text_ws.sent[-1], str)
+        assert isinstance(binary_ws.sent[-1], bytes)
+        assert binary_ws.sent[-1] == text_ws.sent[-1].encode()
+        assert all(isinstance(m, bytes) for m in binary_ws.sent)
+
+    async def test_batching_coalesces_events(self):
+        """Should deliver events queued within the window as one batch frame."""
+        manager = ConnectionManager(batch_window=60.0)
+        ws = FakeWebSocket()
+        await manager.connect(ws, ["requests"])
+
+        await manager.broadcast(EventType.REQUEST_STARTED, {"n": 1}, topic="requests")
+        await manager.broadcast(EventType.REQUEST_COMPLETED, {"n": 2}, topic="requests")
+        assert len(ws.sent) == 1  # Still queued
+
+        await manager.flush()
+
+        batch = ws.messages()[-1]
+        assert batch["type"] == EventType.BATCH.value
+        assert [e["data"]["n"] for e in batch["data"]["events"]] == [1, 2]
+
+    async def test_batching_flushes_full_batch_early(self):
+        """Should send immediately once a topic reaches max_batch_size."""
+        manager = ConnectionManager(batch_window=60.0, max_batch_size=2)
+        ws = FakeWebSocket()
+        await manager.connect(ws, ["stats"])
+
+        await manager.broadcast_stats_update({"n": 1})
+        await manager.broadcast_stats_update({"n": 2})
+
+        assert len(ws.messages()[-1]["data"]["events"]) == 2
+
+    async def test_batching_single_event_unwrapped(self):
+        """Should send a lone queued event in the regular format."""
+        manager = ConnectionManager(batch_window=0.001)
+        ws = FakeWebSocket()
+        await manager.connect(ws, ["stats"])
+
+        await manager.broadcast_stats_update({"n": 1})
+        await asyncio.sleep(0.01)
+
+        assert ws.messages()[-1]["type"] == EventType.STATS_UPDATE.value
+
+    async def test_connection_info_tracks_subscriptions(self):
+        """Should reuse the encoded info until subscriptions change."""
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+
+        empty = manager.connection_info_json()
+        assert manager.connection_info_json() is empty
+
+        await manager.connect(ws, ["requests"])
+        info = json.loads(manager.connection_info_json())
+
+        assert info["total_connections"] == 1
+        assert info["topics"]["requests"] == 1
+        assert info["topics"]["all"] == 0
+
+    async def test_connect_spawns_no_background_tasks(self):
+        """Should not keep per-connection tasks alive between broadcasts."""
+        manager = ConnectionManager()
+        before = len(asyncio.all_tasks())
+
+        for _ in range(3):
+            await manager.connect(FakeWebSocket(), ["requests"])
+        await manager.broadcast(EventType.REQUEST_STARTED, {}, topic="requests")
+
+        assert len(asyncio.all_tasks()) == before
+
+    async def test_disconnect_removes_from_all_topics(self):
+        """Should remove socket from every subscribed topic."""
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws, ["requests", "providers"])
+
+        await manager.disconnect(ws)
+
+        assert manager.connection_count == 0
+        assert all(len(c) == 0 for c in manager.active_connections.values())
+
+
+class ScriptedWebSocket(FakeWebSocket):
+    """WebSocket double that replays a fixed sequence of ASGI messages."""
+
+    def __init__(self, messages: list[dict]):
+        super().__init__()
+        self.incoming = list(messages)
+
+    async def receive(self) -> dict:
+        return self.incoming.pop(0)
+
+
+class TestServeLoop:
+    """Tests for the shared WebSocket connection loop."""
+
+    async def test_close_ends_loop_and_unsubscribes(self, monkeypatch):
+        """Should answer pings, then return on a client close without raising."""
+        manager = ConnectionManager()
+        monkeypatch.setattr(ws_routes, "_manager", manager)
+        ws = ScriptedWebSocket(
+            [
+                {"type": "websocket.receive", "text": '{"type":"ping"}'},
+                {"type": "websocket.disconnect", "code": 1000},
+            ]
+        )
+
+        await ws_routes._serve(ws, ("requests",), binary=False)
+
+        assert ws.messages()[-1]["type"] == EventType.PONG.value
+        assert manager.connection_count == 0
+
+    async def test_rejects_when_slots_exhausted(self, monkeypatch):
+        """Should close new clients with 1013 once the limit is reached."""
+        manager = ConnectionManager()
+        monkeypatch.setattr(ws_routes, "_manager", manager)
+        monkeypatch.setattr(ws_routes, "_slots", asyncio.Semaphore(0))
+        ws = ScriptedWebSocket([])
+
+        await ws_routes._serve(ws, ("requests",), binary=False)
+
+        assert ws.close_code == 1013
+        assert manager.connection_count == 0
+
+    async def test_slot_released_after_close(self, monkeypatch):
+        """Should give the slot back when the client disconnects."""
+        monkeypatch.setattr(ws_routes, "_manager", ConnectionManager())
+        slots = asyncio.Semaphore(1)
+        monkeypatch.setattr(ws_routes, "_slots", slots)
+        ws = ScriptedWebSocket([{"type": "websocket.disconnect", "code": 1000}])
+
+        await ws_routes._serve(ws, ("requests",), binary=False)
+
+        assert not slots.locked()
@@ -7,6 +7,7 @@ export type WebSocketEventType =
   | "request.error"
   | "provider.health"
   | "stats.update"
+  | "batch"
   | "connected"
   | "ping"
   | "pong";
@@ -17,6 +18,10 @@ export interface WebSocketMessage<T = unknown> {
   timestamp: string;
 }
 
+export interface BatchData {
+  events: WebSocketMessage[];
+}
+
 export interface RequestStartedData {
   request_id: string;
   provider: string;
@@ -143,9 +148,16 @@ export function useWebSocket(
     ws.onmessage = (event) => {
       try {
         const message = JSON.parse(event.data) as WebSocketMessage;
+        // Coalesced events arrive as one "batch" frame; deliver them individually
+        const messages =
+          message.type === "batch"
+            ? (message.data as BatchData).events
+            : [message];
         if (mountedRef.current) {
-          setLastMessage(message);
-          onMessage?.(message);
+          for (const m of messages) {
+            setLastMessage(m);
+            onMessage?.(m);
+          }
         }
       } catch (error) {
         console.error("Failed to parse WebSocket message:", error);